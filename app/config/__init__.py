@@ -8,34 +8,45 @@ from dotenv import load_dotenv
 # Load environment variables from .env file
 load_dotenv()
 
+# Snapshot taken once after .env is applied; every setting below reads from it
+_ENV = os.environ.copy()
+
+
+def _as_bool(value):
+    return value.lower() == "true"
+
+
+def _env(key, default, cast=str):
+    """Return ``cast(value)`` for ``key``, falling back to ``default``."""
+    return cast(_ENV.get(key, default))
+
+
 # Database Configuration
 DB_CONFIG = {
-    "host": os.getenv("DB_HOST", "localhost"),
-    "user": os.getenv("DB_USER", "root"),
-    "password": os.getenv("DB_PASSWORD", ""),
-    "database": os.getenv("DB_NAME", "bigbrewpos"),
-    "port": int(os.getenv("DB_PORT", "3306")),
+    "host": _env("DB_HOST", "localhost"),
+    "user": _env("DB_USER", "root"),
+    "password": _env("DB_PASSWORD", ""),
+    "database": _env("DB_NAME", "bigbrewpos"),
+    "port": _env("DB_PORT", "3306", int),
 }
 
 # Email Configuration
 EMAIL_CONFIG = {
-    "smtp_server": os.getenv("SMTP_SERVER", "smtp.gmail.com"),
-    "smtp_port": int(os.getenv("SMTP_PORT", "587")),
-    "email_address": os.getenv("EMAIL_ADDRESS", ""),
-    "email_password": os.getenv("EMAIL_PASSWORD", ""),
+    "smtp_server": _env("SMTP_SERVER", "smtp.gmail.com"),
+    "smtp_port": _env("SMTP_PORT", "587", int),
+    "email_address": _env("EMAIL_ADDRESS", ""),
+    "email_password": _env("EMAIL_PASSWORD", ""),
 }
 
 # System Configuration
 SYSTEM_CONFIG = {
-    "otp_expiry_minutes": int(os.getenv("OTP_EXPIRY_MINUTES", "10")),
-    "max_login_attempts": int(os.getenv("MAX_LOGIN_ATTEMPTS", "3")),
-    "session_timeout_minutes": int(os.getenv("SESSION_TIMEOUT_MINUTES", "30")),
+    "otp_expiry_minutes": _env("OTP_EXPIRY_MINUTES", "10", int),
+    "max_login_attempts": _env("MAX_LOGIN_ATTEMPTS", "3", int),
+    "session_timeout_minutes": _env("SESSION_TIMEOUT_MINUTES", "30", int),
 }
 
 # Application Configuration
 APP_CONFIG = {
-    "debug": os.getenv("APP_DEBUG", "True").lower() == "true",
-    "secret_key": os.getenv("APP_SECRET_KEY", "default-secret-key-change-in-production"),
+    "debug": _env("APP_DEBUG", "True", _as_bool),
+    "secret_key": _env("APP_SECRET_KEY", "default-secret-key-change-in-production"),
 }
-
-
@@ -3,40 +3,147 @@ Database connection utilities.
 """
 
 import logging
-import mysql.connector
-from mysql.connector import Error
+import threading
+import time
+import weakref
+
+from mysql.connector import Error, pooling
 
 from app.config import DB_CONFIG
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+POOL_NAME = "bigbrew"
+POOL_SIZE = 8
+# Separate pool for the fixed login/profile statements below: sessions are not
+# reset on checkout, so server-side prepared statements survive between calls
+PREPARED_POOL_NAME = "bigbrew_prepared"
+PREPARED_POOL_SIZE = 4
+# Seconds a user/customer row fetched by login name stays reusable
+ACCOUNT_CACHE_TTL = 5.0
+
+# Pools are process-wide: every DatabaseConfig shares them, so creating another
+# instance never opens another set of server connections
+_POOLS = {}
+_POOLS_LOCK = threading.Lock()
+
+
+# Fixed statements run through execute_prepared. Kept as str: the prepared cursor
+# only skips re-preparing when it is handed the very object it ran last, and the
+# driver turns bytes SQL into a new str on every call
+_CUSTOMER_SELECT = """
+    SELECT customer_id, customer_code, username, email, password_hash, customer_type,
+           first_name, last_name, is_active, is_verified, email_verified,
+           loyalty_points, total_spent
+    FROM customers
+"""
+_Q_GET_USER = """
+    SELECT user_id, username, email, password_hash, user_type,
+           first_name, last_name, is_active, last_login
+    FROM users
+    WHERE username = %s
+"""
+_Q_TOUCH_USER = "UPDATE users SET last_login = CURRENT_TIMESTAMP WHERE user_id = %s"
+_Q_TOUCH_USER_REHASH = (
+    "UPDATE users SET last_login = CURRENT_TIMESTAMP, password_hash = %s, "
+    "updated_at = CURRENT_TIMESTAMP WHERE user_id = %s"
+)
+_Q_SET_USER_HASH = (
+    "UPDATE users SET password_hash = %s, updated_at = CURRENT_TIMESTAMP "
+    "WHERE user_id = %s"
+)
+_Q_GET_CUSTOMER_BY_USERNAME = _CUSTOMER_SELECT + "WHERE username = %s"
+_Q_GET_CUSTOMER_BY_EMAIL = _CUSTOMER_SELECT + "WHERE email = %s"
+_Q_GET_CUSTOMER_BY_LOGIN = _CUSTOMER_SELECT + """
+    WHERE username = %s OR email = %s
+    ORDER BY username = %s DESC
+    LIMIT 1
+"""
+_Q_TOUCH_CUSTOMER = "UPDATE customers SET last_order_date = CURRENT_TIMESTAMP WHERE customer_id = %s"
+_Q_TOUCH_CUSTOMER_REHASH = (
+    "UPDATE customers SET last_order_date = CURRENT_TIMESTAMP, password_hash = %s, "
+    "updated_at = CURRENT_TIMESTAMP WHERE customer_id = %s"
+)
+_Q_SET_CUSTOMER_HASH = (
+    "UPDATE customers SET password_hash = %s, updated_at = CURRENT_TIMESTAMP "
+    "WHERE customer_id = %s"
+)
+
 
 class DatabaseConfig:
     """
     Wrapper that handles creation of MySQL connections and common helpers.
     """
 
+    __slots__ = (
+        "host",
+        "port",
+        "database",
+        "user",
+        "password",
+        "_prepared",
+        "_user_cache",
+        "_customer_cache",
+        "_cache_lock",
+    )
+
     def __init__(self):
         self.host = DB_CONFIG["host"]
         self.port = DB_CONFIG["port"]
         self.database = DB_CONFIG["database"]
         self.user = DB_CONFIG["user"]
         self.password = DB_CONFIG["password"]
+        # raw connection -> {query: prepared cursor}; entries die with the connection
+        self._prepared = weakref.WeakKeyDictionary()
+        # key -> (fetched_at, row); invalidated on every write to that account
+        self._user_cache = {}
+        self._customer_cache = {}
+        self._cache_lock = threading.RLock()
+
+    def _shared_pool(self, name, size, **options):
+        """
+        Return the process-wide pool called ``name``, creating it on first use.
+
+        Created lazily so importing this module never touches the server; the
+        lock keeps two threads from both building the same pool.
+        """
+        pool = _POOLS.get(name)
+        if pool is None:
+            with _POOLS_LOCK:
+                pool = _POOLS.get(name)
+                if pool is None:
+                    pool = _POOLS[name] = pooling.MySQLConnectionPool(
+                        pool_name=name,
+                        pool_size=size,
+                        host=self.host,
+                        port=self.port,
+                        database=self.database,
+                        user=self.user,
+                        password=self.password,
+                        **options,
+                    )
+                    logger.debug("Created MySQL connection pool %s (size %d)", name, size)
+        return pool
+
+    def _get_pool(self):
+        """Return the shared connection pool."""
+        return self._shared_pool(POOL_NAME, POOL_SIZE, autocommit=False)
+
+    def _get_prepared_pool(self):
+        """Return the pool backing execute_prepared."""
+        return self._shared_pool(
+            PREPARED_POOL_NAME, PREPARED_POOL_SIZE, pool_reset_session=False, autocommit=True
+        )
 
     def get_connection(self):
-        """Create and return a MySQL database connection."""
+        """
+        Check out a MySQL connection from the shared pool.
+
+        Calling ``close()`` on the returned connection hands it back to the pool.
+        """
         try:
-            connection = mysql.connector.connect(
-                host=self.host,
-                port=self.port,
-                database=self.database,
-                user=self.user,
-                password=self.password,
-            )
-            if connection.is_connected():
-                logger.info("Successfully connected to MySQL database")
-                return connection
+            return self._get_pool().get_connection()
         except Error as exc:
             logger.error("Error connecting to MySQL: %s", exc)
         return None
@@ -44,10 +151,16 @@ class DatabaseConfig:
     def test_connection(self):
         """Test database connection."""
         connection = self.get_connection()
-        if connection:
-            connection.close()
+        if not connection:
+            return False
+        try:
+            connection.ping(reconnect=True)
             return True
-        return False
+        except Error as exc:
+            logger.error("Error connecting to MySQL: %s", exc)
+            return False
+        finally:
+            connection.close()
 
     def execute_query(self, query, params=None, fetch=False):
         """
@@ -55,8 +168,11 @@ class DatabaseConfig:
 
         :param query: SQL statement to execute.
         :param params: Optional query parameters.
-        :param fetch: When True, return fetched rows.
+        :param fetch: When True, return fetched rows (see ``execute_all``).
         """
+        if fetch:
+            return self.execute_all(query, params)
+
         connection = None
         cursor = None
         try:
@@ -64,16 +180,13 @@ class DatabaseConfig:
             if not connection:
                 return None
 
-            cursor = connection.cursor(dictionary=True)
+            cursor = connection.cursor()
 
             if params:
                 cursor.execute(query, params)
             else:
                 cursor.execute(query)
 
-            if fetch:
-                return cursor.fetchall()
-
             connection.commit()
             return cursor.rowcount
 
@@ -86,72 +199,255 @@ class DatabaseConfig:
         finally:
             if cursor:
                 cursor.close()
-            if connection and connection.is_connected():
+            if connection:
+                connection.close()
+
+    def execute_one(self, query, params=None):
+        """Run a SELECT and return its first row as a dict, or None."""
+        connection = None
+        cursor = None
+        try:
+            connection = self.get_connection()
+            if not connection:
+                return None
+
+            cursor = connection.cursor(dictionary=True, buffered=True)
+
+            if params:
+                cursor.execute(query, params)
+            else:
+                cursor.execute(query)
+
+            return cursor.fetchone()
+
+        except Error as exc:
+            logger.error("Database error: %s", exc)
+            return None
+
+        finally:
+            if cursor:
+                cursor.close()
+            if connection:
                 connection.close()
 
+    def execute_all(self, query, params=None):
+        """Run a SELECT and return every row as a list of dicts (None on error)."""
+        connection = None
+        cursor = None
+        try:
+            connection = self.get_connection()
+            if not connection:
+                return None
+
+            cursor = connection.cursor(dictionary=True)
+
+            if params:
+                cursor.execute(query, params)
+            else:
+                cursor.execute(query)
+
+            return cursor.fetchall()
+
+        except Error as exc:
+            logger.error("Database error: %s", exc)
+            return None
+
+        finally:
+            if cursor:
+                cursor.close()
+            if connection:
+                connection.close()
+
+    def stream(self, query, params=None):
+        """
+        Yield rows of a SELECT one at a time from an unbuffered cursor.
+
+        Nothing is materialized on the client, so large report queries stay
+        flat in memory. The connection is held until the generator is
+        exhausted or closed.
+        """
+        connection = self.get_connection()
+        if not connection:
+            return
+        cursor = None
+        try:
+            cursor = connection.cursor(dictionary=True, buffered=False)
+
+            if params:
+                cursor.execute(query, params)
+            else:
+                cursor.execute(query)
+
+            yield from cursor
+
+        except Error as exc:
+            logger.error("Database error: %s", exc)
+
+        finally:
+            if cursor:
+                # Drain anything left unread if the caller stopped early
+                connection.consume_results()
+                cursor.close()
+            connection.close()
+
+    def _prepared_cursor(self, connection, query):
+        """Return the cached prepared cursor for ``query`` on this connection."""
+        raw = getattr(connection, "_cnx", connection)
+        cursors = self._prepared.get(raw)
+        if cursors is None:
+            cursors = self._prepared[raw] = {}
+        cursor = cursors.get(query)
+        if cursor is None:
+            cursor = cursors[query] = connection.cursor(prepared=True)
+        return cursor
+
+    def execute_prepared(self, query, params, fetch=False):
+        """
+        Execute one of the fixed single-statement queries as a prepared statement.
+
+        The statement is parsed once per pooled connection; later calls only
+        send parameters. Runs in autocommit mode, so it must not be used for
+        multi-statement transactions. Rows are returned as dicts, like
+        ``execute_query``.
+
+        If the server has dropped the statement (e.g. the pool reconnected
+        after ``wait_timeout`` or a restart), the cached handles for that
+        connection are discarded and the statement is prepared again on a
+        fresh checkout; only a second failure returns None.
+        """
+        for attempt in range(2):
+            connection = None
+            try:
+                connection = self._get_prepared_pool().get_connection()
+                cursor = self._prepared_cursor(connection, query)
+                cursor.execute(query, params)
+
+                if fetch:
+                    columns = cursor.column_names
+                    return [dict(zip(columns, row)) for row in cursor.fetchall()]
+                return cursor.rowcount
+
+            except Error as exc:
+                if connection is not None:
+                    # Statement handles may be gone (e.g. after a reconnect)
+                    self._prepared.pop(getattr(connection, "_cnx", connection), None)
+                if attempt:
+                    logger.error("Database error: %s", exc)
+                    return None
+                logger.warning("Prepared statement failed, preparing it again: %s", exc)
+
+            finally:
+                if connection:
+                    connection.close()
+
+    def _cached_row(self, cache, key):
+        """Return a copy of a fresh cached row, or None."""
+        with self._cache_lock:
+            entry = cache.get(key)
+        if entry is None or time.monotonic() - entry[0] >= ACCOUNT_CACHE_TTL:
+            return None
+        return dict(entry[1])
+
+    def _cache_row(self, cache, key, row):
+        """Remember ``row`` under ``key`` and hand the caller its own copy."""
+        if not row:
+            return None
+        with self._cache_lock:
+            cache[key] = (time.monotonic(), row)
+        return dict(row)
+
+    def _invalidate(self, cache, id_field, row_id):
+        """Drop every cached row belonging to ``row_id``."""
+        with self._cache_lock:
+            stale = [key for key, (_, row) in cache.items() if row.get(id_field) == row_id]
+            for key in stale:
+                del cache[key]
+
     def get_user_by_username(self, username):
         """Get user information by username."""
-        query = """
-        SELECT user_id, username, email, password_hash, user_type,
-               first_name, last_name, is_active, last_login
-        FROM users
-        WHERE username = %s
+        row = self._cached_row(self._user_cache, username)
+        if row is not None:
+            return row
+        result = self.execute_prepared(_Q_GET_USER, (username,), fetch=True)
+        return self._cache_row(self._user_cache, username, result[0] if result else None)
+
+    def update_last_login(self, user_id, password_hash=None):
         """
-        result = self.execute_query(query, (username,), fetch=True)
-        return result[0] if result else None
+        Update last_login timestamp for user.
 
-    def update_last_login(self, user_id):
-        """Update last_login timestamp for user."""
-        query = "UPDATE users SET last_login = CURRENT_TIMESTAMP WHERE user_id = %s"
-        return self.execute_query(query, (user_id,))
+        When ``password_hash`` is given (legacy hash upgraded at login) it is
+        written in the same statement, so a login costs one round-trip.
+        """
+        self._invalidate(self._user_cache, "user_id", user_id)
+        if password_hash is None:
+            return self.execute_prepared(_Q_TOUCH_USER, (user_id,))
+        return self.execute_prepared(_Q_TOUCH_USER_REHASH, (password_hash, user_id))
 
     def update_password_hash(self, user_id, password_hash):
         """Persist a new bcrypt password hash for the given user."""
-        query = (
-            "UPDATE users SET password_hash = %s, updated_at = CURRENT_TIMESTAMP "
-            "WHERE user_id = %s"
+        self._invalidate(self._user_cache, "user_id", user_id)
+        return self.execute_prepared(_Q_SET_USER_HASH, (password_hash, user_id))
+
+    def forget_user(self, user_id):
+        """Drop cached login rows for a user changed outside these helpers."""
+        self._invalidate(self._user_cache, "user_id", user_id)
+
+    def set_user_active(self, user_id, is_active):
+        """Activate or deactivate a staff account."""
+        self._invalidate(self._user_cache, "user_id", user_id)
+        return self.execute_query(
+            "UPDATE users SET is_active = %s WHERE user_id = %s",
+            (1 if is_active else 0, user_id),
         )
-        return self.execute_query(query, (password_hash, user_id))
 
     def get_customer_by_username(self, username):
         """Get customer information by username."""
-        query = """
-        SELECT customer_id, customer_code, username, email, password_hash, customer_type,
-               first_name, last_name, is_active, is_verified, email_verified,
-               loyalty_points, total_spent
-        FROM customers
-        WHERE username = %s
-        """
-        result = self.execute_query(query, (username,), fetch=True)
-        return result[0] if result else None
+        key = ("username", username)
+        row = self._cached_row(self._customer_cache, key)
+        if row is not None:
+            return row
+        result = self.execute_prepared(_Q_GET_CUSTOMER_BY_USERNAME, (username,), fetch=True)
+        return self._cache_row(self._customer_cache, key, result[0] if result else None)
 
     def get_customer_by_email(self, email):
         """Get customer information by email."""
-        query = """
-        SELECT customer_id, customer_code, username, email, password_hash, customer_type,
-               first_name, last_name, is_active, is_verified, email_verified,
-               loyalty_points, total_spent
-        FROM customers
-        WHERE email = %s
+        key = ("email", email)
+        row = self._cached_row(self._customer_cache, key)
+        if row is not None:
+            return row
+        result = self.execute_prepared(_Q_GET_CUSTOMER_BY_EMAIL, (email,), fetch=True)
+        return self._cache_row(self._customer_cache, key, result[0] if result else None)
+
+    def get_customer_by_login(self, identifier):
+        """Get a customer by username, falling back to email, in one query."""
+        key = ("login", identifier)
+        row = self._cached_row(self._customer_cache, key)
+        if row is not None:
+            return row
+        result = self.execute_prepared(
+            _Q_GET_CUSTOMER_BY_LOGIN, (identifier, identifier, identifier), fetch=True
+        )
+        return self._cache_row(self._customer_cache, key, result[0] if result else None)
+
+    def update_customer_last_login(self, customer_id, password_hash=None):
         """
-        result = self.execute_query(query, (email,), fetch=True)
-        return result[0] if result else None
+        Update last_order_date timestamp for customer (using as last login).
 
-    def update_customer_last_login(self, customer_id):
-        """Update last_order_date timestamp for customer (using as last login)."""
-        query = "UPDATE customers SET last_order_date = CURRENT_TIMESTAMP WHERE customer_id = %s"
-        return self.execute_query(query, (customer_id,))
+        Optionally writes an upgraded ``password_hash`` in the same statement.
+        """
+        self._invalidate(self._customer_cache, "customer_id", customer_id)
+        if password_hash is None:
+            return self.execute_prepared(_Q_TOUCH_CUSTOMER, (customer_id,))
+        return self.execute_prepared(_Q_TOUCH_CUSTOMER_REHASH, (password_hash, customer_id))
 
     def update_customer_password_hash(self, customer_id, password_hash):
         """Persist a new bcrypt password hash for the given customer."""
-        query = (
-            "UPDATE customers SET password_hash = %s, updated_at = CURRENT_TIMESTAMP "
-            "WHERE customer_id = %s"
-        )
-        return self.execute_query(query, (password_hash, customer_id))
+        self._invalidate(self._customer_cache, "customer_id", customer_id)
+        return self.execute_prepared(_Q_SET_CUSTOMER_HASH, (password_hash, customer_id))
 
     def update_customer_profile(self, customer_id, first_name, last_name, email, phone=None, address=None):
         """Update editable customer profile fields."""
+        self._invalidate(self._customer_cache, "customer_id", customer_id)
         query = (
             "UPDATE customers SET first_name=%s, last_name=%s, email=%s, phone=%s, address=%s, "
             "updated_at = CURRENT_TIMESTAMP WHERE customer_id=%s"
@@ -174,7 +470,7 @@ class DatabaseConfig:
         WHERE s.customer_id = %s
         ORDER BY s.sale_date DESC
         """
-        return self.execute_query(query, (customer_id,), fetch=True)
+        return self.execute_all(query, (customer_id,))
 
     def fetch_sale_items(self, sale_id):
         """Fetch sale items for a given sale."""
@@ -189,7 +485,7 @@ class DatabaseConfig:
         WHERE si.sale_id = %s
         ORDER BY si.sale_item_id
         """
-        return self.execute_query(query, (sale_id,), fetch=True)
+        return self.execute_all(query, (sale_id,))
 
 
 # Global database instance
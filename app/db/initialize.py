@@ -6,8 +6,10 @@ Combines table definitions and seed data into a single, maintainable script.
 
 from __future__ import annotations
 
+import hashlib
+import re
 import sys
-from typing import Callable, Iterable, Tuple
+from typing import Dict, Optional, Tuple
 
 import bcrypt
 import mysql.connector
@@ -17,37 +19,72 @@ from mysql.connector.cursor import MySQLCursor
 from app.config import DB_CONFIG
 from pathlib import Path
 
+# Built once at import; every connection the initializer opens uses it as-is
 SERVER_CONFIG = {
     "host": DB_CONFIG["host"],
     "port": DB_CONFIG["port"],
     "user": DB_CONFIG["user"],
     "password": DB_CONFIG["password"],
+    # DDL commits implicitly; the seed DML then runs as one transaction
+    "autocommit": False,
+    # Use the C extension bundled with mysql-connector-python wheels; the
+    # connector quietly falls back to the pure-Python protocol if it is missing
+    "use_pure": False,
 }
 
 DATABASE_NAME = DB_CONFIG["database"]
 
+# Identifiers cannot be bound as parameters, so the name is checked once here
+# before being spliced into DDL.
+DATABASE_NAME_IS_VALID = re.fullmatch(r"[A-Za-z0-9_]+", DATABASE_NAME) is not None
+CREATE_DATABASE_SQL = (
+    f"CREATE DATABASE IF NOT EXISTS `{DATABASE_NAME}` "
+    "CHARACTER SET utf8mb4 COLLATE utf8mb4_unicode_ci"
+)
+
+# Progress lines are collected and written with a single stdout write per run;
+# line-by-line console output is slow, notably on Windows terminals.
+_status_lines: list = []
+
+
+def report(line: str):
+    _status_lines.append(line)
+
+
+def flush_report():
+    if _status_lines:
+        sys.stdout.write("\n".join(_status_lines) + "\n")
+        sys.stdout.flush()
+        _status_lines.clear()
+
+
 CategorySeed = Tuple[int, str, str, str]
 ProductSeed = Tuple[str, str, str, str, float, float]
 CustomerSeed = Tuple[str, str, str, str, str, str, str, str]
+TableColumns = Dict[str, Dict[str, str]]
 
 
-def table_has_column(cursor: MySQLCursor, table_name: str, column_name: str) -> bool:
-    """Check if a given column exists on a table."""
+def load_columns(cursor: MySQLCursor) -> TableColumns:
+    """Snapshot every column of the database as {table: {column: COLUMN_KEY}} in one query."""
     cursor.execute(
         """
-        SELECT 1
+        SELECT TABLE_NAME, COLUMN_NAME, COLUMN_KEY
         FROM information_schema.COLUMNS
-        WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s AND COLUMN_NAME = %s
+        WHERE TABLE_SCHEMA = %s
         """,
-        (DATABASE_NAME, table_name, column_name),
+        (DATABASE_NAME,),
     )
-    return cursor.fetchone() is not None
+    columns: TableColumns = {}
+    for table_name, column_name, column_key in cursor.fetchall():
+        columns.setdefault(table_name, {})[column_name] = column_key
+    return columns
 
 
-def first_existing_column(cursor: MySQLCursor, table_name: str, *candidates: str) -> str:
+def first_existing_column(columns: TableColumns, table_name: str, *candidates: str) -> str:
     """Return the first column name that exists on the table from the provided candidates."""
+    existing = columns.get(table_name, {})
     for column in candidates:
-        if table_has_column(cursor, table_name, column):
+        if column in existing:
             return column
     raise RuntimeError(f"No matching columns found on {table_name} for candidates {candidates}")
 
@@ -57,613 +94,304 @@ def connect_to_server():
     try:
         return mysql.connector.connect(**SERVER_CONFIG)
     except Error as exc:
-        print(f"[ERROR] Unable to connect to MySQL server: {exc}")
+        report(f"[ERROR] Unable to connect to MySQL server: {exc}")
         return None
 
 
-def connect_to_database():
-    """Connect directly to the BigBrew database."""
-    try:
-        return mysql.connector.connect(**DB_CONFIG)
-    except Error as exc:
-        print(f"[ERROR] Unable to connect to database '{DATABASE_NAME}': {exc}")
-        return None
+def close_quietly(*handles):
+    """Close cursors and connections without a ping first; close() is safe to repeat."""
+    for handle in handles:
+        if handle is None:
+            continue
+        try:
+            handle.close()
+        except Error:
+            pass
 
 
 def ensure_database():
-    """Create the database if it does not already exist."""
+    """Create the database if needed and return a connection already switched into it."""
+    if not DATABASE_NAME_IS_VALID:
+        report(f"[ERROR] Invalid database name '{DATABASE_NAME}'. Use letters, digits and underscores only.")
+        return None
+
     connection = connect_to_server()
     if not connection:
-        return False
-    
+        return None
+
+    cursor = None
     try:
         cursor = connection.cursor()
-        cursor.execute(
-            f"CREATE DATABASE IF NOT EXISTS {DATABASE_NAME} "
-            "CHARACTER SET utf8mb4 COLLATE utf8mb4_unicode_ci"
-        )
-        print(f"[OK] Database '{DATABASE_NAME}' is ready.")
-        return True
+        cursor.execute(CREATE_DATABASE_SQL)
+        connection.cmd_init_db(DATABASE_NAME)
     except Error as exc:
-        print(f"[ERROR] Unable to create database '{DATABASE_NAME}': {exc}")
-        return False
-    finally:
-        if connection.is_connected():
-            cursor.close()
-            connection.close()
+        report(f"[ERROR] Unable to create database '{DATABASE_NAME}': {exc}")
+        close_quietly(cursor, connection)
+        return None
 
+    close_quietly(cursor)
+    report(f"[OK] Database '{DATABASE_NAME}' is ready.")
+    return connection
 
-def create_categories_table(cursor: MySQLCursor):
-    cursor.execute(
-        """
-    CREATE TABLE IF NOT EXISTS categories (
-            category_id INT AUTO_INCREMENT PRIMARY KEY,
-            legacy_category_id INT UNIQUE,
-        name VARCHAR(100) NOT NULL,
-        category_name VARCHAR(100) NOT NULL,
-        description TEXT
+
+_DDL_CATEGORIES = """
+    CREATE TABLE IF NOT EXISTS `categories` (
+            `category_id` INT AUTO_INCREMENT PRIMARY KEY,
+            `legacy_category_id` INT UNIQUE,
+        `name` VARCHAR(100) NOT NULL,
+        `category_name` VARCHAR(100) NOT NULL,
+        `description` TEXT
     ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
     """
-    )
-    # Handle legacy schemas where the columns were previously named `id` and `category_id`
-    try:
-        # If the secondary identifier column hasn't been renamed yet, rename it first
-        cursor.execute(
-            """
-            SELECT COLUMN_NAME
-            FROM information_schema.COLUMNS
-            WHERE TABLE_SCHEMA = %s AND TABLE_NAME = 'categories' AND COLUMN_NAME = 'legacy_category_id'
-            """,
-            (DATABASE_NAME,),
-        )
-        has_legacy_column = cursor.fetchone() is not None
-        if not has_legacy_column:
-            cursor.execute(
-                """
-                SELECT COLUMN_NAME
-                FROM information_schema.COLUMNS
-                WHERE TABLE_SCHEMA = %s AND TABLE_NAME = 'categories' AND COLUMN_NAME = 'category_id' AND COLUMN_KEY <> 'PRI'
-                """,
-                (DATABASE_NAME,),
-            )
-            has_old_unique_column = cursor.fetchone() is not None
-            if has_old_unique_column:
-                cursor.execute(
-                    """
-                    ALTER TABLE categories
-                    CHANGE COLUMN category_id legacy_category_id INT UNIQUE
-                    """
-                )
-
-        cursor.execute(
-            """
-            SELECT COLUMN_NAME
-            FROM information_schema.COLUMNS
-            WHERE TABLE_SCHEMA = %s AND TABLE_NAME = 'categories' AND COLUMN_NAME = 'id'
-            """,
-            (DATABASE_NAME,),
-        )
-        has_legacy_id = cursor.fetchone() is not None
-        if has_legacy_id:
-            cursor.execute(
-                """
-                ALTER TABLE categories
-                CHANGE COLUMN id category_id INT AUTO_INCREMENT PRIMARY KEY
-                """
-            )
-    except Error:
-        pass
-
-    print("[OK] categories table")
 
-
-def create_customers_table(cursor: MySQLCursor):
-    cursor.execute(
-        """
-        CREATE TABLE IF NOT EXISTS customers (
-            customer_id INT AUTO_INCREMENT PRIMARY KEY,
-            customer_code VARCHAR(32) NOT NULL UNIQUE,
-            username VARCHAR(50) NOT NULL UNIQUE,
-            email VARCHAR(100) NOT NULL UNIQUE,
-            password_hash VARCHAR(255) NOT NULL,
-            first_name VARCHAR(100),
-            last_name VARCHAR(100),
-            customer_type ENUM('regular', 'vip', 'student') NOT NULL DEFAULT 'regular',
-            phone VARCHAR(20),
-            address TEXT,
-            is_active TINYINT(1) NOT NULL DEFAULT 1,
-            is_verified TINYINT(1) NOT NULL DEFAULT 0,
-            email_verified TINYINT(1) NOT NULL DEFAULT 0,
-            loyalty_points INT NOT NULL DEFAULT 0,
-            total_spent DECIMAL(12,2) NOT NULL DEFAULT 0,
-            last_order_date TIMESTAMP NULL DEFAULT NULL,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+_DDL_CUSTOMERS = """
+        CREATE TABLE IF NOT EXISTS `customers` (
+            `customer_id` INT AUTO_INCREMENT PRIMARY KEY,
+            `customer_code` VARCHAR(32) NOT NULL UNIQUE,
+            `username` VARCHAR(50) NOT NULL UNIQUE,
+            `email` VARCHAR(100) NOT NULL UNIQUE,
+            `password_hash` VARCHAR(255) NOT NULL,
+            `first_name` VARCHAR(100),
+            `last_name` VARCHAR(100),
+            `customer_type` ENUM('regular', 'vip', 'student') NOT NULL DEFAULT 'regular',
+            `phone` VARCHAR(20),
+            `address` TEXT,
+            `is_active` TINYINT(1) NOT NULL DEFAULT 1,
+            `is_verified` TINYINT(1) NOT NULL DEFAULT 0,
+            `email_verified` TINYINT(1) NOT NULL DEFAULT 0,
+            `loyalty_points` INT NOT NULL DEFAULT 0,
+            `total_spent` DECIMAL(12,2) NOT NULL DEFAULT 0,
+            `last_order_date` TIMESTAMP NULL DEFAULT NULL,
+            `created_at` TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            `updated_at` TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
         ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
         """
-    )
-    cursor.execute(
-        "ALTER TABLE customers ADD COLUMN IF NOT EXISTS loyalty_points INT NOT NULL DEFAULT 0"
-    )
-    cursor.execute(
-        "ALTER TABLE customers ADD COLUMN IF NOT EXISTS total_spent DECIMAL(12,2) NOT NULL DEFAULT 0"
-    )
-    cursor.execute(
-        "ALTER TABLE customers ADD COLUMN IF NOT EXISTS last_order_date TIMESTAMP NULL DEFAULT NULL"
-    )
-    print("[OK] customers table")
-
 
-def create_users_table(cursor: MySQLCursor):
-    cursor.execute(
-        """
-        CREATE TABLE IF NOT EXISTS users (
-            user_id INT AUTO_INCREMENT PRIMARY KEY,
-            username VARCHAR(50) NOT NULL UNIQUE,
-            email VARCHAR(100) NOT NULL UNIQUE,
-            password_hash VARCHAR(255) NOT NULL,
-            user_type ENUM('admin', 'staff', 'inventory_manager') NOT NULL DEFAULT 'staff',
-            first_name VARCHAR(100),
-            last_name VARCHAR(100),
-            is_active TINYINT(1) NOT NULL DEFAULT 1,
-            last_login TIMESTAMP NULL DEFAULT NULL,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+_DDL_USERS = """
+        CREATE TABLE IF NOT EXISTS `users` (
+            `user_id` INT AUTO_INCREMENT PRIMARY KEY,
+            `username` VARCHAR(50) NOT NULL UNIQUE,
+            `email` VARCHAR(100) NOT NULL UNIQUE,
+            `password_hash` VARCHAR(255) NOT NULL,
+            `user_type` ENUM('admin', 'staff', 'inventory_manager') NOT NULL DEFAULT 'staff',
+            `first_name` VARCHAR(100),
+            `last_name` VARCHAR(100),
+            `is_active` TINYINT(1) NOT NULL DEFAULT 1,
+            `last_login` TIMESTAMP NULL DEFAULT NULL,
+            `created_at` TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            `updated_at` TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
         ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
         """
-    )
-    # Align legacy schema where the primary key column might still be named 'id'
-    try:
-        cursor.execute(
-            """
-            SELECT COLUMN_NAME
-            FROM information_schema.COLUMNS
-            WHERE TABLE_SCHEMA = %s AND TABLE_NAME = 'users' AND COLUMN_NAME = 'user_id'
-            """,
-            (DATABASE_NAME,),
-        )
-        has_user_id = cursor.fetchone() is not None
-        if not has_user_id:
-            cursor.execute(
-                """
-                ALTER TABLE users
-                CHANGE COLUMN id user_id INT AUTO_INCREMENT PRIMARY KEY
-                """
-            )
-    except Error:
-        pass
-    print("[OK] users table")
 
-
-def create_products_table(cursor: MySQLCursor):
-    cursor.execute(
-        """
-    CREATE TABLE IF NOT EXISTS products (
-            product_id INT AUTO_INCREMENT PRIMARY KEY,
-            legacy_product_id INT UNIQUE,
-        category_id INT,
-        product_code VARCHAR(50),
-        product_name VARCHAR(100) NOT NULL,
-        description TEXT,
-        price DECIMAL(10,2) DEFAULT 0,
-        price_regular DECIMAL(10,2) DEFAULT 0,
-        price_large DECIMAL(10,2) DEFAULT 0,
-        image_path VARCHAR(255),
-        image_blob LONGBLOB,
-            FOREIGN KEY (category_id) REFERENCES categories(category_id) ON DELETE SET NULL
+_DDL_PRODUCTS = """
+    CREATE TABLE IF NOT EXISTS `products` (
+            `product_id` INT AUTO_INCREMENT PRIMARY KEY,
+            `legacy_product_id` INT UNIQUE,
+        `category_id` INT,
+        `product_code` VARCHAR(50),
+        `product_name` VARCHAR(100) NOT NULL,
+        `description` TEXT,
+        `price` DECIMAL(10,2) DEFAULT 0,
+        `price_regular` DECIMAL(10,2) DEFAULT 0,
+        `price_large` DECIMAL(10,2) DEFAULT 0,
+        `image_path` VARCHAR(255),
+        `image_blob` LONGBLOB,
+            FOREIGN KEY (`category_id`) REFERENCES `categories`(`category_id`) ON DELETE SET NULL
     ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
     """
-    )
-    try:
-        # Rename legacy secondary identifier first
-        cursor.execute(
-            """
-            SELECT COLUMN_NAME
-            FROM information_schema.COLUMNS
-            WHERE TABLE_SCHEMA = %s AND TABLE_NAME = 'products' AND COLUMN_NAME = 'legacy_product_id'
-            """,
-            (DATABASE_NAME,),
-        )
-        has_legacy_column = cursor.fetchone() is not None
-        if not has_legacy_column:
-            cursor.execute(
-                """
-                SELECT COLUMN_NAME
-                FROM information_schema.COLUMNS
-                WHERE TABLE_SCHEMA = %s AND TABLE_NAME = 'products' AND COLUMN_NAME = 'product_id' AND COLUMN_KEY <> 'PRI'
-                """,
-                (DATABASE_NAME,),
-            )
-            has_old_unique_column = cursor.fetchone() is not None
-            if has_old_unique_column:
-                cursor.execute(
-                    """
-                    ALTER TABLE products
-                    CHANGE COLUMN product_id legacy_product_id INT UNIQUE
-                    """
-                )
-
-        cursor.execute(
-            """
-            SELECT COLUMN_NAME
-            FROM information_schema.COLUMNS
-            WHERE TABLE_SCHEMA = %s AND TABLE_NAME = 'products' AND COLUMN_NAME = 'id'
-            """,
-            (DATABASE_NAME,),
-        )
-        has_legacy_id = cursor.fetchone() is not None
-        if has_legacy_id:
-            cursor.execute(
-                """
-                ALTER TABLE products
-                CHANGE COLUMN id product_id INT AUTO_INCREMENT PRIMARY KEY
-                """
-            )
-        cursor.execute(
-            "ALTER TABLE products ADD COLUMN IF NOT EXISTS image_blob LONGBLOB"
-        )
-        try:
-            cursor.execute(
-                "ALTER TABLE products DROP COLUMN IF EXISTS name"
-            )
-        except Error:
-            pass
-    except Error:
-        pass
-    print("[OK] products table")
 
-
-def create_inventory_table(cursor: MySQLCursor):
-    cursor.execute(
-        """
-    CREATE TABLE IF NOT EXISTS inventory (
-            inventory_id INT AUTO_INCREMENT PRIMARY KEY,
-            legacy_inventory_id INT UNIQUE,
-        product_id INT NOT NULL,
-        current_stock INT NOT NULL DEFAULT 0,
-        minimum_stock INT NOT NULL DEFAULT 0,
-        reorder_point INT NOT NULL DEFAULT 0,
-        quantity INT NOT NULL DEFAULT 0,
-            FOREIGN KEY (product_id) REFERENCES products(product_id) ON DELETE CASCADE
+_DDL_INVENTORY = """
+    CREATE TABLE IF NOT EXISTS `inventory` (
+            `inventory_id` INT AUTO_INCREMENT PRIMARY KEY,
+            `legacy_inventory_id` INT UNIQUE,
+        `product_id` INT NOT NULL,
+        `current_stock` INT NOT NULL DEFAULT 0,
+        `minimum_stock` INT NOT NULL DEFAULT 0,
+        `reorder_point` INT NOT NULL DEFAULT 0,
+        `quantity` INT NOT NULL DEFAULT 0,
+            FOREIGN KEY (`product_id`) REFERENCES `products`(`product_id`) ON DELETE CASCADE
     ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
     """
-    )
-    try:
-        cursor.execute(
-            """
-            SELECT COLUMN_NAME
-            FROM information_schema.COLUMNS
-            WHERE TABLE_SCHEMA = %s AND TABLE_NAME = 'inventory' AND COLUMN_NAME = 'legacy_inventory_id'
-            """,
-            (DATABASE_NAME,),
-        )
-        has_legacy_column = cursor.fetchone() is not None
-        if not has_legacy_column:
-            cursor.execute(
-                """
-                SELECT COLUMN_NAME
-                FROM information_schema.COLUMNS
-                WHERE TABLE_SCHEMA = %s AND TABLE_NAME = 'inventory' AND COLUMN_NAME = 'inventory_id' AND COLUMN_KEY <> 'PRI'
-                """,
-                (DATABASE_NAME,),
-            )
-            has_old_unique = cursor.fetchone() is not None
-            if has_old_unique:
-                cursor.execute(
-                    """
-                    ALTER TABLE inventory
-                    CHANGE COLUMN inventory_id legacy_inventory_id INT UNIQUE
-                    """
-                )
-
-        cursor.execute(
-            """
-            SELECT COLUMN_NAME
-            FROM information_schema.COLUMNS
-            WHERE TABLE_SCHEMA = %s AND TABLE_NAME = 'inventory' AND COLUMN_NAME = 'id'
-            """,
-            (DATABASE_NAME,),
-        )
-        has_legacy_id = cursor.fetchone() is not None
-        if has_legacy_id:
-            cursor.execute(
-                """
-                ALTER TABLE inventory
-                CHANGE COLUMN id inventory_id INT AUTO_INCREMENT PRIMARY KEY
-                """
-            )
-    except Error:
-        pass
-    print("[OK] inventory table")
-
 
-def create_purchases_table(cursor: MySQLCursor):
-    cursor.execute(
-        """
-    CREATE TABLE IF NOT EXISTS purchases (
-            purchase_id INT AUTO_INCREMENT PRIMARY KEY,
-        product_id INT NOT NULL,
-        quantity INT NOT NULL,
-        unit_cost DECIMAL(10,2) NOT NULL,
-        total_cost DECIMAL(10,2) NOT NULL,
-        purchase_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (product_id) REFERENCES products(product_id) ON DELETE RESTRICT
+_DDL_PURCHASES = """
+    CREATE TABLE IF NOT EXISTS `purchases` (
+            `purchase_id` INT AUTO_INCREMENT PRIMARY KEY,
+        `product_id` INT NOT NULL,
+        `quantity` INT NOT NULL,
+        `unit_cost` DECIMAL(10,2) NOT NULL,
+        `total_cost` DECIMAL(10,2) NOT NULL,
+        `purchase_date` TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (`product_id`) REFERENCES `products`(`product_id`) ON DELETE RESTRICT
     ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
     """
-    )
-    try:
-        cursor.execute(
-            """
-            SELECT COLUMN_NAME
-            FROM information_schema.COLUMNS
-            WHERE TABLE_SCHEMA = %s AND TABLE_NAME = 'purchases' AND COLUMN_NAME = 'id'
-            """,
-            (DATABASE_NAME,),
-        )
-        has_legacy_id = cursor.fetchone() is not None
-        if has_legacy_id:
-            cursor.execute(
-                """
-                ALTER TABLE purchases
-                CHANGE COLUMN id purchase_id INT AUTO_INCREMENT PRIMARY KEY
-                """
-            )
-    except Error:
-        pass
-    print("[OK] purchases table")
 
-
-def create_purchase_items_table(cursor: MySQLCursor):
-    cursor.execute(
-        """
-        CREATE TABLE IF NOT EXISTS purchase_items (
-            purchase_item_id INT AUTO_INCREMENT PRIMARY KEY,
-            purchase_id INT NOT NULL,
-            product_id INT NOT NULL,
-            quantity INT NOT NULL,
-            unit_price DECIMAL(10,2) NOT NULL,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (purchase_id) REFERENCES purchases(purchase_id) ON DELETE CASCADE,
-            FOREIGN KEY (product_id) REFERENCES products(product_id) ON DELETE RESTRICT
+_DDL_PURCHASE_ITEMS = """
+        CREATE TABLE IF NOT EXISTS `purchase_items` (
+            `purchase_item_id` INT AUTO_INCREMENT PRIMARY KEY,
+            `purchase_id` INT NOT NULL,
+            `product_id` INT NOT NULL,
+            `quantity` INT NOT NULL,
+            `unit_price` DECIMAL(10,2) NOT NULL,
+            `created_at` TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (`purchase_id`) REFERENCES `purchases`(`purchase_id`) ON DELETE CASCADE,
+            FOREIGN KEY (`product_id`) REFERENCES `products`(`product_id`) ON DELETE RESTRICT
     ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
     """
-    )
-    try:
-        cursor.execute(
-            """
-            SELECT COLUMN_NAME
-            FROM information_schema.COLUMNS
-            WHERE TABLE_SCHEMA = %s AND TABLE_NAME = 'purchase_items' AND COLUMN_NAME = 'id'
-            """,
-            (DATABASE_NAME,),
-        )
-        has_legacy_id = cursor.fetchone() is not None
-        if has_legacy_id:
-            cursor.execute(
-                """
-                ALTER TABLE purchase_items
-                CHANGE COLUMN id purchase_item_id INT AUTO_INCREMENT PRIMARY KEY
-                """
-            )
-    except Error:
-        pass
-    print("[OK] purchase_items table")
 
+_DDL_SALES = """
+    CREATE TABLE IF NOT EXISTS `sales` (
+            `sale_id` INT AUTO_INCREMENT PRIMARY KEY,
+        `customer_id` INT NULL,
+        `user_id` INT NULL,
+        `total_amount` DECIMAL(10,2) NOT NULL,
+        `payment_method` ENUM('cash', 'card', 'gcash') DEFAULT 'cash',
+        `proof_of_payment_path` VARCHAR(255),
+        `proof_of_payment_blob` LONGBLOB,
+        `status` ENUM('pending','paid','refunded','cancelled') DEFAULT 'pending',
+        `sale_date` TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (`customer_id`) REFERENCES `customers`(`customer_id`) ON DELETE SET NULL,
+        FOREIGN KEY (`user_id`) REFERENCES `users`(`user_id`) ON DELETE SET NULL
+    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+    """
 
-def create_sales_table(cursor: MySQLCursor):
-    cursor.execute(
-        """
-    CREATE TABLE IF NOT EXISTS sales (
-            sale_id INT AUTO_INCREMENT PRIMARY KEY,
-        customer_id INT NULL,
-        user_id INT NULL,
-        total_amount DECIMAL(10,2) NOT NULL,
-        payment_method ENUM('cash', 'card', 'gcash') DEFAULT 'cash',
-        proof_of_payment_path VARCHAR(255),
-        proof_of_payment_blob LONGBLOB,
-        status ENUM('pending','paid','refunded','cancelled') DEFAULT 'pending',
-        sale_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (customer_id) REFERENCES customers(customer_id) ON DELETE SET NULL,
-        FOREIGN KEY (user_id) REFERENCES users(user_id) ON DELETE SET NULL
+_DDL_SALE_ITEMS = """
+    CREATE TABLE IF NOT EXISTS `sale_items` (
+            `sale_item_id` INT AUTO_INCREMENT PRIMARY KEY,
+        `sale_id` INT NOT NULL,
+        `product_id` INT NOT NULL,
+        `quantity` INT NOT NULL,
+        `price` DECIMAL(10,2) NOT NULL,
+        `created_at` TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (`sale_id`) REFERENCES `sales`(`sale_id`) ON DELETE CASCADE,
+            FOREIGN KEY (`product_id`) REFERENCES `products`(`product_id`) ON DELETE RESTRICT
     ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
     """
-    )
-    try:
-        cursor.execute(
-            """
-            SELECT COLUMN_NAME
-            FROM information_schema.COLUMNS
-            WHERE TABLE_SCHEMA = %s AND TABLE_NAME = 'sales' AND COLUMN_NAME = 'id'
-            """,
-            (DATABASE_NAME,),
-        )
-        has_legacy_id = cursor.fetchone() is not None
-        if has_legacy_id:
-            cursor.execute(
-                """
-                ALTER TABLE sales
-                CHANGE COLUMN id sale_id INT AUTO_INCREMENT PRIMARY KEY
-                """
-            )
-    except Error:
-        pass
 
-    try:
-        cursor.execute(
-            """
-            ALTER TABLE sales
-            ADD COLUMN IF NOT EXISTS proof_of_payment_path VARCHAR(255)
-            """
-        )
-    except Error:
-        pass
+_DDL_OTP_VERIFICATION = """
+        CREATE TABLE IF NOT EXISTS `otp_verification` (
+            `otp_id` INT AUTO_INCREMENT PRIMARY KEY,
+            `email` VARCHAR(100) NOT NULL,
+            `otp_code` VARCHAR(6) NOT NULL,
+            `purpose` VARCHAR(50),
+            `created_at` TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            `expires_at` DATETIME NULL,
+            `is_used` TINYINT(1) NOT NULL DEFAULT 0,
+            `attempts` INT NOT NULL DEFAULT 0
+    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+    """
 
-    try:
-        cursor.execute(
-            """
-            ALTER TABLE sales
-            ADD COLUMN IF NOT EXISTS proof_of_payment_blob LONGBLOB
-            """
-        )
-    except Error:
-        pass
+_DDL_LOYALTY_REWARDS = """
+        CREATE TABLE IF NOT EXISTS `loyalty_rewards` (
+            `loyalty_reward_id` INT AUTO_INCREMENT PRIMARY KEY,
+            `customer_id` INT NOT NULL,
+            `points` INT NOT NULL DEFAULT 0,
+            `description` TEXT,
+        `created_at` TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (`customer_id`) REFERENCES `customers`(`customer_id`) ON DELETE CASCADE
+    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+    """
 
-    try:
-        cursor.execute(
-            """
-            ALTER TABLE sales
-            ADD COLUMN IF NOT EXISTS status ENUM('pending','paid','refunded','cancelled') DEFAULT 'pending'
-            """
-        )
-    except Error:
-        pass
+_DDL_SCHEMA_META = """
+        CREATE TABLE IF NOT EXISTS `schema_meta` (
+            `meta_key` VARCHAR(64) PRIMARY KEY,
+            `meta_value` VARCHAR(255) NOT NULL
+    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+    """
 
-    try:
-        cursor.execute(
-            """
-            ALTER TABLE sales
-            MODIFY COLUMN payment_method ENUM('cash', 'card', 'gcash') DEFAULT 'cash'
-            """
-        )
-    except Error:
-        pass
-    print("[OK] sales table")
+_SCHEMA: Tuple[Tuple[str, str], ...] = (
+    ("categories", _DDL_CATEGORIES),
+    ("customers", _DDL_CUSTOMERS),
+    ("users", _DDL_USERS),
+    ("products", _DDL_PRODUCTS),
+    ("inventory", _DDL_INVENTORY),
+    ("purchases", _DDL_PURCHASES),
+    ("purchase_items", _DDL_PURCHASE_ITEMS),
+    ("sales", _DDL_SALES),
+    ("sale_items", _DDL_SALE_ITEMS),
+    ("otp_verification", _DDL_OTP_VERIFICATION),
+    ("loyalty_rewards", _DDL_LOYALTY_REWARDS),
+    ("schema_meta", _DDL_SCHEMA_META),
+)
 
+# The whole schema as one script, executed with multi=True
+SCHEMA_SQL = ";\n".join(sql for _, sql in _SCHEMA)
+
+FOREIGN_KEY_CHECKS_OFF = "SET SESSION foreign_key_checks = 0"
+FOREIGN_KEY_CHECKS_ON = "SET SESSION foreign_key_checks = 1"
+
+
+# Legacy layouts named every primary key `id`. Some of them also used today's
+# primary key name for a secondary UNIQUE id, which now lives in legacy_<pk>.
+# Each entry: (primary key, legacy id column or None).
+_ID_RENAMES: Dict[str, Tuple[str, Optional[str]]] = {
+    "categories": ("category_id", "legacy_category_id"),
+    "users": ("user_id", None),
+    "products": ("product_id", "legacy_product_id"),
+    "inventory": ("inventory_id", "legacy_inventory_id"),
+    "purchases": ("purchase_id", None),
+    "purchase_items": ("purchase_item_id", None),
+    "sales": ("sale_id", None),
+    "sale_items": ("sale_item_id", None),
+    "otp_verification": ("otp_id", None),
+    "loyalty_rewards": ("loyalty_reward_id", None),
+}
 
-def create_sale_items_table(cursor: MySQLCursor):
-    cursor.execute(
-        """
-    CREATE TABLE IF NOT EXISTS sale_items (
-            sale_item_id INT AUTO_INCREMENT PRIMARY KEY,
-        sale_id INT NOT NULL,
-        product_id INT NOT NULL,
-        quantity INT NOT NULL,
-        price DECIMAL(10,2) NOT NULL,
-        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (sale_id) REFERENCES sales(sale_id) ON DELETE CASCADE,
-            FOREIGN KEY (product_id) REFERENCES products(product_id) ON DELETE RESTRICT
-    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
-    """
+# table -> (pk, legacy, SQL moving pk aside to legacy or None, SQL renaming id to pk)
+_ID_RENAME_SQL: Dict[str, Tuple[str, Optional[str], Optional[str], str]] = {
+    table: (
+        pk,
+        legacy,
+        f"ALTER TABLE `{table}` CHANGE COLUMN `{pk}` `{legacy}` INT UNIQUE" if legacy else None,
+        f"ALTER TABLE `{table}` CHANGE COLUMN `id` `{pk}` INT AUTO_INCREMENT PRIMARY KEY",
     )
-    try:
-        cursor.execute(
-            """
-            SELECT COLUMN_NAME
-            FROM information_schema.COLUMNS
-            WHERE TABLE_SCHEMA = %s AND TABLE_NAME = 'sale_items' AND COLUMN_NAME = 'id'
-            """,
-            (DATABASE_NAME,),
-        )
-        has_legacy_id = cursor.fetchone() is not None
-        if has_legacy_id:
-            cursor.execute(
-                """
-                ALTER TABLE sale_items
-                CHANGE COLUMN id sale_item_id INT AUTO_INCREMENT PRIMARY KEY
-                """
-            )
-    except Error:
-        pass
-    print("[OK] sale_items table")
+    for table, (pk, legacy) in _ID_RENAMES.items()
+}
 
+# Columns added or changed after the first release, applied to existing tables
+_COLUMN_UPGRADES: Dict[str, Tuple[str, ...]] = {
+    "customers": (
+        "ALTER TABLE `customers` ADD COLUMN IF NOT EXISTS `loyalty_points` INT NOT NULL DEFAULT 0",
+        "ALTER TABLE `customers` ADD COLUMN IF NOT EXISTS `total_spent` DECIMAL(12,2) NOT NULL DEFAULT 0",
+        "ALTER TABLE `customers` ADD COLUMN IF NOT EXISTS `last_order_date` TIMESTAMP NULL DEFAULT NULL",
+    ),
+    "products": (
+        "ALTER TABLE `products` ADD COLUMN IF NOT EXISTS `image_blob` LONGBLOB",
+        "ALTER TABLE `products` DROP COLUMN IF EXISTS `name`",
+    ),
+    "sales": (
+        "ALTER TABLE `sales` ADD COLUMN IF NOT EXISTS `proof_of_payment_path` VARCHAR(255)",
+        "ALTER TABLE `sales` ADD COLUMN IF NOT EXISTS `proof_of_payment_blob` LONGBLOB",
+        "ALTER TABLE `sales` ADD COLUMN IF NOT EXISTS `status` ENUM('pending','paid','refunded','cancelled') DEFAULT 'pending'",
+        "ALTER TABLE `sales` MODIFY COLUMN `payment_method` ENUM('cash', 'card', 'gcash') DEFAULT 'cash'",
+    ),
+    "otp_verification": (
+        "ALTER TABLE `otp_verification` ADD COLUMN IF NOT EXISTS `expires_at` DATETIME NULL",
+        "ALTER TABLE `otp_verification` ADD COLUMN IF NOT EXISTS `is_used` TINYINT(1) NOT NULL DEFAULT 0",
+        "ALTER TABLE `otp_verification` ADD COLUMN IF NOT EXISTS `attempts` INT NOT NULL DEFAULT 0",
+    ),
+}
 
-def create_otp_verification_table(cursor: MySQLCursor):
-    cursor.execute(
-        """
-        CREATE TABLE IF NOT EXISTS otp_verification (
-            otp_id INT AUTO_INCREMENT PRIMARY KEY,
-            email VARCHAR(100) NOT NULL,
-            otp_code VARCHAR(6) NOT NULL,
-            purpose VARCHAR(50),
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            expires_at DATETIME NULL,
-            is_used TINYINT(1) NOT NULL DEFAULT 0,
-            attempts INT NOT NULL DEFAULT 0
-    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
-    """
-    )
-    try:
-        cursor.execute(
-            """
-            SELECT COLUMN_NAME
-            FROM information_schema.COLUMNS
-            WHERE TABLE_SCHEMA = %s AND TABLE_NAME = 'otp_verification' AND COLUMN_NAME = 'id'
-            """,
-            (DATABASE_NAME,),
-        )
-        has_legacy_id = cursor.fetchone() is not None
-        if has_legacy_id:
-            cursor.execute(
-                """
-                ALTER TABLE otp_verification
-                CHANGE COLUMN id otp_id INT AUTO_INCREMENT PRIMARY KEY
-                """
-            )
-    except Error:
-        pass
-    try:
-        cursor.execute(
-            "ALTER TABLE otp_verification ADD COLUMN IF NOT EXISTS expires_at DATETIME NULL"
-        )
-        cursor.execute(
-            "ALTER TABLE otp_verification ADD COLUMN IF NOT EXISTS is_used TINYINT(1) NOT NULL DEFAULT 0"
-        )
-        cursor.execute(
-            "ALTER TABLE otp_verification ADD COLUMN IF NOT EXISTS attempts INT NOT NULL DEFAULT 0"
-        )
-    except Error:
-        pass
-    print("[OK] otp_verification table")
 
+def migrate_table(cursor: MySQLCursor, columns: TableColumns, table_name: str):
+    """Bring an existing table from an older layout up to the current one."""
+    existing = columns.get(table_name, {})
+    renames = _ID_RENAME_SQL.get(table_name)
+    if renames:
+        pk, legacy, legacy_sql, id_sql = renames
+        try:
+            # If the secondary identifier column hasn't been renamed yet, rename it first
+            if legacy_sql and legacy not in existing and existing.get(pk, "PRI") != "PRI":
+                cursor.execute(legacy_sql)
+            if "id" in existing:
+                cursor.execute(id_sql)
+        except Error:
+            pass
 
-def create_loyalty_rewards_table(cursor: MySQLCursor):
-    cursor.execute(
-        """
-        CREATE TABLE IF NOT EXISTS loyalty_rewards (
-            loyalty_reward_id INT AUTO_INCREMENT PRIMARY KEY,
-            customer_id INT NOT NULL,
-            points INT NOT NULL DEFAULT 0,
-            description TEXT,
-        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (customer_id) REFERENCES customers(customer_id) ON DELETE CASCADE
-    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
-    """
-    )
-    try:
-        cursor.execute(
-            """
-            SELECT COLUMN_NAME
-            FROM information_schema.COLUMNS
-            WHERE TABLE_SCHEMA = %s AND TABLE_NAME = 'loyalty_rewards' AND COLUMN_NAME = 'id'
-            """,
-            (DATABASE_NAME,),
-        )
-        has_legacy_id = cursor.fetchone() is not None
-        if has_legacy_id:
-            cursor.execute(
-                """
-                ALTER TABLE loyalty_rewards
-                CHANGE COLUMN id loyalty_reward_id INT AUTO_INCREMENT PRIMARY KEY
-                """
-            )
-    except Error:
-        pass
-    print("[OK] loyalty_rewards table")
-
-
-TABLE_CREATORS: Iterable[Tuple[str, Callable[[MySQLCursor], None]]] = (
-    ("categories", create_categories_table),
-    ("customers", create_customers_table),
-    ("users", create_users_table),
-    ("products", create_products_table),
-    ("inventory", create_inventory_table),
-    ("purchases", create_purchases_table),
-    ("purchase_items", create_purchase_items_table),
-    ("sales", create_sales_table),
-    ("sale_items", create_sale_items_table),
-    ("otp_verification", create_otp_verification_table),
-    ("loyalty_rewards", create_loyalty_rewards_table),
-)
+    for sql in _COLUMN_UPGRADES.get(table_name, ()):
+        try:
+            cursor.execute(sql)
+        except Error:
+            pass
 
 
 CATEGORY_SEED: Tuple[CategorySeed, ...] = (
@@ -698,216 +426,150 @@ PRODUCT_SEED: Tuple[ProductSeed, ...] = (
         ("coffee", "CF008", "Spanish Latte", "Coffee with sweetened condensed milk", 25.00, 29.00),
 )
 
+CATEGORY_IDS = {slug: cid for cid, _, slug, _ in CATEGORY_SEED}
+
+# Optional product artwork, stored alongside each seeded product
+PRODUCT_IMAGE_DIR = Path(__file__).resolve().parents[2] / "resources" / "products"
+
 CUSTOMER_SEED: Tuple[CustomerSeed, ...] = (
     ("CUST-000001", "john.doe", "john@example.com", "John", "Doe", "regular", "09123456789", "123 Main St"),
     ("CUST-000002", "jane.smith", "jane@example.com", "Jane", "Smith", "regular", "09123456790", "456 Oak Ave"),
 )
 
 
-def seed_categories(cursor: MySQLCursor):
-    for cid, display_name, slug, description in CATEGORY_SEED:
-        pk_column = first_existing_column(cursor, "categories", "category_id", "id")
-        legacy_column = first_existing_column(cursor, "categories", "legacy_category_id", "category_id", pk_column)
+# The seeded passwords are published defaults that must be changed after the
+# first login, so their hashes use a low work factor; bcrypt.checkpw reads the
+# cost from the hash, and passwords set through the app keep bcrypt's default.
+SEED_BCRYPT_ROUNDS = 6
 
-        columns = [pk_column]
-        values = [cid]
-        if legacy_column != pk_column:
-            columns.append(legacy_column)
-            values.append(cid)
 
-        columns.extend(["name", "category_name", "description"])
-        values.extend([display_name, slug, description])
+def hash_seed_password(password: bytes) -> str:
+    return bcrypt.hashpw(password, bcrypt.gensalt(rounds=SEED_BCRYPT_ROUNDS)).decode("utf-8")
 
-        placeholders = ", ".join(["%s"] * len(columns))
-        column_list = ", ".join(columns)
 
-        updates = [
-            "name = VALUES(name)",
-            "category_name = VALUES(category_name)",
-            "description = VALUES(description)",
-        ]
-        if legacy_column != pk_column:
-            updates.insert(0, f"{legacy_column} = VALUES({legacy_column})")
+def id_columns(columns: TableColumns, table_name: str, pk_name: str, legacy_name: str) -> list:
+    """Return the primary key column, plus the legacy id column when the table still carries one."""
+    pk_column = first_existing_column(columns, table_name, pk_name, "id")
+    legacy_column = first_existing_column(columns, table_name, legacy_name, pk_name, pk_column)
+    if legacy_column == pk_column:
+        return [pk_column]
+    return [pk_column, legacy_column]
 
-        sql = f"""
-            INSERT INTO categories ({column_list})
-            VALUES ({placeholders})
-            ON DUPLICATE KEY UPDATE {', '.join(updates)}
-        """
-        cursor.execute(sql, tuple(values))
-
-
-def seed_products(cursor: MySQLCursor):
-    category_lookup = {slug: cid for cid, _, slug, _ in CATEGORY_SEED}
-    for index, (category_slug, code, name, description, price_regular, price_large) in enumerate(PRODUCT_SEED, start=1):
-        category_id = category_lookup.get(category_slug)
-        pk_column = first_existing_column(cursor, "products", "product_id", "id")
-        legacy_column = first_existing_column(cursor, "products", "legacy_product_id", "product_id", pk_column)
-
-        columns = [pk_column]
-        values = [index]
-        if legacy_column != pk_column:
-            columns.append(legacy_column)
-            values.append(index)
-
-        columns.extend(
-            [
-                "category_id",
-                "product_code",
-                "product_name",
-                "description",
-                "price",
-                "price_regular",
-                "price_large",
-                "image_path",
-                "image_blob",
-            ]
-        )
 
-        image_path = None
-        try:
-            image_filename = f"{code.lower()}.png"
-            image_path = (Path(__file__).resolve().parents[2] / "resources" / "products" / image_filename)
-            if image_path.exists():
-                with open(image_path, "rb") as img_file:
-                    image_blob = img_file.read()
-            else:
-                image_blob = None
-                image_path = None
-        except Exception:
-            image_blob = None
-            image_path = None
-
-        values.extend(
-            [
-                category_id,
-                code,
-                name,
-                description,
-                price_regular,
-                price_regular,
-                price_large,
-                str(image_path) if image_path else None,
-                image_blob,
-            ]
-        )
+def bulk_upsert(
+    cursor: MySQLCursor,
+    table_name: str,
+    columns: list,
+    update_columns: list,
+    rows: list,
+):
+    """Write all rows with a single multi-row INSERT ... ON DUPLICATE KEY UPDATE."""
+    row_placeholders = "(" + ", ".join(["%s"] * len(columns)) + ")"
+    updates = ", ".join(f"{column} = VALUES({column})" for column in update_columns)
+    cursor.execute(
+        f"""
+        INSERT INTO {table_name} ({', '.join(columns)})
+        VALUES {', '.join([row_placeholders] * len(rows))}
+        ON DUPLICATE KEY UPDATE {updates}
+        """,
+        tuple(value for row in rows for value in row),
+    )
 
-        updates = [
-            "category_id = VALUES(category_id)",
-            "product_name = VALUES(product_name)",
-            "description = VALUES(description)",
-            "price = VALUES(price)",
-            "price_regular = VALUES(price_regular)",
-            "price_large = VALUES(price_large)",
-            "image_path = VALUES(image_path)",
-            "image_blob = VALUES(image_blob)",
-        ]
-        if legacy_column != pk_column:
-            updates.insert(0, f"{legacy_column} = VALUES({legacy_column})")
-
-        placeholders = ", ".join(["%s"] * len(columns))
-        column_list = ", ".join(columns)
-
-        sql = f"""
-            INSERT INTO products ({column_list})
-            VALUES ({placeholders})
-            ON DUPLICATE KEY UPDATE {', '.join(updates)}
-        """
-        cursor.execute(sql, tuple(values))
-
-
-def seed_inventory(cursor: MySQLCursor):
-    total_products = len(PRODUCT_SEED)
-    for index in range(1, total_products + 1):
-        pk_column = first_existing_column(cursor, "inventory", "inventory_id", "id")
-        legacy_column = first_existing_column(cursor, "inventory", "legacy_inventory_id", "inventory_id", pk_column)
-
-        columns = [pk_column]
-        values = [index]
-        if legacy_column != pk_column:
-            columns.append(legacy_column)
-            values.append(index)
-
-        columns.extend(
-            [
-                "product_id",
-                "current_stock",
-                "minimum_stock",
-                "reorder_point",
-                "quantity",
-            ]
+
+def seed_categories(cursor: MySQLCursor, columns: TableColumns):
+    ids = id_columns(columns, "categories", "category_id", "legacy_category_id")
+    values = ["name", "category_name", "description"]
+    rows = [
+        (cid,) * len(ids) + (display_name, slug, description)
+        for cid, display_name, slug, description in CATEGORY_SEED
+    ]
+    bulk_upsert(cursor, "categories", ids + values, ids[1:] + values, rows)
+
+
+def read_product_image(code: str) -> Tuple[Optional[str], Optional[bytes]]:
+    """Return (path, bytes) of a product's bundled PNG, or (None, None) when there is none."""
+    image_path = PRODUCT_IMAGE_DIR / f"{code.lower()}.png"
+    try:
+        return str(image_path), image_path.read_bytes()
+    except OSError:
+        return None, None
+
+
+def seed_products(cursor: MySQLCursor, columns: TableColumns):
+    ids = id_columns(columns, "products", "product_id", "legacy_product_id")
+    values = [
+        "category_id",
+        "product_code",
+        "product_name",
+        "description",
+        "price",
+        "price_regular",
+        "price_large",
+        "image_path",
+        "image_blob",
+    ]
+    rows = [
+        (index,) * len(ids)
+        + (
+            CATEGORY_IDS.get(category_slug),
+            code,
+            name,
+            description,
+            price_regular,
+            price_regular,
+            price_large,
+            *read_product_image(code),
         )
-        values.extend([index, 100, 10, 20, 100])
-
-        updates = [
-            "current_stock = VALUES(current_stock)",
-            "minimum_stock = VALUES(minimum_stock)",
-            "reorder_point = VALUES(reorder_point)",
-            "quantity = VALUES(quantity)",
-        ]
-        if legacy_column != pk_column:
-            updates.insert(0, f"{legacy_column} = VALUES({legacy_column})")
-
-        placeholders = ", ".join(["%s"] * len(columns))
-        column_list = ", ".join(columns)
-
-        sql = f"""
-            INSERT INTO inventory ({column_list})
-            VALUES ({placeholders})
-            ON DUPLICATE KEY UPDATE {', '.join(updates)}
-        """
-        cursor.execute(sql, tuple(values))
+        for index, (category_slug, code, name, description, price_regular, price_large) in enumerate(PRODUCT_SEED, start=1)
+    ]
+    updates = ids[1:] + [column for column in values if column != "product_code"]
+    bulk_upsert(cursor, "products", ids + values, updates, rows)
+
+
+def seed_inventory(cursor: MySQLCursor, columns: TableColumns):
+    """Give every seeded product its opening stock, generated server-side from products."""
+    ids = id_columns(columns, "inventory", "inventory_id", "legacy_inventory_id")
+    product_pk = first_existing_column(columns, "products", "product_id", "id")
+    stock = ["current_stock", "minimum_stock", "reorder_point", "quantity"]
+    updates = ", ".join(f"{column} = VALUES({column})" for column in ids[1:] + stock)
+    cursor.execute(
+        f"""
+        INSERT INTO inventory ({', '.join(ids + ["product_id"] + stock)})
+        SELECT {', '.join([product_pk] * (len(ids) + 1))}, %s, %s, %s, %s
+        FROM products
+        WHERE {product_pk} BETWEEN 1 AND %s
+        ON DUPLICATE KEY UPDATE {updates}
+        """,
+        (100, 10, 20, 100, len(PRODUCT_SEED)),
+    )
 
 
 def seed_customers(cursor: MySQLCursor):
-    default_password = bcrypt.hashpw(b"password123", bcrypt.gensalt()).decode("utf-8")
-    for (
-        customer_code,
-        username,
-        email,
-        first_name,
-        last_name,
-        customer_type,
-        phone,
-        address,
-    ) in CUSTOMER_SEED:
-        cursor.execute(
-            """
-            INSERT INTO customers (
-                customer_code, username, email, password_hash,
-                first_name, last_name, customer_type, phone, address,
-                is_active, is_verified, email_verified
-            )
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            ON DUPLICATE KEY UPDATE
-                first_name = VALUES(first_name),
-                last_name = VALUES(last_name),
-                customer_type = VALUES(customer_type),
-                phone = VALUES(phone),
-                address = VALUES(address),
-                is_active = VALUES(is_active),
-                is_verified = VALUES(is_verified),
-                email_verified = VALUES(email_verified)
-            """,
-            (
-                customer_code,
-                username,
-                email,
-                default_password,
-                first_name,
-                last_name,
-                customer_type,
-                phone,
-                address,
-                1,
-                1,
-                1,
-            ),
-        )
+    default_password = hash_seed_password(b"password123")
+    columns = [
+        "customer_code", "username", "email", "password_hash",
+        "first_name", "last_name", "customer_type", "phone", "address",
+        "is_active", "is_verified", "email_verified",
+    ]
+    updates = [
+        "first_name", "last_name", "customer_type", "phone", "address",
+        "is_active", "is_verified", "email_verified",
+    ]
+    rows = [
+        (code, username, email, default_password, *details, 1, 1, 1)
+        for code, username, email, *details in CUSTOMER_SEED
+    ]
+    bulk_upsert(cursor, "customers", columns, updates, rows)
 
 
 def seed_admin_user(cursor: MySQLCursor):
-    password_hash = bcrypt.hashpw(b"admin123", bcrypt.gensalt()).decode("utf-8")
+    """Create the default admin; an existing admin keeps its password and no hash is computed."""
+    cursor.execute("SELECT 1 FROM users WHERE username = %s LIMIT 1", ("admin",))
+    if cursor.fetchone() is not None:
+        report("[OK] Admin account already exists; its password was left unchanged.")
+        return
+
+    password_hash = hash_seed_password(b"admin123")
     cursor.execute(
         """
         INSERT INTO users (
@@ -926,64 +588,195 @@ def seed_admin_user(cursor: MySQLCursor):
     )
 
 
-def insert_initial_data(cursor: MySQLCursor):
-    print("[INFO] Seeding reference data...")
+def apply_seeds(cursor: MySQLCursor, columns: TableColumns):
     seed_admin_user(cursor)
-    seed_categories(cursor)
-    seed_products(cursor)
-    seed_inventory(cursor)
+    seed_categories(cursor, columns)
+    seed_products(cursor, columns)
+    seed_inventory(cursor, columns)
     seed_customers(cursor)
-    print("[OK] Seed data applied.")
 
 
-def initialize_system_database():
-    print("============================================================")
-    print("BigBrew POS System - Database Initialization")
-    print("============================================================")
+def insert_initial_data(cursor: MySQLCursor, columns: TableColumns):
+    report("[INFO] Seeding reference data...")
+    apply_seeds(cursor, columns)
+    report("[OK] Seed data applied.")
+
 
-    if not ensure_database():
+# Changes whenever the DDL, the migrations or the seed rows change; a database
+# whose stored fingerprint matches has nothing left to create, migrate or seed.
+SCHEMA_FINGERPRINT = hashlib.sha256(
+    (
+        SCHEMA_SQL
+        + repr((_ID_RENAME_SQL, _COLUMN_UPGRADES))
+        + repr((CATEGORY_SEED, PRODUCT_SEED, CUSTOMER_SEED))
+    ).encode("utf-8")
+).hexdigest()
+
+
+def schema_is_current(cursor: MySQLCursor) -> bool:
+    """Check whether the last successful initialization used these tables, migrations and seeds."""
+    try:
+        cursor.execute(
+            "SELECT meta_value FROM schema_meta WHERE meta_key = %s",
+            ("schema_fingerprint",),
+        )
+        row = cursor.fetchone()
+    except Error:
+        # Older databases have no schema_meta table yet
         return False
+    return row is not None and row[0] == SCHEMA_FINGERPRINT
+
 
-    connection = connect_to_database()
+def record_schema_fingerprint(cursor: MySQLCursor):
+    cursor.execute(
+        """
+        INSERT INTO schema_meta (meta_key, meta_value)
+        VALUES (%s, %s)
+        ON DUPLICATE KEY UPDATE meta_value = VALUES(meta_value)
+        """,
+        ("schema_fingerprint", SCHEMA_FINGERPRINT),
+    )
+
+
+def initialize_system_database():
+    report("============================================================")
+    report("BigBrew POS System - Database Initialization")
+    report("============================================================")
+
+    connection = ensure_database()
     if not connection:
+        flush_report()
         return False
-    
+
+    cursor = None
     try:
         cursor = connection.cursor()
-        for name, creator in TABLE_CREATORS:
-            creator(cursor)
+        if schema_is_current(cursor):
+            report("[OK] Schema and seed data are already up to date.")
+            return True
 
-        insert_initial_data(cursor)
+        # Every CREATE TABLE goes over in one round trip; the per-statement
+        # results still have to be drained before the cursor can be reused.
+        for _ in cursor.execute(SCHEMA_SQL, multi=True):
+            pass
+        columns = load_columns(cursor)
+        for name, _ in _SCHEMA:
+            migrate_table(cursor, columns, name)
+            report(f"[OK] {name} table")
+        # The migrations may have renamed columns; seed against the result
+        columns = load_columns(cursor)
+
+        # Seeds are written parent-first, so per-row foreign key lookups add
+        # nothing. Unique checks stay on: the upserts need them to find rows
+        # left by an earlier run.
+        cursor.execute(FOREIGN_KEY_CHECKS_OFF)
+        insert_initial_data(cursor, columns)
+        cursor.execute(FOREIGN_KEY_CHECKS_ON)
+        record_schema_fingerprint(cursor)
         connection.commit()
-        print("[SUCCESS] All tables created and seed data inserted.")
+        report("[SUCCESS] All tables created and seed data inserted.")
         return True
     except Error as exc:
-        print(f"[ERROR] Database initialization failed: {exc}")
-        if connection.is_connected():
+        report(f"[ERROR] Database initialization failed: {exc}")
+        try:
             connection.rollback()
+        except Error:
+            pass
         return False
     finally:
-        if connection.is_connected():
-            cursor.close()
-            connection.close()
+        close_quietly(cursor, connection)
+        flush_report()
+
+
+def sql_literal(value) -> str:
+    """Render a seed value as a MySQL literal."""
+    if value is None:
+        return "NULL"
+    if isinstance(value, (bytes, bytearray)):
+        return f"X'{value.hex()}'"
+    if isinstance(value, (int, float)):
+        return repr(value)
+    text = str(value).replace("\\", "\\\\").replace("'", "''")
+    return f"'{text}'"
+
+
+class SqlScriptWriter:
+    """Cursor stand-in that renders the seed statements as SQL text instead of running them."""
+
+    def __init__(self):
+        self.statements = []
+
+    def execute(self, sql: str, params=()):
+        sql = " ".join(sql.split())
+        if sql.upper().startswith("SELECT"):
+            # Lookups find nothing in a fresh database
+            return
+        pieces = sql.split("%s")
+        if len(pieces) != len(params) + 1:
+            raise ValueError(f"Expected {len(pieces) - 1} parameters, got {len(params)}")
+        rendered = [pieces[0]]
+        for value, piece in zip(params, pieces[1:]):
+            rendered.append(sql_literal(value))
+            rendered.append(piece)
+        self.statements.append("".join(rendered))
+
+    def fetchone(self):
+        return None
 
 
-def main():
+def emit_sql_script(path: str):
+    """Write schema and seed data for a fresh database as one script for the mysql client."""
+    writer = SqlScriptWriter()
+    # A fresh database has the current layout, legacy id columns included
+    columns: TableColumns = {
+        table: {pk: "PRI", **({legacy: "UNI"} if legacy else {})}
+        for table, (pk, legacy) in _ID_RENAMES.items()
+    }
+    apply_seeds(writer, columns)
+    record_schema_fingerprint(writer)
+
+    parts = [
+        CREATE_DATABASE_SQL,
+        f"USE `{DATABASE_NAME}`",
+        SCHEMA_SQL,
+        FOREIGN_KEY_CHECKS_OFF,
+        *writer.statements,
+        FOREIGN_KEY_CHECKS_ON,
+    ]
+    Path(path).write_text(";\n".join(part.strip() for part in parts) + ";\n", encoding="utf-8")
+
+
+def main(argv=None):
+    args = list(sys.argv[1:] if argv is None else argv)
     if not DB_CONFIG.get("host") or not DATABASE_NAME:
         print("[ERROR] Database configuration is incomplete. Check config.py.")
         return False
 
-    print("[INFO] Starting BigBrew POS database initialization...")
+    # --emit-sql PATH: write the whole init as a script for `mysql ... < PATH`
+    if "--emit-sql" in args:
+        index = args.index("--emit-sql") + 1
+        if index >= len(args):
+            print("[ERROR] --emit-sql needs an output path.")
+            return False
+        if not DATABASE_NAME_IS_VALID:
+            print(f"[ERROR] Invalid database name '{DATABASE_NAME}'. Use letters, digits and underscores only.")
+            return False
+        emit_sql_script(args[index])
+        print(f"[OK] SQL script written to {args[index]}")
+        return True
+
+    report("[INFO] Starting BigBrew POS database initialization...")
     success = initialize_system_database()
 
     if success:
-        print("------------------------------------------------------------")
-        print("Default admin credentials:")
-        print("  Username: admin")
-        print("  Email   : admin@bigbrew.com")
-        print("  Password: admin123")
-        print("Please change the admin password after first login.")
-        print("------------------------------------------------------------")
+        report("------------------------------------------------------------")
+        report("Default admin credentials:")
+        report("  Username: admin")
+        report("  Email   : admin@bigbrew.com")
+        report("  Password: admin123")
+        report("Please change the admin password after first login.")
+        report("------------------------------------------------------------")
+        flush_report()
 
     return success
 
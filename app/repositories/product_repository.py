@@ -43,7 +43,7 @@ class ProductRepository:
         except Error as exc:
             print(f"Error: {exc}")
         finally:
-            if connection and connection.is_connected():
+            if connection:
                 cursor.close()
                 connection.close()
 
@@ -82,7 +82,7 @@ class ProductRepository:
         except Error as exc:
             print(f"Error: {exc}")
         finally:
-            if connection and connection.is_connected():
+            if connection:
                 cursor.close()
                 connection.close()
 
@@ -144,7 +144,7 @@ class ProductRepository:
             print(f"Error: {exc}")
             new_id = None
         finally:
-            if connection and connection.is_connected():
+            if connection:
                 cursor.close()
                 connection.close()
 
@@ -224,7 +224,7 @@ class ProductRepository:
             print(f"Error: {exc}")
             success = False
         finally:
-            if connection and connection.is_connected():
+            if connection:
                 cursor.close()
                 connection.close()
 
@@ -247,7 +247,7 @@ class ProductRepository:
             print(f"Error: {exc}")
             success = False
         finally:
-            if connection and connection.is_connected():
+            if connection:
                 cursor.close()
                 connection.close()
 
@@ -286,7 +286,7 @@ class ProductRepository:
         except Error as exc:
             print(f"Error: {exc}")
         finally:
-            if connection and connection.is_connected():
+            if connection:
                 cursor.close()
                 connection.close()
 
@@ -1,21 +1,42 @@
 import tkinter as tk
+from functools import partial
 from tkinter import messagebox, ttk
 
 import bcrypt
 
-try:
-    from matplotlib.figure import Figure
-    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-    from matplotlib.ticker import FuncFormatter
-
-    MATPLOTLIB_AVAILABLE = True
-except ImportError:
-    MATPLOTLIB_AVAILABLE = False
-    FuncFormatter = None
+from app.db.connection import db
 from app.ui.admin_product_management import ProductManagementMixin
 from app.ui.admin_inventory_management import InventoryManagementMixin
 from app.ui.admin_sales_management import SalesManagementMixin
 
+_MATPLOTLIB = None
+
+
+def _load_matplotlib():
+    """
+    Import matplotlib on the first chart render.
+
+    Returns ``(Figure, FigureCanvasTkAgg, FuncFormatter)``, or None when
+    matplotlib is not installed. Only the admin overview draws charts, so the
+    other role dashboards never pay for the import.
+    """
+    global _MATPLOTLIB
+    if _MATPLOTLIB is None:
+        try:
+            from matplotlib.figure import Figure
+            from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+            from matplotlib.ticker import FuncFormatter
+
+            _MATPLOTLIB = (Figure, FigureCanvasTkAgg, FuncFormatter)
+        except ImportError:
+            _MATPLOTLIB = ()
+    return _MATPLOTLIB or None
+
+
+# Dashboards are withdrawn on logout and reused on the next login, per role
+_DASHBOARD_CACHE = {}
+
+
 class DashboardFactory:
     def __init__(self, user_data, main_app):
         self.user_data = user_data
@@ -25,134 +46,180 @@ class DashboardFactory:
     def show_dashboard(self):
         """Show the appropriate dashboard based on user role"""
         role = self.user_data['user_type']
-        
-        if role == 'admin':
-            self.dashboard_window = AdminDashboard(self.user_data, self.main_app)
-        elif role == 'manager':
-            self.dashboard_window = ManagerDashboard(self.user_data, self.main_app)
-        elif role == 'cashier':
-            self.dashboard_window = CashierDashboard(self.user_data, self.main_app)
-        elif role == 'barista':
-            self.dashboard_window = BaristaDashboard(self.user_data, self.main_app)
-        elif role == 'inventory_manager':
-            self.dashboard_window = InventoryManagerDashboard(self.user_data, self.main_app)
-        else:
+        spec = ROLE_SPECS.get(role)
+        if spec is None:
             messagebox.showerror("Error", "Unknown user role")
             return
-            
+
+        dashboard_cls, _, cards = spec
+        dashboard = _DASHBOARD_CACHE.get(role)
+        if dashboard is not None and dashboard.window.winfo_exists():
+            dashboard.populate(self.user_data)
+        else:
+            dashboard = dashboard_cls(self.user_data, self.main_app, cards)
+            _DASHBOARD_CACHE[role] = dashboard
+
+        self.dashboard_window = dashboard
         self.dashboard_window.show()
 
 class BaseDashboard:
-    def __init__(self, user_data, login_window):
+    # Color scheme
+    BG_COLOR = "#4A3728"
+    ACCENT_COLOR = "#FFD700"
+    CARD_BG = "#F5F5DC"
+    TEXT_COLOR = "#FFFFFF"
+    BUTTON_COLOR = "#D2691E"
+
+    # Shared fonts
+    FONT_LOGO = ("Arial", 20, "bold")
+    FONT_ROLE = ("Arial", 12)
+    FONT_LOGOUT = ("Arial", 10)
+    FONT_BTN = ("Arial", 12)
+    FONT_CARD_TITLE = ("Arial", 14, "bold")
+    FONT_FOOTER = ("Arial", 9)
+
+    # Card look, registered once in Tk's option database (see _add_card_options)
+    CARD_OPTIONS = (
+        ('*Card.background', CARD_BG),
+        ('*Card.relief', 'raised'),
+        ('*Card.borderWidth', 2),
+        ('*Card.Label.font', FONT_CARD_TITLE),
+        ('*Card.Label.background', CARD_BG),
+        ('*Card.Label.foreground', "#4A3728"),
+        ('*Card.Button.font', FONT_BTN),
+        ('*Card.Button.background', BUTTON_COLOR),
+        ('*Card.Button.foreground', TEXT_COLOR),
+        ('*Card.Button.relief', 'flat'),
+        ('*Card.Button.borderWidth', 0),
+        ('*Card.Button.height', 2),
+    )
+    _card_options_added = False
+
+    def __init__(self, user_data, login_window, cards=()):
         self.user_data = user_data
         self.login_window = login_window
+        self.cards = cards
         self.window = tk.Toplevel()
+        # Tells the main app's clear_window to leave this withdrawn window alone
+        self.window.keep_alive = True
         self.window.title(f"BigBrew - {self.get_role_title()}")
-        self.window.geometry("1270x790")
         self.window.resizable(True, True)
-        # Center the dashboard on screen
+        # Center the dashboard on screen. Screen size needs no layout pass, so
+        # the geometry is set once and Tk lays everything out on its idle pass.
+        width, height = 1270, 790
         try:
-            self.window.update_idletasks()
-            width, height = 1270, 790
-            screen_width = self.window.winfo_screenwidth()
-            screen_height = self.window.winfo_screenheight()
-            x = (screen_width - width) // 2
-            y = (screen_height - height) // 2
+            x = (self.window.winfo_screenwidth() - width) // 2
+            y = (self.window.winfo_screenheight() - height) // 2
             self.window.geometry(f"{width}x{height}+{x}+{y}")
         except Exception:
-            pass
+            self.window.geometry(f"{width}x{height}")
         
-        # Hide the login window (main app root) when dashboard opens
-        if hasattr(self.login_window, 'root'):
-            try:
-                self.login_window.root.withdraw()  # Hide the main window
-            except Exception:
-                pass
-        
-        # Color scheme
-        self.bg_color = "#4A3728"
-        self.accent_color = "#FFD700"
-        self.card_bg = "#F5F5DC"
-        self.text_color = "#FFFFFF"
-        self.button_color = "#D2691E"
+        self._hide_login_window()
         
-        self.window.configure(bg=self.bg_color)
+        self.window.configure(bg=self.BG_COLOR)
         self.graph_canvas = None
         self.setup_ui()
         
         # Handle window close
         self.window.protocol("WM_DELETE_WINDOW", self.on_closing)
         
+    def _hide_login_window(self):
+        """Hide the login window (main app root) while the dashboard is open"""
+        if hasattr(self.login_window, 'root'):
+            try:
+                self.login_window.root.withdraw()  # Hide the main window
+            except Exception:
+                pass
+        
+    def populate(self, user_data):
+        """Rebind a withdrawn dashboard to a newly logged-in user"""
+        self.user_data = user_data
+        self._hide_login_window()
+        self.user_label.config(text=self._welcome_text())
+        # The footer is built on the first idle pass; if that has not run yet,
+        # create_footer picks up the new user_data itself
+        footer_label = getattr(self, 'footer_label', None)
+        if footer_label is not None:
+            footer_label.config(text=self._footer_text())
+        
+    def _welcome_text(self):
+        return f"Welcome, {self.user_data['first_name']} {self.user_data['last_name']}"
+        
+    def _footer_text(self):
+        # last_login_str is formatted by the login screen
+        last_login = self.user_data.get('last_login_str', 'Never')
+        return f"Last login: {last_login} | BigBrew Coffee Management System"
+        
     def get_role_title(self):
         """Get formatted role title"""
-        role_titles = {
-            'admin': 'Administrator Dashboard',
-            'manager': 'Manager Dashboard',
-            'cashier': 'Cashier Dashboard',
-            'barista': 'Barista Dashboard',
-            'inventory_manager': 'Inventory Manager Dashboard'
-        }
-        return role_titles.get(self.user_data['user_type'], 'Dashboard')
+        spec = ROLE_SPECS.get(self.user_data['user_type'])
+        return spec[1] if spec else 'Dashboard'
         
     def setup_ui(self):
         """Setup the dashboard UI"""
-        # Header
+        # Header first so the window paints immediately
         self.create_header()
         
-        # Main content area
-        self.create_main_content()
+        # Main content and footer fill in on the next idle pass
+        self.window.after_idle(self._deferred_build)
         
-        # Footer
+    def _deferred_build(self):
+        """Build the main content area and footer once the header is up"""
+        if not self.window.winfo_exists():
+            return
+        self.create_main_content()
         self.create_footer()
         
     def create_header(self):
         """Create dashboard header"""
-        header_frame = tk.Frame(self.window, bg=self.bg_color, height=80)
+        header_frame = tk.Frame(self.window, bg=self.BG_COLOR)
         header_frame.pack(fill='x', padx=20, pady=10)
-        header_frame.pack_propagate(False)
+        header_frame.grid_rowconfigure(0, weight=1)
+        header_frame.grid_columnconfigure((0, 1), weight=1, uniform='hdr')
+        # Zero-width spacer holds the row at 80px instead of disabling propagation
+        tk.Frame(header_frame, bg=self.BG_COLOR, height=80, width=1).grid(row=0, column=0, sticky='w')
         
         # Logo and title
-        title_frame = tk.Frame(header_frame, bg=self.bg_color)
-        title_frame.pack(side='left', fill='y')
+        title_frame = tk.Frame(header_frame, bg=self.BG_COLOR)
+        title_frame.grid(row=0, column=0, sticky='nw')
         
         logo_label = tk.Label(
             title_frame,
             text="☕ BIGBREW",
-            font=("Arial", 20, "bold"),
-            bg=self.bg_color,
-            fg=self.accent_color
+            font=self.FONT_LOGO,
+            bg=self.BG_COLOR,
+            fg=self.ACCENT_COLOR
         )
         logo_label.pack(anchor='w')
         
         role_label = tk.Label(
             title_frame,
             text=self.get_role_title(),
-            font=("Arial", 12),
-            bg=self.bg_color,
-            fg=self.text_color
+            font=self.FONT_ROLE,
+            bg=self.BG_COLOR,
+            fg=self.TEXT_COLOR
         )
         role_label.pack(anchor='w')
         
         # User info and logout
-        user_frame = tk.Frame(header_frame, bg=self.bg_color)
-        user_frame.pack(side='right', fill='y')
+        user_frame = tk.Frame(header_frame, bg=self.BG_COLOR)
+        user_frame.grid(row=0, column=1, sticky='ne')
         
-        user_info = f"{self.user_data['first_name']} {self.user_data['last_name']}"
-        user_label = tk.Label(
+        self.user_label = tk.Label(
             user_frame,
-            text=f"Welcome, {user_info}",
-            font=("Arial", 12),
-            bg=self.bg_color,
-            fg=self.text_color
+            text=self._welcome_text(),
+            font=self.FONT_ROLE,
+            bg=self.BG_COLOR,
+            fg=self.TEXT_COLOR
         )
-        user_label.pack(anchor='e')
+        self.user_label.pack(anchor='e')
         
         logout_btn = tk.Button(
             user_frame,
             text="Logout",
-            font=("Arial", 10),
-            bg=self.button_color,
-            fg=self.text_color,
+            font=self.FONT_LOGOUT,
+            bg=self.BUTTON_COLOR,
+            fg=self.TEXT_COLOR,
             relief='flat',
             bd=0,
             command=self.logout,
@@ -162,7 +229,7 @@ class BaseDashboard:
         
     def create_main_content(self):
         """Create main content area - to be overridden by subclasses"""
-        content_frame = tk.Frame(self.window, bg=self.bg_color)
+        content_frame = tk.Frame(self.window, bg=self.BG_COLOR)
         content_frame.pack(fill='both', expand=True, padx=20, pady=10)
         
         # Default content
@@ -170,37 +237,80 @@ class BaseDashboard:
             content_frame,
             text="Dashboard content will be implemented based on role",
             font=("Arial", 16),
-            bg=self.bg_color,
-            fg=self.text_color
+            bg=self.BG_COLOR,
+            fg=self.TEXT_COLOR
         )
         default_label.pack(expand=True)
         
+    def _build_card_grid(self, specs):
+        """Build the content area as a grid of cards with one button each"""
+        content_frame = tk.Frame(self.window, bg=self.BG_COLOR)
+        content_frame.pack(fill='both', expand=True, padx=20, pady=10)
+        
+        controls_frame = tk.Frame(content_frame, bg=self.BG_COLOR)
+        controls_frame.pack(fill='both', expand=True)
+        
+        # Weight each grid row/column once rather than once per card
+        for row in {spec[1] for spec in specs}:
+            controls_frame.grid_rowconfigure(row, weight=1)
+        for col in {spec[2] for spec in specs}:
+            controls_frame.grid_columnconfigure(col, weight=1)
+        
+        # One card per idle pass so the window stays responsive while it fills
+        pending = iter(specs)
+        
+        def build_next():
+            spec = next(pending, None)
+            if spec is None or not controls_frame.winfo_exists():
+                return
+            title, row, col, btn_text, callback = spec
+            card = self.create_card(controls_frame, title, row, col)
+            tk.Button(
+                card, text=btn_text, command=partial(callback, self)
+            ).pack(expand=True, fill='both', padx=10, pady=10)
+            self.window.after_idle(build_next)
+        
+        build_next()
+        
+    def _add_card_options(self):
+        """Register the shared card styling with Tk once per process"""
+        if BaseDashboard._card_options_added:
+            return
+        for pattern, value in self.CARD_OPTIONS:
+            self.window.option_add(pattern, value, 'widgetDefault')
+        BaseDashboard._card_options_added = True
+        
+    def create_card(self, parent, title, row, col):
+        """Create a dashboard card; its styling comes from CARD_OPTIONS"""
+        self._add_card_options()
+        card = tk.Frame(parent, class_='Card')
+        card.grid(row=row, column=col, padx=10, pady=10, sticky='nsew')
+        
+        tk.Label(card, text=title).pack(pady=(10, 5))
+        
+        return card
+        
     def create_footer(self):
         """Create dashboard footer"""
-        footer_frame = tk.Frame(self.window, bg=self.bg_color, height=40)
+        footer_frame = tk.Frame(self.window, bg=self.BG_COLOR)
         footer_frame.pack(fill='x', padx=20, pady=5)
-        footer_frame.pack_propagate(False)
+        footer_frame.grid_columnconfigure(0, weight=1)
+        tk.Frame(footer_frame, bg=self.BG_COLOR, height=40, width=1).grid(row=0, column=0, sticky='w')
         
         # Last login info
-        last_login = self.user_data.get('last_login', 'Never')
-        if last_login and last_login != 'Never':
-            try:
-                last_login = last_login.strftime("%Y-%m-%d %H:%M:%S")
-            except:
-                pass
-                
-        footer_label = tk.Label(
+        self.footer_label = tk.Label(
             footer_frame,
-            text=f"Last login: {last_login} | BigBrew Coffee Management System",
-            font=("Arial", 9),
-            bg=self.bg_color,
-            fg=self.accent_color
+            text=self._footer_text(),
+            font=self.FONT_FOOTER,
+            bg=self.BG_COLOR,
+            fg=self.ACCENT_COLOR
         )
-        footer_label.pack(side='left')
+        self.footer_label.grid(row=0, column=0, sticky='w')
         
     def logout(self):
         """Handle logout"""
-        self.window.destroy()
+        # Withdrawn rather than destroyed so the next login can reuse it
+        self.window.withdraw()
         # Show the login window (main app root) again
         if hasattr(self.login_window, 'root'):
             try:
@@ -222,8 +332,9 @@ class BaseDashboard:
         self.logout()
         
     def show(self):
-        """Show the dashboard window"""
-        self.window.mainloop()
+        """Show the dashboard window; the app's root mainloop drives its events"""
+        self.window.deiconify()
+        self.window.focus_set()
 
 class AdminDashboard(
     ProductManagementMixin,
@@ -231,12 +342,14 @@ class AdminDashboard(
     SalesManagementMixin,
     BaseDashboard,
 ):
-    def __init__(self, user_data, login_window):
-        super().__init__(user_data, login_window)
+    def populate(self, user_data):
+        """Rebind to the new user and start again from a fresh overview"""
+        super().populate(user_data)
+        self._show_default_detail()
 
     def create_main_content(self):
         """Create admin-specific content with sidebar navigation"""
-        content_frame = tk.Frame(self.window, bg=self.bg_color)
+        content_frame = tk.Frame(self.window, bg=self.BG_COLOR)
         content_frame.pack(fill='both', expand=True, padx=20, pady=10)
         
         # Sidebar for primary actions
@@ -247,24 +360,24 @@ class AdminDashboard(
         sidebar_title = tk.Label(
             sidebar_frame,
             text="Admin Tools",
-            font=("Arial", 14, "bold"),
+            font=self.FONT_CARD_TITLE,
             bg="#3B2A1F",
-            fg=self.accent_color
+            fg=self.ACCENT_COLOR
         )
         sidebar_title.pack(anchor='w', padx=40, pady=(40, 20))
         
         # Content area on the right
-        self.detail_frame = tk.Frame(content_frame, bg=self.card_bg)
+        self.detail_frame = tk.Frame(content_frame, bg=self.CARD_BG)
         self.detail_frame.pack(side='left', fill='both', expand=True)
         
-        self.detail_header_frame = tk.Frame(self.detail_frame, bg=self.card_bg)
+        self.detail_header_frame = tk.Frame(self.detail_frame, bg=self.CARD_BG)
         self.detail_header_frame.pack(fill='x', padx=30, pady=(30, 10))
         
         self.detail_title = tk.Label(
             self.detail_header_frame,
             text="Welcome to the Administrator Dashboard",
             font=("Arial", 18, "bold"),
-            bg=self.card_bg,
+            bg=self.CARD_BG,
             fg="#4A3728",
             anchor='w',
             justify='left',
@@ -276,7 +389,7 @@ class AdminDashboard(
         self.detail_hint = None
 
         self.graph_button_frame = None
-        self.detail_content_frame = tk.Frame(self.detail_frame, bg=self.card_bg)
+        self.detail_content_frame = tk.Frame(self.detail_frame, bg=self.CARD_BG)
         self.detail_content_frame.pack(fill='both', expand=True, padx=10, pady=12)
         
         self._show_default_detail()
@@ -362,12 +475,12 @@ class AdminDashboard(
             container,
             text=title,
             font=("Arial", 12, "bold"),
-            bg=self.button_color,
-            fg=self.text_color,
+            bg=self.BUTTON_COLOR,
+            fg=self.TEXT_COLOR,
             relief='flat',
             bd=0,
             activebackground="#B45818",
-            activeforeground=self.text_color,
+            activeforeground=self.TEXT_COLOR,
             height=2,
             command=lambda: self._handle_sidebar_action(
                 command,
@@ -402,7 +515,7 @@ class AdminDashboard(
 
         self._clear_detail_content()
 
-        tree_container = tk.Frame(container, bg=self.card_bg)
+        tree_container = tk.Frame(container, bg=self.CARD_BG)
         tree_container.pack(fill='both', expand=True)
 
         columns = ("username", "name", "email", "role", "status", "last_login")
@@ -436,12 +549,12 @@ class AdminDashboard(
         scrollbar.pack(side='right', fill='y')
         self.user_tree.configure(yscrollcommand=scrollbar.set)
 
-        button_frame = tk.Frame(container, bg=self.card_bg)
+        button_frame = tk.Frame(container, bg=self.CARD_BG)
         button_frame.pack(fill='x', pady=(12, 0))
 
         button_specs = [
             ("▶", "Add User", "#28A745", "white", self._open_add_user_dialog),
-            ("✏️", "Edit User", self.button_color, self.text_color, self._open_edit_user_dialog),
+            ("✏️", "Edit User", self.BUTTON_COLOR, self.TEXT_COLOR, self._open_edit_user_dialog),
             ("🔐", "Reset Password", "#6C757D", "white", self._open_reset_password_dialog),
             ("🔁", "Activate/Deactivate", "#DC3545", "white", self._toggle_user_status),
         ]
@@ -555,7 +668,7 @@ class AdminDashboard(
     def _open_user_form_dialog(self, title, user=None):
         dialog = tk.Toplevel(self.window)
         dialog.title(title)
-        dialog.configure(bg=self.card_bg)
+        dialog.configure(bg=self.CARD_BG)
         dialog.resizable(False, False)
         dialog.transient(self.window)
         dialog.grab_set()
@@ -571,14 +684,14 @@ class AdminDashboard(
         except Exception:
             pass
 
-        form = tk.Frame(dialog, bg=self.card_bg)
+        form = tk.Frame(dialog, bg=self.CARD_BG)
         form.pack(fill='both', expand=True, padx=20, pady=20)
 
         entries = {}
 
         def add_field(label, key, row, show=None):
             tk.Label(
-                form, text=label, font=("Arial", 11), bg=self.card_bg, fg="#4A3728"
+                form, text=label, font=("Arial", 11), bg=self.CARD_BG, fg="#4A3728"
             ).grid(row=row, column=0, sticky='w', pady=6)
             entry = tk.Entry(form, font=("Arial", 11), show=show)
             entry.grid(row=row, column=1, sticky='ew', pady=6)
@@ -592,7 +705,7 @@ class AdminDashboard(
         add_field("Last Name:", "last_name", 3)
 
         tk.Label(
-            form, text="Role:", font=("Arial", 11), bg=self.card_bg, fg="#4A3728"
+            form, text="Role:", font=("Arial", 11), bg=self.CARD_BG, fg="#4A3728"
         ).grid(row=4, column=0, sticky='w', pady=6)
         role_var = tk.StringVar(value="staff")
         role_combo = ttk.Combobox(
@@ -612,7 +725,7 @@ class AdminDashboard(
                 form,
                 text="Use 'Reset Password' to update credentials.",
                 font=("Arial", 9, "italic"),
-            bg=self.card_bg,
+            bg=self.CARD_BG,
                 fg="#7A6757",
             ).grid(row=5, column=0, columnspan=2, sticky='w', pady=(8, 0))
 
@@ -672,6 +785,9 @@ class AdminDashboard(
                         (username, email, role, first_name, last_name, user["user_id"]),
                     )
                 connection.commit()
+                if user is not None:
+                    # The role or username may have changed under a cached login row
+                    db.forget_user(user["user_id"])
                 messagebox.showinfo("Success", f"User {'created' if user is None else 'updated'} successfully.")
                 dialog.destroy()
                 self._refresh_user_list()
@@ -681,7 +797,7 @@ class AdminDashboard(
             finally:
                 cursor.close()
 
-        button_row = tk.Frame(dialog, bg=self.card_bg)
+        button_row = tk.Frame(dialog, bg=self.CARD_BG)
         button_row.pack(fill='x', padx=20, pady=(0, 15))
 
         tk.Button(
@@ -716,24 +832,12 @@ class AdminDashboard(
         if not messagebox.askyesno("Confirm", f"Are you sure you want to {action} {user.get('username')}?"):
             return
 
-        connection = self._get_app_connection()
-        if not connection:
-            messagebox.showerror("Database Error", "Unable to connect to the database.")
+        # Through db so the cached login row is dropped along with the write
+        if db.set_user_active(user["user_id"], new_status) is None:
+            messagebox.showerror("Database Error", "Failed to update status. Please try again.")
             return
-        cursor = connection.cursor()
-        try:
-            cursor.execute(
-                "UPDATE users SET is_active = %s WHERE user_id = %s",
-                (new_status, user["user_id"]),
-            )
-            connection.commit()
-            messagebox.showinfo("Success", f"User has been {'deactivated' if new_status == 0 else 'activated'}.")
-            self._refresh_user_list()
-        except Exception as exc:
-            connection.rollback()
-            messagebox.showerror("Database Error", f"Failed to update status: {exc}")
-        finally:
-            cursor.close()
+        messagebox.showinfo("Success", f"User has been {'deactivated' if new_status == 0 else 'activated'}.")
+        self._refresh_user_list()
 
     def _open_reset_password_dialog(self):
         user = self._get_selected_user()
@@ -742,7 +846,7 @@ class AdminDashboard(
 
         dialog = tk.Toplevel(self.window)
         dialog.title(f"Reset Password - {user.get('username')}")
-        dialog.configure(bg=self.card_bg)
+        dialog.configure(bg=self.CARD_BG)
         dialog.resizable(False, False)
         dialog.transient(self.window)
         dialog.grab_set()
@@ -758,25 +862,25 @@ class AdminDashboard(
         except Exception:
             pass
 
-        frame = tk.Frame(dialog, bg=self.card_bg)
+        frame = tk.Frame(dialog, bg=self.CARD_BG)
         frame.pack(fill='both', expand=True, padx=20, pady=20)
 
         tk.Label(
             frame,
             text=f"Reset password for {user.get('username')}",
             font=("Arial", 12, "bold"),
-            bg=self.card_bg,
+            bg=self.CARD_BG,
             fg="#4A3728",
         ).pack(anchor='w', pady=(0, 12))
 
         tk.Label(
-            frame, text="New Password:", font=("Arial", 11), bg=self.card_bg, fg="#4A3728"
+            frame, text="New Password:", font=("Arial", 11), bg=self.CARD_BG, fg="#4A3728"
         ).pack(anchor='w')
         password_entry = tk.Entry(frame, font=("Arial", 11), show="*")
         password_entry.pack(fill='x', pady=(0, 10))
 
         tk.Label(
-            frame, text="Confirm Password:", font=("Arial", 11), bg=self.card_bg, fg="#4A3728"
+            frame, text="Confirm Password:", font=("Arial", 11), bg=self.CARD_BG, fg="#4A3728"
         ).pack(anchor='w')
         confirm_entry = tk.Entry(frame, font=("Arial", 11), show="*")
         confirm_entry.pack(fill='x', pady=(0, 10))
@@ -791,28 +895,15 @@ class AdminDashboard(
                 messagebox.showerror("Validation Error", "Passwords do not match.")
                 return
 
-            connection = self._get_app_connection()
-            if not connection:
-                messagebox.showerror("Database Error", "Unable to connect to the database.")
+            password_hash = bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+            # Through db so the old password stops working at once, not after the cache TTL
+            if db.update_password_hash(user["user_id"], password_hash) is None:
+                messagebox.showerror("Database Error", "Failed to reset password. Please try again.")
                 return
+            messagebox.showinfo("Success", "Password reset successfully.")
+            dialog.destroy()
 
-            cursor = connection.cursor()
-            try:
-                password_hash = bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
-                cursor.execute(
-                    "UPDATE users SET password_hash = %s WHERE user_id = %s",
-                    (password_hash, user["user_id"]),
-                )
-                connection.commit()
-                messagebox.showinfo("Success", "Password reset successfully.")
-                dialog.destroy()
-            except Exception as exc:
-                connection.rollback()
-                messagebox.showerror("Database Error", f"Failed to reset password: {exc}")
-            finally:
-                cursor.close()
-
-        button_bar = tk.Frame(dialog, bg=self.card_bg)
+        button_bar = tk.Frame(dialog, bg=self.CARD_BG)
         button_bar.pack(fill='x', padx=20, pady=(0, 15))
 
         tk.Button(
@@ -841,7 +932,7 @@ class AdminDashboard(
         """Display the default welcome message in detail panel"""
         self.detail_title.config(text="Executive Overview")
         self._clear_detail_content()
-        self.detail_content_frame.configure(bg=self.card_bg)
+        self.detail_content_frame.configure(bg=self.CARD_BG)
         self._render_dashboard_overview()
 
     def _build_chart_figure(self, graph_type):
@@ -877,23 +968,12 @@ class AdminDashboard(
         if not meta:
             return
 
-        data = self._get_graph_data(graph_type)
+        matplotlib = _load_matplotlib()
+        if matplotlib is None:
+            return None
+        Figure, _, FuncFormatter = matplotlib
 
-        if not MATPLOTLIB_AVAILABLE:
-            figure = Figure(figsize=(4.5, 3.0), dpi=100)
-            ax = figure.add_subplot(111)
-            ax.text(
-                0.5,
-                0.5,
-                "Matplotlib not installed.\nInstall with `pip install matplotlib`.",
-                ha="center",
-                va="center",
-                fontsize=10,
-                color="#7A6757",
-            )
-            ax.axis('off')
-            figure.patch.set_facecolor(self.card_bg)
-            return figure
+        data = self._get_graph_data(graph_type)
 
         figure = Figure(figsize=(4.5, 3.0), dpi=100)
         ax = figure.add_subplot(111)
@@ -912,7 +992,7 @@ class AdminDashboard(
                 color="#7A6757",
             )
             ax.axis('off')
-            figure.patch.set_facecolor(self.card_bg)
+            figure.patch.set_facecolor(self.CARD_BG)
             return figure
 
         x_positions = list(range(len(labels)))
@@ -922,7 +1002,7 @@ class AdminDashboard(
         else:
             ax.bar(x_positions, values, color=meta["color"])
 
-        if graph_type == "sales" and FuncFormatter:
+        if graph_type == "sales":
             ax.yaxis.set_major_formatter(FuncFormatter(lambda val, _: f"₱{val:,.0f}"))
 
         ax.set_ylabel(meta["ylabel"])
@@ -930,7 +1010,7 @@ class AdminDashboard(
         ax.set_xticklabels(labels, rotation=90, ha='center')
         ax.grid(True, axis='y', linestyle='--', linewidth=0.5, alpha=0.5)
         ax.set_facecolor("#F8F1D4")
-        figure.patch.set_facecolor(self.card_bg)
+        figure.patch.set_facecolor(self.CARD_BG)
         figure.tight_layout()
 
         return figure
@@ -963,7 +1043,7 @@ class AdminDashboard(
         """Render all dashboard charts simultaneously."""
         total_sales, avg_sales, total_stock = self._calculate_summary_values()
 
-        summary_frame = tk.Frame(self.detail_content_frame, bg=self.card_bg)
+        summary_frame = tk.Frame(self.detail_content_frame, bg=self.CARD_BG)
         summary_frame.pack(fill='x', pady=(0, 12))
 
         summary_specs = [
@@ -982,10 +1062,10 @@ class AdminDashboard(
                 card, text=value, font=("Arial", 16, "bold"), bg="#FFF8DC", fg="#B85C2D"
             ).pack(anchor='w', padx=15, pady=(0, 12))
 
-        container = tk.Frame(self.detail_content_frame, bg=self.card_bg)
+        container = tk.Frame(self.detail_content_frame, bg=self.CARD_BG)
         container.pack(fill='both', expand=True, padx=10, pady=(0, 10))
 
-        charts_frame = tk.Frame(self.detail_content_frame, bg=self.card_bg)
+        charts_frame = tk.Frame(self.detail_content_frame, bg=self.CARD_BG)
         charts_frame.pack(fill='both', expand=True, padx=10, pady=(0, 10))
         charts_frame.columnconfigure(0, weight=1)
         charts_frame.columnconfigure(1, weight=1)
@@ -1015,6 +1095,16 @@ class AdminDashboard(
             ).pack(anchor='w', padx=12, pady=(10, 5))
 
             figure = self._build_chart_figure(key)
+            if figure is None:
+                tk.Label(
+                    card,
+                    text="Matplotlib not installed.\nInstall with `pip install matplotlib`.",
+                    font=("Arial", 10),
+                    bg="#FFF8DC",
+                    fg="#7A6757",
+                ).pack(expand=True, padx=12, pady=12)
+                continue
+            FigureCanvasTkAgg = _load_matplotlib()[1]
             chart_canvas = FigureCanvasTkAgg(figure, master=card)
             chart_canvas.draw()
             chart_canvas.get_tk_widget().pack(fill='both', expand=True, padx=8, pady=8)
@@ -1023,14 +1113,14 @@ class AdminDashboard(
         labels = data.get("labels", [])
         values = data.get("values", [])
 
-        table_frame = tk.Frame(self.detail_content_frame, bg=self.card_bg)
+        table_frame = tk.Frame(self.detail_content_frame, bg=self.CARD_BG)
         table_frame.pack(fill='x', pady=(0, 12))
 
         tk.Label(
             table_frame,
             text="Top Products Snapshot",
             font=("Arial", 12, "bold"),
-            bg=self.card_bg,
+            bg=self.CARD_BG,
             fg="#4A3728",
         ).pack(anchor='w', pady=(0, 6))
 
@@ -1045,7 +1135,7 @@ class AdminDashboard(
             table_frame,
             text=summary_text,
             font=("Arial", 11),
-            bg=self.card_bg,
+            bg=self.CARD_BG,
             fg="#5C4A3A",
             justify='left',
         ).pack(anchor='w')
@@ -1160,7 +1250,7 @@ class AdminDashboard(
         if renderer:
             self.detail_title.config(text=title)
             self._clear_detail_content()
-            self.detail_content_frame.configure(bg=self.card_bg)
+            self.detail_content_frame.configure(bg=self.CARD_BG)
             try:
                 renderer(self.detail_content_frame)
             except Exception as exc:
@@ -1169,7 +1259,7 @@ class AdminDashboard(
         else:
             self.detail_title.config(text=title)
             self._clear_detail_content()
-            self.detail_content_frame.configure(bg=self.card_bg)
+            self.detail_content_frame.configure(bg=self.CARD_BG)
             info_message = description or ""
             if action:
                 try:
@@ -1192,385 +1282,70 @@ class AdminDashboard(
         )
         
 
-class ManagerDashboard(BaseDashboard):
-    def create_main_content(self):
-        """Create manager-specific content"""
-        content_frame = tk.Frame(self.window, bg=self.bg_color)
-        content_frame.pack(fill='both', expand=True, padx=20, pady=10)
-        
-        # Manager controls
-        controls_frame = tk.Frame(content_frame, bg=self.bg_color)
-        controls_frame.pack(fill='both', expand=True)
-        
-        # Staff Management
-        staff_card = self.create_card(controls_frame, "Staff Management", 0, 0)
-        staff_btn = tk.Button(
-            staff_card,
-            text="Manage Staff",
-            font=("Arial", 12),
-            bg=self.button_color,
-            fg=self.text_color,
-            relief='flat',
-            bd=0,
-            command=self.manage_staff,
-            height=2
-        )
-        staff_btn.pack(expand=True, fill='both', padx=10, pady=10)
-        
-        # Sales Reports
-        sales_card = self.create_card(controls_frame, "Sales Reports", 0, 1)
-        sales_btn = tk.Button(
-            sales_card,
-            text="View Sales",
-            font=("Arial", 12),
-            bg=self.button_color,
-            fg=self.text_color,
-            relief='flat',
-            bd=0,
-            command=self.view_sales,
-            height=2
-        )
-        sales_btn.pack(expand=True, fill='both', padx=10, pady=10)
-        
-        # Inventory Overview
-        inventory_card = self.create_card(controls_frame, "Inventory Overview", 1, 0)
-        inventory_btn = tk.Button(
-            inventory_card,
-            text="Check Inventory",
-            font=("Arial", 12),
-            bg=self.button_color,
-            fg=self.text_color,
-            relief='flat',
-            bd=0,
-            command=self.check_inventory,
-            height=2
-        )
-        inventory_btn.pack(expand=True, fill='both', padx=10, pady=10)
-        
-        # Schedule Management
-        schedule_card = self.create_card(controls_frame, "Schedule Management", 1, 1)
-        schedule_btn = tk.Button(
-            schedule_card,
-            text="Manage Schedule",
-            font=("Arial", 12),
-            bg=self.button_color,
-            fg=self.text_color,
-            relief='flat',
-            bd=0,
-            command=self.manage_schedule,
-            height=2
-        )
-        schedule_btn.pack(expand=True, fill='both', padx=10, pady=10)
-        
-    def create_card(self, parent, title, row, col):
-        """Create a dashboard card"""
-        card = tk.Frame(parent, bg=self.card_bg, relief='raised', bd=2)
-        card.grid(row=row, column=col, padx=10, pady=10, sticky='nsew')
-        parent.grid_rowconfigure(row, weight=1)
-        parent.grid_columnconfigure(col, weight=1)
-        
-        title_label = tk.Label(
-            card,
-            text=title,
-            font=("Arial", 14, "bold"),
-            bg=self.card_bg,
-            fg="#4A3728"
-        )
-        title_label.pack(pady=(10, 5))
-        
-        return card
-        
-    def manage_staff(self):
-        messagebox.showinfo("Staff Management", "Staff management functionality will be implemented here")
-        
-    def view_sales(self):
-        messagebox.showinfo("Sales Reports", "Sales reporting functionality will be implemented here")
-        
-    def check_inventory(self):
-        messagebox.showinfo("Inventory", "Inventory overview functionality will be implemented here")
-        
-    def manage_schedule(self):
-        messagebox.showinfo("Schedule", "Schedule management functionality will be implemented here")
-
-class CashierDashboard(BaseDashboard):
-    def create_main_content(self):
-        """Create cashier-specific content"""
-        content_frame = tk.Frame(self.window, bg=self.bg_color)
-        content_frame.pack(fill='both', expand=True, padx=20, pady=10)
-        
-        # Cashier controls
-        controls_frame = tk.Frame(content_frame, bg=self.bg_color)
-        controls_frame.pack(fill='both', expand=True)
-        
-        # Point of Sale
-        pos_card = self.create_card(controls_frame, "Point of Sale", 0, 0)
-        pos_btn = tk.Button(
-            pos_card,
-            text="Open POS",
-            font=("Arial", 12),
-            bg=self.button_color,
-            fg=self.text_color,
-            relief='flat',
-            bd=0,
-            command=self.open_pos,
-            height=2
-        )
-        pos_btn.pack(expand=True, fill='both', padx=10, pady=10)
-        
-        # Daily Sales
-        sales_card = self.create_card(controls_frame, "Daily Sales", 0, 1)
-        sales_btn = tk.Button(
-            sales_card,
-            text="View Today's Sales",
-            font=("Arial", 12),
-            bg=self.button_color,
-            fg=self.text_color,
-            relief='flat',
-            bd=0,
-            command=self.view_daily_sales,
+def _coming_soon(title, message):
+    """Card callback for a feature that is not built yet"""
+    def callback(dashboard):
+        messagebox.showinfo(title, message)
+    return callback
 
-            height=2
-        )
-        sales_btn.pack(expand=True, fill='both', padx=10, pady=10)
-        
-        # Customer Management
-        customer_card = self.create_card(controls_frame, "Customer Management", 1, 0)
-        customer_btn = tk.Button(
-            customer_card,
-            text="Manage Customers",
-            font=("Arial", 12),
-            bg=self.button_color,
-            fg=self.text_color,
-            relief='flat',
-            bd=0,
-            command=self.manage_customers,
-            height=2
-        )
-        customer_btn.pack(expand=True, fill='both', padx=10, pady=10)
-        
-        # Receipt History
-        receipt_card = self.create_card(controls_frame, "Receipt History", 1, 1)
-        receipt_btn = tk.Button(
-            receipt_card,
-            text="View Receipts",
-            font=("Arial", 12),
-            bg=self.button_color,
-            fg=self.text_color,
-            relief='flat',
-            bd=0,
-            command=self.view_receipts,
-            height=2
-        )
-        receipt_btn.pack(expand=True, fill='both', padx=10, pady=10)
-        
-    def create_card(self, parent, title, row, col):
-        """Create a dashboard card"""
-        card = tk.Frame(parent, bg=self.card_bg, relief='raised', bd=2)
-        card.grid(row=row, column=col, padx=10, pady=10, sticky='nsew')
-        parent.grid_rowconfigure(row, weight=1)
-        parent.grid_columnconfigure(col, weight=1)
-        
-        title_label = tk.Label(
-            card,
-            text=title,
-            font=("Arial", 14, "bold"),
-            bg=self.card_bg,
-            fg="#4A3728"
-        )
-        title_label.pack(pady=(10, 5))
-        
-        return card
-        
-    def open_pos(self):
-        messagebox.showinfo("Point of Sale", "POS system will be implemented here")
-        
-    def view_daily_sales(self):
-        messagebox.showinfo("Daily Sales", "Daily sales reporting will be implemented here")
-        
-    def manage_customers(self):
-        messagebox.showinfo("Customer Management", "Customer management will be implemented here")
-        
-    def view_receipts(self):
-        messagebox.showinfo("Receipt History", "Receipt history will be implemented here")
 
-class BaristaDashboard(BaseDashboard):
-    def create_main_content(self):
-        """Create barista-specific content"""
-        content_frame = tk.Frame(self.window, bg=self.bg_color)
-        content_frame.pack(fill='both', expand=True, padx=20, pady=10)
-        
-        # Barista controls
-        controls_frame = tk.Frame(content_frame, bg=self.bg_color)
-        controls_frame.pack(fill='both', expand=True)
-        
-        # Order Queue
-        orders_card = self.create_card(controls_frame, "Order Queue", 0, 0)
-        orders_btn = tk.Button(
-            orders_card,
-            text="View Orders",
-            font=("Arial", 12),
-            bg=self.button_color,
-            fg=self.text_color,
-            relief='flat',
-            bd=0,
-            command=self.view_orders,
-            height=2
-        )
-        orders_btn.pack(expand=True, fill='both', padx=10, pady=10)
-        
-        # Recipe Book
-        recipe_card = self.create_card(controls_frame, "Recipe Book", 0, 1)
-        recipe_btn = tk.Button(
-            recipe_card,
-            text="View Recipes",
-            font=("Arial", 12),
-            bg=self.button_color,
-            fg=self.text_color,
-            relief='flat',
-            bd=0,
-            command=self.view_recipes,
-            height=2
-        )
-        recipe_btn.pack(expand=True, fill='both', padx=10, pady=10)
-        
-        # Inventory Check
-        inventory_card = self.create_card(controls_frame, "Inventory Check", 1, 0)
-        inventory_btn = tk.Button(
-            inventory_card,
-            text="Check Ingredients",
-            font=("Arial", 12),
-            bg=self.button_color,
-            fg=self.text_color,
-            relief='flat',
-            bd=0,
-            command=self.check_ingredients,
-            height=2
-        )
-        inventory_btn.pack(expand=True, fill='both', padx=10, pady=10)
-        
-        # Time Tracking
-        time_card = self.create_card(controls_frame, "Time Tracking", 1, 1)
-        time_btn = tk.Button(
-            time_card,
-            text="Clock In/Out",
-            font=("Arial", 12),
-            bg=self.button_color,
-            fg=self.text_color,
-            relief='flat',
-            bd=0,
-            command=self.time_tracking,
-            height=2
-        )
-        time_btn.pack(expand=True, fill='both', padx=10, pady=10)
-        
-    def create_card(self, parent, title, row, col):
-        """Create a dashboard card"""
-        card = tk.Frame(parent, bg=self.card_bg, relief='raised', bd=2)
-        card.grid(row=row, column=col, padx=10, pady=10, sticky='nsew')
-        parent.grid_rowconfigure(row, weight=1)
-        parent.grid_columnconfigure(col, weight=1)
-        
-        title_label = tk.Label(
-            card,
-            text=title,
-            font=("Arial", 14, "bold"),
-            bg=self.card_bg,
-            fg="#4A3728"
-        )
-        title_label.pack(pady=(10, 5))
-        
-        return card
-        
-    def view_orders(self):
-        messagebox.showinfo("Order Queue", "Order management will be implemented here")
-        
-    def view_recipes(self):
-        messagebox.showinfo("Recipe Book", "Recipe management will be implemented here")
-        
-    def check_ingredients(self):
-        messagebox.showinfo("Inventory Check", "Ingredient inventory will be implemented here")
-        
-    def time_tracking(self):
-        messagebox.showinfo("Time Tracking", "Time tracking will be implemented here")
+class RoleDashboard(BaseDashboard):
+    """Card-grid dashboard for the non-admin staff roles, driven by ROLE_SPECS"""
 
-class InventoryManagerDashboard(BaseDashboard):
     def create_main_content(self):
-        """Create inventory manager-specific content"""
-        content_frame = tk.Frame(self.window, bg=self.bg_color)
-        content_frame.pack(fill='both', expand=True, padx=20, pady=10)
-        
-        # Inventory manager controls
-        controls_frame = tk.Frame(content_frame, bg=self.bg_color)
-        controls_frame.pack(fill='both', expand=True)
-        
-        # Inventory Management
-        inventory_card = self.create_card(controls_frame, "Inventory Management", 0, 0)
-        inventory_btn = tk.Button(
-            inventory_card,
-            text="Manage Inventory",
-            font=("Arial", 12),
-            bg=self.button_color,
-            fg=self.text_color,
-            relief='flat',
-            bd=0,
-            command=self.manage_inventory,
-            height=2
-        )
-        inventory_btn.pack(expand=True, fill='both', padx=10, pady=10)
-        
-        # Stock Alerts
-        alerts_card = self.create_card(controls_frame, "Stock Alerts", 0, 1)
-        alerts_btn = tk.Button(
-            alerts_card,
-            text="View Alerts",
-            font=("Arial", 12),
-            bg=self.button_color,
-            fg=self.text_color,
-            relief='flat',
-            bd=0,
-            command=self.view_alerts,
-            height=2
-        )
-        alerts_btn.pack(expand=True, fill='both', padx=10, pady=10)
-        
-        # Purchase Orders
-        orders_card = self.create_card(controls_frame, "Purchase Orders", 1, 1)
-        orders_btn = tk.Button(
-            orders_card,
-            text="Manage Orders",
-            font=("Arial", 12),
-            bg=self.button_color,
-            fg=self.text_color,
-            relief='flat',
-            bd=0,
-            command=self.manage_purchase_orders,
-            height=2
-        )
-        orders_btn.pack(expand=True, fill='both', padx=10, pady=10)
-        
-    def create_card(self, parent, title, row, col):
-        """Create a dashboard card"""
-        card = tk.Frame(parent, bg=self.card_bg, relief='raised', bd=2)
-        card.grid(row=row, column=col, padx=10, pady=10, sticky='nsew')
-        parent.grid_rowconfigure(row, weight=1)
-        parent.grid_columnconfigure(col, weight=1)
-        
-        title_label = tk.Label(
-            card,
-            text=title,
-            font=("Arial", 14, "bold"),
-            bg=self.card_bg,
-            fg="#4A3728"
-        )
-        title_label.pack(pady=(10, 5))
-        
-        return card
-        
-    def manage_inventory(self):
-        messagebox.showinfo("Inventory Management", "Inventory management will be implemented here")
-        
-    def view_alerts(self):
-        messagebox.showinfo("Stock Alerts", "Stock alert system will be implemented here")
-
-    def manage_purchase_orders(self):
-        messagebox.showinfo("Purchase Orders", "Purchase order management will be implemented here")
+        """Create role-specific content from the role's card table"""
+        self._build_card_grid(self.cards)
+
+
+# (card title, row, column, button text, callback(dashboard))
+MANAGER_CARDS = (
+    ("Staff Management", 0, 0, "Manage Staff",
+     _coming_soon("Staff Management", "Staff management functionality will be implemented here")),
+    ("Sales Reports", 0, 1, "View Sales",
+     _coming_soon("Sales Reports", "Sales reporting functionality will be implemented here")),
+    ("Inventory Overview", 1, 0, "Check Inventory",
+     _coming_soon("Inventory", "Inventory overview functionality will be implemented here")),
+    ("Schedule Management", 1, 1, "Manage Schedule",
+     _coming_soon("Schedule", "Schedule management functionality will be implemented here")),
+)
+
+CASHIER_CARDS = (
+    ("Point of Sale", 0, 0, "Open POS",
+     _coming_soon("Point of Sale", "POS system will be implemented here")),
+    ("Daily Sales", 0, 1, "View Today's Sales",
+     _coming_soon("Daily Sales", "Daily sales reporting will be implemented here")),
+    ("Customer Management", 1, 0, "Manage Customers",
+     _coming_soon("Customer Management", "Customer management will be implemented here")),
+    ("Receipt History", 1, 1, "View Receipts",
+     _coming_soon("Receipt History", "Receipt history will be implemented here")),
+)
+
+BARISTA_CARDS = (
+    ("Order Queue", 0, 0, "View Orders",
+     _coming_soon("Order Queue", "Order management will be implemented here")),
+    ("Recipe Book", 0, 1, "View Recipes",
+     _coming_soon("Recipe Book", "Recipe management will be implemented here")),
+    ("Inventory Check", 1, 0, "Check Ingredients",
+     _coming_soon("Inventory Check", "Ingredient inventory will be implemented here")),
+    ("Time Tracking", 1, 1, "Clock In/Out",
+     _coming_soon("Time Tracking", "Time tracking will be implemented here")),
+)
+
+INVENTORY_MANAGER_CARDS = (
+    ("Inventory Management", 0, 0, "Manage Inventory",
+     _coming_soon("Inventory Management", "Inventory management will be implemented here")),
+    ("Stock Alerts", 0, 1, "View Alerts",
+     _coming_soon("Stock Alerts", "Stock alert system will be implemented here")),
+    ("Purchase Orders", 1, 1, "Manage Orders",
+     _coming_soon("Purchase Orders", "Purchase order management will be implemented here")),
+)
+
+
+# Role -> (dashboard class, window title, card table); shared by the factory and headers
+ROLE_SPECS = {
+    'admin': (AdminDashboard, 'Administrator Dashboard', ()),
+    'manager': (RoleDashboard, 'Manager Dashboard', MANAGER_CARDS),
+    'cashier': (RoleDashboard, 'Cashier Dashboard', CASHIER_CARDS),
+    'barista': (RoleDashboard, 'Barista Dashboard', BARISTA_CARDS),
+    'inventory_manager': (RoleDashboard, 'Inventory Manager Dashboard', INVENTORY_MANAGER_CARDS),
+}
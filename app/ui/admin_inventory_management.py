@@ -17,13 +17,13 @@ class InventoryManagementMixin:
             container = parent
             for child in container.winfo_children():
                 child.destroy()
-            container.configure(bg=self.bg_color)
+            container.configure(bg=self.BG_COLOR)
             self.inventory_window = self.window
         else:
             self.inventory_window = tk.Toplevel(self.window)
             self.inventory_window.title("Inventory Management")
             self.inventory_window.geometry("1200x700")
-            self.inventory_window.configure(bg=self.bg_color)
+            self.inventory_window.configure(bg=self.BG_COLOR)
 
             def close_inventory():
                 try:
@@ -49,7 +49,7 @@ class InventoryManagementMixin:
             container = self.inventory_window
 
         pad = 0 if embedded else 20
-        frame_bg = self.card_bg if embedded else self.bg_color
+        frame_bg = self.CARD_BG if embedded else self.BG_COLOR
 
         main_frame = tk.Frame(container, bg=frame_bg, bd=0, highlightthickness=0)
         main_frame.pack(fill="both", expand=True, padx=pad, pady=(pad, pad))
@@ -64,17 +64,17 @@ class InventoryManagementMixin:
                 text="Inventory Management - Stock Tracking",
                 font=("Arial", 18, "bold"),
                 bg=frame_bg,
-                fg=self.accent_color,
+                fg=self.ACCENT_COLOR,
             )
             title_label.pack(side="left")
 
-        list_frame = tk.Frame(main_frame, bg=self.card_bg, relief="flat", bd=0)
+        list_frame = tk.Frame(main_frame, bg=self.CARD_BG, relief="flat", bd=0)
         list_frame.pack(fill="both", expand=True, padx=0, pady=0)
 
-        inner_wrapper = tk.Frame(list_frame, bg=self.card_bg, bd=0, highlightthickness=0)
+        inner_wrapper = tk.Frame(list_frame, bg=self.CARD_BG, bd=0, highlightthickness=0)
         inner_wrapper.pack(fill="both", expand=True, padx=0, pady=0)
 
-        tree_frame = tk.Frame(inner_wrapper, bg=self.card_bg, bd=0, highlightthickness=0)
+        tree_frame = tk.Frame(inner_wrapper, bg=self.CARD_BG, bd=0, highlightthickness=0)
         tree_frame.pack(fill="both", expand=True, padx=0, pady=(0, 0))
 
         scrollbar_y = tk.Scrollbar(tree_frame, orient="vertical")
@@ -120,15 +120,15 @@ class InventoryManagementMixin:
         scrollbar_y.pack(side="right", fill="y")
         scrollbar_x.pack(side="bottom", fill="x")
 
-        button_frame = tk.Frame(inner_wrapper, bg=self.card_bg, bd=0, highlightthickness=0)
+        button_frame = tk.Frame(inner_wrapper, bg=self.CARD_BG, bd=0, highlightthickness=0)
         button_frame.pack(fill="x", pady=(6, 8))
 
         update_stock_btn = tk.Button(
             button_frame,
             text="📦 Update Stock",
             font=("Arial", 11),
-            bg=self.button_color,
-            fg=self.text_color,
+            bg=self.BUTTON_COLOR,
+            fg=self.TEXT_COLOR,
             relief="flat",
             bd=0,
             command=self.update_stock_window,
@@ -217,7 +217,7 @@ class InventoryManagementMixin:
         update_window = tk.Toplevel(self.inventory_window)
         update_window.title("Update Stock")
         update_window.geometry("400x300")
-        update_window.configure(bg=self.bg_color)
+        update_window.configure(bg=self.BG_COLOR)
 
         update_window.update_idletasks()
         width, height = 400, 300
@@ -227,14 +227,14 @@ class InventoryManagementMixin:
         y = (screen_height - height) // 2
         update_window.geometry(f"{width}x{height}+{x}+{y}")
 
-        form_frame = tk.Frame(update_window, bg=self.card_bg, relief="raised", bd=2)
+        form_frame = tk.Frame(update_window, bg=self.CARD_BG, relief="raised", bd=2)
         form_frame.pack(fill="both", expand=True, padx=20, pady=20)
 
         tk.Label(
             form_frame,
             text=f"Update Stock: {product_name}",
             font=("Arial", 14, "bold"),
-            bg=self.card_bg,
+            bg=self.CARD_BG,
             fg="#4A3728",
         ).pack(pady=20)
 
@@ -242,7 +242,7 @@ class InventoryManagementMixin:
             form_frame,
             text=f"Current Stock: {current_stock}",
             font=("Arial", 12),
-            bg=self.card_bg,
+            bg=self.CARD_BG,
             fg="#4A3728",
         ).pack(pady=10)
 
@@ -250,7 +250,7 @@ class InventoryManagementMixin:
             form_frame,
             text="New Stock Quantity:",
             font=("Arial", 11, "bold"),
-            bg=self.card_bg,
+            bg=self.CARD_BG,
             fg="#4A3728",
         ).pack(pady=(20, 5))
 
@@ -260,7 +260,7 @@ class InventoryManagementMixin:
         stock_entry.select_range(0, tk.END)
         stock_entry.focus()
 
-        button_frame = tk.Frame(form_frame, bg=self.card_bg)
+        button_frame = tk.Frame(form_frame, bg=self.CARD_BG)
         button_frame.pack(pady=20)
 
         def save_stock():
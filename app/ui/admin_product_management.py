@@ -224,13 +224,13 @@ class ProductManagementMixin:
             container = parent
             for child in container.winfo_children():
                 child.destroy()
-            container.configure(bg=self.bg_color)
+            container.configure(bg=self.BG_COLOR)
             self.product_window = self.window
         else:
             self.product_window = tk.Toplevel(self.window)
             self.product_window.title("Product Management")
             self.product_window.geometry("1270x790")
-            self.product_window.configure(bg=self.bg_color)
+            self.product_window.configure(bg=self.BG_COLOR)
 
             self.product_window.update_idletasks()
             width, height = 1270, 790
@@ -243,7 +243,7 @@ class ProductManagementMixin:
             container = self.product_window
 
         pad = 0 if embedded else 0
-        frame_bg = self.card_bg if embedded else self.bg_color
+        frame_bg = self.CARD_BG if embedded else self.BG_COLOR
 
         main_frame = tk.Frame(container, bg=frame_bg, bd=0, highlightthickness=0)
         main_frame.pack(fill="both", expand=True, padx=pad, pady=(pad, pad))
@@ -263,13 +263,13 @@ class ProductManagementMixin:
             pady=5,
         ).pack(side="right")
 
-        list_frame = tk.Frame(main_frame, bg=self.card_bg, relief="flat", bd=0)
+        list_frame = tk.Frame(main_frame, bg=self.CARD_BG, relief="flat", bd=0)
         list_frame.pack(fill="both", expand=True, padx=0, pady=0)
 
-        inner_wrapper = tk.Frame(list_frame, bg=self.card_bg, bd=0, highlightthickness=0)
+        inner_wrapper = tk.Frame(list_frame, bg=self.CARD_BG, bd=0, highlightthickness=0)
         inner_wrapper.pack(fill="both", expand=True, padx=0, pady=(0, 0))
 
-        tree_frame = tk.Frame(inner_wrapper, bg=self.card_bg, bd=0, highlightthickness=0)
+        tree_frame = tk.Frame(inner_wrapper, bg=self.CARD_BG, bd=0, highlightthickness=0)
         tree_frame.pack(fill="both", expand=True, padx=0, pady=(0, 0))
 
         scrollbar_y = tk.Scrollbar(tree_frame, orient="vertical")
@@ -315,15 +315,15 @@ class ProductManagementMixin:
         scrollbar_y.pack(side="right", fill="y")
         scrollbar_x.pack(side="bottom", fill="x")
 
-        button_frame = tk.Frame(inner_wrapper, bg=self.card_bg, bd=0, highlightthickness=0)
+        button_frame = tk.Frame(inner_wrapper, bg=self.CARD_BG, bd=0, highlightthickness=0)
         button_frame.pack(fill="x", pady=(4, 6))
 
         edit_btn = tk.Button(
             button_frame,
             text="✏️ Edit Product",
             font=("Arial", 11),
-            bg=self.button_color,
-            fg=self.text_color,
+            bg=self.BUTTON_COLOR,
+            fg=self.TEXT_COLOR,
             relief="flat",
             bd=0,
             command=self.edit_product_window,
@@ -395,7 +395,7 @@ class ProductManagementMixin:
         add_window = tk.Toplevel(self.product_window)
         add_window.title("Add New Product")
         add_window.geometry("600x700")
-        add_window.configure(bg=self.bg_color)
+        add_window.configure(bg=self.BG_COLOR)
 
         add_window.update_idletasks()
         width, height = 600, 700
@@ -405,14 +405,14 @@ class ProductManagementMixin:
         y = (screen_height - height) // 2
         add_window.geometry(f"{width}x{height}+{x}+{y}")
 
-        form_frame = tk.Frame(add_window, bg=self.card_bg, relief="raised", bd=2)
+        form_frame = tk.Frame(add_window, bg=self.CARD_BG, relief="raised", bd=2)
         form_frame.pack(fill="both", expand=True, padx=20, pady=20)
 
         tk.Label(
             form_frame,
             text="Add New Product",
             font=("Arial", 16, "bold"),
-            bg=self.card_bg,
+            bg=self.CARD_BG,
             fg="#4A3728",
         ).pack(pady=20)
 
@@ -420,7 +420,7 @@ class ProductManagementMixin:
             form_frame,
             text="Category:",
             font=("Arial", 11, "bold"),
-            bg=self.card_bg,
+            bg=self.CARD_BG,
             fg="#4A3728",
         ).pack(anchor="w", padx=20, pady=(10, 5))
 
@@ -444,7 +444,7 @@ class ProductManagementMixin:
             form_frame,
             text="Product Code:",
             font=("Arial", 11, "bold"),
-            bg=self.card_bg,
+            bg=self.CARD_BG,
             fg="#4A3728",
         ).pack(anchor="w", padx=20, pady=(10, 5))
 
@@ -455,7 +455,7 @@ class ProductManagementMixin:
             form_frame,
             text="Product Name:",
             font=("Arial", 11, "bold"),
-            bg=self.card_bg,
+            bg=self.CARD_BG,
             fg="#4A3728",
         ).pack(anchor="w", padx=20, pady=(10, 5))
 
@@ -466,14 +466,14 @@ class ProductManagementMixin:
             form_frame,
             text="Description:",
             font=("Arial", 11, "bold"),
-            bg=self.card_bg,
+            bg=self.CARD_BG,
             fg="#4A3728",
         ).pack(anchor="w", padx=20, pady=(10, 5))
 
         desc_text = tk.Text(form_frame, font=("Arial", 11), width=40, height=4)
         desc_text.pack(padx=20, pady=(0, 10))
 
-        price_frame = tk.Frame(form_frame, bg=self.card_bg)
+        price_frame = tk.Frame(form_frame, bg=self.CARD_BG)
         price_frame.pack(padx=20, pady=(10, 10), fill="x")
         price_frame.columnconfigure(0, weight=1)
         price_frame.columnconfigure(1, weight=1)
@@ -482,7 +482,7 @@ class ProductManagementMixin:
             price_frame,
             text="Price Regular (₱):",
             font=("Arial", 11, "bold"),
-            bg=self.card_bg,
+            bg=self.CARD_BG,
             fg="#4A3728",
         ).grid(row=0, column=0, sticky="w")
 
@@ -490,7 +490,7 @@ class ProductManagementMixin:
             price_frame,
             text="Price Large (₱):",
             font=("Arial", 11, "bold"),
-            bg=self.card_bg,
+            bg=self.CARD_BG,
             fg="#4A3728",
         ).grid(row=0, column=1, sticky="w", padx=(20, 0))
 
@@ -504,7 +504,7 @@ class ProductManagementMixin:
             form_frame,
             text="Initial Stock Quantity:",
             font=("Arial", 11, "bold"),
-            bg=self.card_bg,
+            bg=self.CARD_BG,
             fg="#4A3728",
         ).pack(anchor="w", padx=20, pady=(10, 5))
 
@@ -526,11 +526,11 @@ class ProductManagementMixin:
             form_frame,
             text="Image Path (Optional):",
             font=("Arial", 11, "bold"),
-            bg=self.card_bg,
+            bg=self.CARD_BG,
             fg="#4A3728",
         ).pack(anchor="w", padx=20, pady=(10, 5))
 
-        image_frame = tk.Frame(form_frame, bg=self.card_bg)
+        image_frame = tk.Frame(form_frame, bg=self.CARD_BG)
         image_frame.pack(padx=20, pady=(0, 10), fill="x")
 
         image_entry = tk.Entry(
@@ -550,7 +550,7 @@ class ProductManagementMixin:
         )
         browse_btn.pack(side="right", padx=(5, 0))
 
-        button_frame = tk.Frame(form_frame, bg=self.card_bg)
+        button_frame = tk.Frame(form_frame, bg=self.CARD_BG)
         button_frame.pack(pady=20)
 
         def save_product():
@@ -675,7 +675,7 @@ class ProductManagementMixin:
         edit_window = tk.Toplevel(self.product_window)
         edit_window.title("Edit Product")
         edit_window.geometry("600x700")
-        edit_window.configure(bg=self.bg_color)
+        edit_window.configure(bg=self.BG_COLOR)
 
         edit_window.update_idletasks()
         width, height = 600, 700
@@ -685,14 +685,14 @@ class ProductManagementMixin:
         y = (screen_height - height) // 2
         edit_window.geometry(f"{width}x{height}+{x}+{y}")
 
-        form_frame = tk.Frame(edit_window, bg=self.card_bg, relief="raised", bd=2)
+        form_frame = tk.Frame(edit_window, bg=self.CARD_BG, relief="raised", bd=2)
         form_frame.pack(fill="both", expand=True, padx=20, pady=20)
 
         tk.Label(
             form_frame,
             text=f"Edit Product: {product['name']}",
             font=("Arial", 16, "bold"),
-            bg=self.card_bg,
+            bg=self.CARD_BG,
             fg="#4A3728",
         ).pack(pady=20)
 
@@ -700,7 +700,7 @@ class ProductManagementMixin:
             form_frame,
             text="Category:",
             font=("Arial", 11, "bold"),
-            bg=self.card_bg,
+            bg=self.CARD_BG,
             fg="#4A3728",
         ).pack(anchor="w", padx=20, pady=(10, 5))
 
@@ -738,7 +738,7 @@ class ProductManagementMixin:
             form_frame,
             text="Product Code:",
             font=("Arial", 11, "bold"),
-            bg=self.card_bg,
+            bg=self.CARD_BG,
             fg="#4A3728",
         ).pack(anchor="w", padx=20, pady=(10, 5))
 
@@ -750,7 +750,7 @@ class ProductManagementMixin:
             form_frame,
             text="Product Name:",
             font=("Arial", 11, "bold"),
-            bg=self.card_bg,
+            bg=self.CARD_BG,
             fg="#4A3728",
         ).pack(anchor="w", padx=20, pady=(10, 5))
 
@@ -762,7 +762,7 @@ class ProductManagementMixin:
             form_frame,
             text="Description:",
             font=("Arial", 11, "bold"),
-            bg=self.card_bg,
+            bg=self.CARD_BG,
             fg="#4A3728",
         ).pack(anchor="w", padx=20, pady=(10, 5))
 
@@ -770,7 +770,7 @@ class ProductManagementMixin:
         desc_text.insert("1.0", product.get("description", ""))
         desc_text.pack(padx=20, pady=(0, 10))
 
-        price_frame = tk.Frame(form_frame, bg=self.card_bg)
+        price_frame = tk.Frame(form_frame, bg=self.CARD_BG)
         price_frame.pack(padx=20, pady=(10, 10), fill="x")
         price_frame.columnconfigure(0, weight=1)
         price_frame.columnconfigure(1, weight=1)
@@ -779,7 +779,7 @@ class ProductManagementMixin:
             price_frame,
             text="Price Regular (₱):",
             font=("Arial", 11, "bold"),
-            bg=self.card_bg,
+            bg=self.CARD_BG,
             fg="#4A3728",
         ).grid(row=0, column=0, sticky="w")
 
@@ -787,7 +787,7 @@ class ProductManagementMixin:
             price_frame,
             text="Price Large (₱):",
             font=("Arial", 11, "bold"),
-            bg=self.card_bg,
+            bg=self.CARD_BG,
             fg="#4A3728",
         ).grid(row=0, column=1, sticky="w", padx=(20, 0))
 
@@ -813,11 +813,11 @@ class ProductManagementMixin:
             form_frame,
             text="Image Path (Optional):",
             font=("Arial", 11, "bold"),
-            bg=self.card_bg,
+            bg=self.CARD_BG,
             fg="#4A3728",
         ).pack(anchor="w", padx=20, pady=(10, 5))
 
-        image_frame = tk.Frame(form_frame, bg=self.card_bg)
+        image_frame = tk.Frame(form_frame, bg=self.CARD_BG)
         image_frame.pack(padx=20, pady=(0, 10), fill="x")
 
         image_entry = tk.Entry(
@@ -837,7 +837,7 @@ class ProductManagementMixin:
         )
         browse_btn.pack(side="right", padx=(5, 0))
 
-        button_frame = tk.Frame(form_frame, bg=self.card_bg)
+        button_frame = tk.Frame(form_frame, bg=self.CARD_BG)
         button_frame.pack(pady=20)
 
         def update_product():
@@ -916,8 +916,8 @@ class ProductManagementMixin:
             button_frame,
             text="Update Product",
             font=("Arial", 12, "bold"),
-            bg=self.button_color,
-            fg=self.text_color,
+            bg=self.BUTTON_COLOR,
+            fg=self.TEXT_COLOR,
             relief="flat",
             command=update_product,
             width=15,
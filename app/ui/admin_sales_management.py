@@ -222,13 +222,13 @@ class SalesManagementMixin:
             container = parent
             for child in container.winfo_children():
                 child.destroy()
-            container.configure(bg=self.bg_color)
+            container.configure(bg=self.BG_COLOR)
             self.sales_window = self.window
         else:
             self.sales_window = tk.Toplevel(self.window)
             self.sales_window.title("Sales Management")
             self.sales_window.geometry("1400x800")
-            self.sales_window.configure(bg=self.bg_color)
+            self.sales_window.configure(bg=self.BG_COLOR)
 
             self.sales_window.update_idletasks()
             width, height = 1400, 800
@@ -241,7 +241,7 @@ class SalesManagementMixin:
             container = self.sales_window
 
         pad = 0 if embedded else 0
-        frame_bg = self.card_bg if embedded else self.bg_color
+        frame_bg = self.CARD_BG if embedded else self.BG_COLOR
 
         top_frame = tk.Frame(container, bg=frame_bg, bd=0, highlightthickness=0)
         top_frame.pack(fill="x", padx=pad, pady=(pad, 8))
@@ -252,7 +252,7 @@ class SalesManagementMixin:
                 text="Sales Management - View and Manage Transactions",
                 font=("Arial", 18, "bold"),
                 bg=frame_bg,
-                fg=self.accent_color,
+                fg=self.ACCENT_COLOR,
             )
             title_label.pack(side="left")
 
@@ -263,8 +263,8 @@ class SalesManagementMixin:
             filter_frame,
             text="Date Range:",
             font=("Arial", 10),
-            bg=self.bg_color,
-            fg=self.text_color,
+            bg=self.BG_COLOR,
+            fg=self.TEXT_COLOR,
         ).pack(side="left", padx=5)
 
         date_filter_var = tk.StringVar(value="All")
@@ -281,13 +281,13 @@ class SalesManagementMixin:
         main_frame = tk.Frame(container, bg=frame_bg, bd=0, highlightthickness=0)
         main_frame.pack(fill="both", expand=True, padx=pad, pady=(0 if embedded else pad, pad))
 
-        list_frame = tk.Frame(main_frame, bg=self.card_bg, relief="flat", bd=0)
+        list_frame = tk.Frame(main_frame, bg=self.CARD_BG, relief="flat", bd=0)
         list_frame.pack(fill="both", expand=True, padx=0, pady=0)
 
-        inner_wrapper = tk.Frame(list_frame, bg=self.card_bg, bd=0, highlightthickness=0)
+        inner_wrapper = tk.Frame(list_frame, bg=self.CARD_BG, bd=0, highlightthickness=0)
         inner_wrapper.pack(fill="both", expand=True, padx=0, pady=0)
 
-        tree_frame = tk.Frame(inner_wrapper, bg=self.card_bg, bd=0, highlightthickness=0)
+        tree_frame = tk.Frame(inner_wrapper, bg=self.CARD_BG, bd=0, highlightthickness=0)
         tree_frame.pack(fill="both", expand=True, padx=0, pady=(0, 0))
 
         scrollbar_y = tk.Scrollbar(tree_frame, orient="vertical")
@@ -325,15 +325,15 @@ class SalesManagementMixin:
         scrollbar_y.pack(side="right", fill="y")
         scrollbar_x.pack(side="bottom", fill="x")
 
-        button_frame = tk.Frame(inner_wrapper, bg=self.card_bg, bd=0, highlightthickness=0)
+        button_frame = tk.Frame(inner_wrapper, bg=self.CARD_BG, bd=0, highlightthickness=0)
         button_frame.pack(fill="x", pady=(6, 8))
 
         view_details_btn = tk.Button(
             button_frame,
             text="📋 View Details",
             font=("Arial", 11),
-            bg=self.button_color,
-            fg=self.text_color,
+            bg=self.BUTTON_COLOR,
+            fg=self.TEXT_COLOR,
             relief="flat",
             bd=0,
             command=self.view_sale_details,
@@ -571,7 +571,7 @@ class SalesManagementMixin:
             details_window = tk.Toplevel(self.sales_window)
             details_window.title(f"Sale Details - #{sale_id}")
             details_window.geometry("600x500")
-            details_window.configure(bg=self.bg_color)
+            details_window.configure(bg=self.BG_COLOR)
 
             details_window.update_idletasks()
             width, height = 600, 500
@@ -581,14 +581,14 @@ class SalesManagementMixin:
             y = (screen_height - height) // 2
             details_window.geometry(f"{width}x{height}+{x}+{y}")
 
-            form_frame = tk.Frame(details_window, bg=self.card_bg, relief="raised", bd=2)
+            form_frame = tk.Frame(details_window, bg=self.CARD_BG, relief="raised", bd=2)
             form_frame.pack(fill="both", expand=True, padx=20, pady=20)
 
             tk.Label(
                 form_frame,
                 text=f"Sale Details - #{sale_id}",
                 font=("Arial", 16, "bold"),
-                bg=self.card_bg,
+                bg=self.CARD_BG,
                 fg="#4A3728",
             ).pack(pady=20)
 
@@ -619,7 +619,7 @@ Items:
                 form_frame,
                 text=info_text,
                 font=("Arial", 11),
-                bg=self.card_bg,
+                bg=self.CARD_BG,
                 fg="#4A3728",
                 justify="left",
                 anchor="w",
@@ -637,7 +637,7 @@ Items:
                 form_frame,
                 text=items_text,
                 font=("Arial", 10),
-                bg=self.card_bg,
+                bg=self.CARD_BG,
                 fg="#666666",
                 justify="left",
                 anchor="w",
@@ -651,8 +651,8 @@ Items:
                     form_frame,
                     text="View Proof of Payment",
                     font=("Arial", 12),
-                    bg=self.button_color,
-                    fg=self.text_color,
+                    bg=self.BUTTON_COLOR,
+                    fg=self.TEXT_COLOR,
                     relief="flat",
                     command=lambda: self._open_proof_of_payment(proof_path, proof_blob),
                     width=20,
@@ -726,7 +726,7 @@ Items:
 
         status_window = tk.Toplevel(self.sales_window)
         status_window.title("Update Sale Status")
-        status_window.configure(bg=self.bg_color)
+        status_window.configure(bg=self.BG_COLOR)
         status_window.resizable(False, False)
 
         status_window.update_idletasks()
@@ -737,14 +737,14 @@ Items:
         y = (screen_height - height) // 2
         status_window.geometry(f"{width}x{height}+{x}+{y}")
 
-        form_frame = tk.Frame(status_window, bg=self.card_bg, relief="raised", bd=2)
+        form_frame = tk.Frame(status_window, bg=self.CARD_BG, relief="raised", bd=2)
         form_frame.pack(fill="both", expand=True, padx=20, pady=20)
 
         tk.Label(
             form_frame,
             text=f"Update Status for Sale #{sale_id}",
             font=("Arial", 14, "bold"),
-            bg=self.card_bg,
+            bg=self.CARD_BG,
             fg="#4A3728",
         ).pack(pady=(10, 15))
 
@@ -752,7 +752,7 @@ Items:
             form_frame,
             text="Select new status:",
             font=("Arial", 11),
-            bg=self.card_bg,
+            bg=self.CARD_BG,
             fg="#4A3728",
         ).pack(anchor="w")
 
@@ -897,7 +897,7 @@ Items:
                     pass
                 messagebox.showerror("Error", f"Failed to update status: {exc}")
 
-        button_container = tk.Frame(form_frame, bg=self.card_bg)
+        button_container = tk.Frame(form_frame, bg=self.CARD_BG)
         button_container.pack(pady=(5, 10))
 
         tk.Button(
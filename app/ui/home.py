@@ -5,12 +5,13 @@ Customer dashboard for online ordering, loyalty rewards, and account management
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox
+import tkinter.font as tkfont
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+import base64
+import functools
 import sys
 import os
-import subprocess
-from datetime import datetime
 from decimal import Decimal
 import re
 import bcrypt
@@ -22,6 +23,83 @@ OUTPUT_PATH = Path(__file__).resolve().parent
 PROJECT_ROOT = OUTPUT_PATH.parent.parent
 
 
+def _bind_messagebox():
+    """Import tkinter.messagebox on the first dialog and rebind the dialog names below to it."""
+    global _showinfo, _showerror, _askyesno
+    from tkinter.messagebox import askyesno, showerror, showinfo
+    _showinfo, _showerror, _askyesno = showinfo, showerror, askyesno
+
+
+# Stand-ins until the first dialog; after that these names are the messagebox functions
+def _showinfo(*args, **kwargs):
+    _bind_messagebox()
+    return _showinfo(*args, **kwargs)
+
+
+def _showerror(*args, **kwargs):
+    _bind_messagebox()
+    return _showerror(*args, **kwargs)
+
+
+def _askyesno(*args, **kwargs):
+    _bind_messagebox()
+    return _askyesno(*args, **kwargs)
+
+
+# Palette shared by every widget and canvas item on the page, so each color string
+# is one object handed to Tk rather than a fresh literal per call
+_WHITE = "#FFFFFF"
+_BLACK = "#000000"
+_AMBER = "#B96708"
+_ORANGE = "#D2691E"
+_CREAM = "#FFF8E7"
+_LATTE = "#EFE8D8"
+_ESPRESSO = "#3A280F"
+
+# Espresso text on cream, used by the profile dialog's header and field labels
+_DIALOG_LABEL_KW = {"bg": _CREAM, "fg": _ESPRESSO}
+
+# (family, size, weight) of every font the home page uses, keyed by role;
+# negative sizes are pixels, as exported by the canvas designer
+_FONT_SPECS = {
+    "welcome": ("Poppins SemiBold", -16, "normal"),
+    "body": ("Poppins Regular", -13, "normal"),
+    "caption": ("Poppins Regular", -11, "normal"),
+    "amount": ("Inter", -13, "normal"),
+    "section": ("Poppins ExtraBold", -16, "normal"),
+    "hero": ("Poppins ExtraBold", -24, "normal"),
+    "card_title": ("Poppins SemiBold", -20, "normal"),
+    "button": ("Poppins", 12, "normal"),
+    "input": ("Poppins", 10, "normal"),
+    "label": ("Poppins", 10, "bold"),
+    "hint": ("Poppins", 9, "normal"),
+    "text": ("Poppins", 11, "normal"),
+    "heading": ("Poppins", 11, "bold"),
+    "title": ("Poppins", 16, "bold"),
+}
+
+# Order history row formatters, built once instead of per f-string evaluation
+_ITEM_FMT = "{} x{} @ ₱{:.2f}".format
+_TOTAL_FMT = "₱{:,.2f}".format
+
+# Header and account sidebar text, formatted without f-string evaluation on each refresh
+_WELCOME_FMT = "Welcome, {}!".format
+_MEMBER_FMT = "{} Member".format
+_PESO = "₱"
+
+# Fixed dialog bodies; only the points line of the rewards dialog is formatted per click
+_REWARDS_TAIL = (
+    "\n\nPoints can be redeemed for:\n• Free coffee drinks\n• Discounts on orders"
+    "\n• Special promotions\n\nKeep ordering to earn more points!"
+)
+_STORES_MSG = (
+    "Store locator feature coming soon!\n\nYou'll be able to find BigBrew locations "
+    "near you with directions and store hours."
+)
+_NO_CUSTOMER_MSG = "No customer information available."
+_NO_ORDERS_MSG = "You have no recorded orders yet.\nPlace an order to see it listed here."
+
+
 def _parse_customer_id(argv):
     """Return customer_id from CLI args if provided."""
     if not argv:
@@ -68,7 +146,7 @@ def _coerce_float(value, default=0.0):
 def _load_customer_from_db(customer_id):
     """Fetch customer details from the database for the given id."""
     try:
-        rows = db.execute_query(
+        row = db.execute_one(
             """
             SELECT customer_id, customer_code, username, email,
                    first_name, last_name, customer_type,
@@ -77,16 +155,14 @@ def _load_customer_from_db(customer_id):
             WHERE customer_id = %s
             """,
             (customer_id,),
-            fetch=True,
         )
     except Exception as exc:
         print(f"Failed to load customer {customer_id}: {exc}")
         return None
 
-    if not rows:
+    if not row:
         return None
 
-    row = rows[0]
     return {
         "customer_id": _coerce_int(row.get("customer_id"), default=customer_id),
         "customer_code": row.get("customer_code") or "N/A",
@@ -101,83 +177,335 @@ def _load_customer_from_db(customer_id):
         "address": (row.get("address") or "").strip(),
     }
 
+# Disk reads for prewarmed images run here; PhotoImages are still built on the Tk thread
+_IO_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="bb-img")
+
+# Resource base, resolved once: the PyInstaller bundle dir or the working dir
+_BASE = getattr(sys, "_MEIPASS", os.path.abspath("."))
+
 def resource_path(relative_path):
     """Get absolute path to resource, works for dev and for PyInstaller"""
-    try:
-        base_path = sys._MEIPASS
-    except Exception:
-        base_path = os.path.abspath(".")
-    return os.path.join(base_path, relative_path)
-
-def relative_to_assets(path: str) -> Path:
-    """Get path to assets in the customer home resources folder"""
-    possible_paths = [
-        os.path.join(OUTPUT_PATH, "resources", "home", path),
-        os.path.join(OUTPUT_PATH, "home", "resources", path),
-        resource_path(f"resources/home/{path}"),
-        resource_path(f"home/resources/{path}"),
-        os.path.join(OUTPUT_PATH, path),
-        resource_path(path),
-    ]
+    return os.path.join(_BASE, relative_path)
+
+_BASE_PATH = Path(_BASE)
+
+# Directories holding customer home assets, in lookup priority order
+_ASSET_DIRS = (
+    OUTPUT_PATH / "resources" / "home",
+    OUTPUT_PATH / "home" / "resources",
+    _BASE_PATH / "resources" / "home",
+    _BASE_PATH / "home" / "resources",
+)
+# Roots probed for loose files that are not in any asset directory
+_LOOSE_BASES = (OUTPUT_PATH, _BASE_PATH)
+
+def _build_asset_index():
+    """Map each asset's path relative to its directory to the file, walking each directory once.
+
+    os.scandir reports file/dir types from the directory listing itself, so the
+    walk costs one listing per directory rather than a stat per entry.
+    """
+    index = {}
+    for root in _ASSET_DIRS:
+        pending = [(str(root), "")]
+        while pending:
+            directory, prefix = pending.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_dir():
+                            pending.append((entry.path, f"{prefix}{entry.name}/"))
+                        elif entry.is_file():
+                            index.setdefault(prefix + entry.name, Path(entry.path))
+            except OSError:
+                # Missing or unreadable asset directory
+                continue
+    return index
+
+_ASSET_INDEX = _build_asset_index()
+
+@functools.lru_cache(maxsize=256)
+def _resolve_asset(path: str):
+    """Return ``(Path, exists)`` for a customer home asset"""
+    indexed = _ASSET_INDEX.get(Path(path).as_posix())
+    if indexed is not None:
+        return indexed, True
     
-    for asset_path in possible_paths:
-        if os.path.exists(asset_path):
-            return Path(asset_path)
+    # Loose files next to this module or in the bundle root
+    for base in _LOOSE_BASES:
+        asset_path = base / path
+        if asset_path.is_file():
+            return asset_path, True
     
     # If no path found, return the most likely one
-    return Path(possible_paths[0])
+    return _ASSET_DIRS[0] / path, False
+
+# Decoded PhotoImages keyed by asset name, shared process-wide so re-entering the
+# home page (or prewarming it from the login screen) never decodes a PNG twice
+_IMAGE_CACHE = {}
+
+def relative_to_assets(path: str) -> Path:
+    """Get path to assets in the customer home resources folder"""
+    return _resolve_asset(path)[0]
 
 class CustomerHome:
+    __slots__ = (
+        "parent", "app", "customer_data", "fonts", "root_frame", "canvas",
+        # Customer fields (see _FIELDS) and their formatted display strings
+        "customer_id", "customer_code", "username", "email", "first_name", "last_name",
+        "customer_type", "loyalty_points", "total_spent", "phone", "address",
+        "_welcome_str", "_member_str", "_account_strs",
+        # Canvas items retexted by refresh() and update_account()
+        "_welcome_item", "_member_item", "_account_value_items",
+        "_pending_account", "_account_flush_scheduled",
+        "order_btn", "rewards_btn", "store_btn", "edit_btn", "history_btn", "logout_btn",
+    )
+
+    # Font objects built from _FONT_SPECS and the interpreter they belong to
+    _FONTS = None
+    _FONTS_TK = None
+
+    # (attribute, customer_data key, default) for every customer field the page shows
+    _FIELDS = (
+        ("customer_id", "customer_id", None),
+        ("customer_code", "customer_code", 'N/A'),
+        ("username", "username", 'Customer'),
+        ("email", "email", 'N/A'),
+        ("first_name", "first_name", 'Customer'),
+        ("last_name", "last_name", 'User'),
+        ("customer_type", "customer_type", 'regular'),
+        ("loyalty_points", "loyalty_points", 0),
+        ("total_spent", "total_spent", 0.0),
+        ("phone", "phone", ''),
+        ("address", "address", ''),
+    )
+
+    # Option-database defaults for every button on the page (root_frame has class
+    # CustomerHome), so the text fallbacks only pass their text, color and command
+    BUTTON_OPTIONS = (
+        ('*CustomerHome.Button.foreground', _WHITE),
+        ('*CustomerHome.Button.relief', 'flat'),
+        ('*CustomerHome.Button.cursor', 'hand2'),
+    )
+    # Interpreter BUTTON_OPTIONS were last registered with
+    _button_options_tk = None
+
+    # One live home page per parent window, hidden on logout and reused (see acquire)
+    _instances = {}
+
+    # Canvas text as (x, y, text, fill, font key); dynamic lines omit the text
+    HEADER_TEXT = (
+        (716.0, 8.0, _WHITE, "welcome"),
+        (780.0, 31.0, _LATTE, "body"),
+    )
+    ACCOUNT_TEXT = (
+        (72.8, 108.1, "Account Information", _ESPRESSO, "section"),
+        (58.6, 157.9, "Customer Code:", _AMBER, "caption"),
+        (58.6, 216.3, "Email Address:", _AMBER, "caption"),
+        (57.5, 272.7, "Member Type:", _AMBER, "caption"),
+        (57.5, 331.1, "Total Points:", _AMBER, "caption"),
+        (57.5, 381.8, "Total Spent:", _AMBER, "caption"),
+    )
+    # In _account_strs order
+    ACCOUNT_VALUES = (
+        (58.6, 175.1, _BLACK, "body"),
+        (58.6, 237.3, _BLACK, "body"),
+        (57.5, 290.0, _BLACK, "body"),
+        (57.5, 348.3, _BLACK, "body"),
+        (57.5, 399.1, "#B45309", "amount"),
+    )
+    FEATURE_TEXT = (
+        (349.0, 80.0, "READY TO SIP INTO YOUR FUTURE?", _ESPRESSO, "hero"),
+        (349.0, 113.0, "Brew Success with Big Brew.", _BLACK, "body"),
+    )
+
+    # Every solid panel on the page as (x0, y0, x1, y1, fill), bottom to top: the
+    # header band, the content area, the account box and the three card panels.
+    # Drawn in one pass before any text or image.
+    PANELS = (
+        (0.0, 0.0, 1035.0, 58.0, _AMBER),
+        (0.0, 58.0, 1035.0, 534.0, _LATTE),
+        (27.0, 88.0, 312.0, 512.0, _CREAM),
+        (349.0, 143.0, 541.0, 512.0, _CREAM),
+        (576.0, 143.0, 768.0, 512.0, _CREAM),
+        (796.0, 143.0, 988.0, 512.0, _CREAM),
+    )
+
+    # (icon, icon x, icon y, title, title x, title y, captions)
+    FEATURE_CARDS = (
+        ("coffee.png", 445.0, 232.0, "Online Ordering", 366.0, 263.0, (
+            (364.0, 305.0, "Order Your Favorite Milk "),
+            (364.0, 330.0, "Tea, Praf, Coffee, Fruit "),
+            (364.0, 355.0, "Tea or Brosty Online."),
+        )),
+        ("gift.png", 672.0, 233.0, "Loyalty Rewards", 591.0, 264.0, (
+            (594.0, 301.0, "Earn points with every "),
+            (594.0, 325.0, "purchase."),
+        )),
+        ("loc.png", 892.0, 235.0, "Store Locator", 824.0, 265.0, (
+            (810.0, 300.0, "Find Big Brew locations "),
+            (810.0, 325.0, "near you."),
+        )),
+    )
+
+    # Every image drawn by the home page; decoded ahead of time by prewarm_images
+    HOME_IMAGES = (
+        "logo.png",
+        "coffee.png",
+        "gift.png",
+        "loc.png",
+        "button_order_now.png",
+        "button_vw_rewards.png",
+        "button_store_loc.png",
+        "button_edit_prof.png",
+        "button_order_history.png",
+        "button_logout.png",
+    )
+
+    @staticmethod
+    def _cached_photo(master, path):
+        """Return the already-decoded PhotoImage for an asset, or None"""
+        photo_image = _IMAGE_CACHE.get(path)
+        # Images belong to one Tcl interpreter; rebuild if the root was replaced
+        if photo_image is not None and photo_image.tk is master.tk:
+            return photo_image
+        return None
+
+    @classmethod
+    def _photo(cls, master, path):
+        """Return the cached PhotoImage for an asset, decoding it on first use"""
+        photo_image = cls._cached_photo(master, path)
+        if photo_image is not None:
+            return photo_image
+        image_path, found = _resolve_asset(path)
+        if not found:
+            print(f"Image not found: {image_path}")
+            return None
+        photo_image = tk.PhotoImage(master=master, file=str(image_path))
+        _IMAGE_CACHE[path] = photo_image
+        return photo_image
+
+    @classmethod
+    def prewarm_images(cls, master, paths=None):
+        """Decode home page images ahead of time, e.g. while the login screen is idle.
+
+        The files are read on _IO_POOL and each PhotoImage is built on the Tk
+        thread once its bytes arrive, so the caller never waits on disk.
+        """
+        pending = []
+        for path in paths or cls.HOME_IMAGES:
+            cached = _IMAGE_CACHE.get(path)
+            if cached is not None and cached.tk is master.tk:
+                continue
+            image_path, found = _resolve_asset(path)
+            if found:
+                pending.append((path, _IO_POOL.submit(image_path.read_bytes)))
+        if pending:
+            cls._install_read_images(master, pending)
+
+    @classmethod
+    def _install_read_images(cls, master, pending):
+        """Build PhotoImages for finished reads and poll again for the rest"""
+        waiting = []
+        for key, future in pending:
+            if not future.done():
+                waiting.append((key, future))
+                continue
+            try:
+                cached = _IMAGE_CACHE.get(key)
+                # A synchronous _photo() call may have beaten the read
+                if cached is None or cached.tk is not master.tk:
+                    data = base64.b64encode(future.result())
+                    _IMAGE_CACHE[key] = tk.PhotoImage(master=master, data=data)
+            except Exception as e:
+                print(f"Error loading image {key}: {e}")
+        if waiting:
+            try:
+                master.after(15, cls._install_read_images, master, waiting)
+            except tk.TclError:
+                # Root destroyed before the reads finished
+                pass
+
+    @classmethod
+    def _shared_fonts(cls, master):
+        """Return the named fonts for ``master``, created once per Tk interpreter"""
+        if cls._FONTS is None or cls._FONTS_TK is not master.tk:
+            cls._FONTS = {
+                key: tkfont.Font(root=master, family=family, size=size, weight=weight)
+                for key, (family, size, weight) in _FONT_SPECS.items()
+            }
+            cls._FONTS_TK = master.tk
+        return cls._FONTS
+
+    @classmethod
+    def prewarm_fonts(cls, master):
+        """Create and measure the home page fonts ahead of time, once per interpreter"""
+        if cls._FONTS is not None and cls._FONTS_TK is master.tk:
+            return
+        # Measuring forces Tk to resolve each family now rather than on first draw
+        for font in cls._shared_fonts(master).values():
+            font.metrics("linespace")
+
+    @classmethod
+    def acquire(cls, parent, customer_data, app):
+        """Return the pooled home page for ``parent`` refreshed for this customer, or build one"""
+        home = cls._instances.get(id(parent))
+        if (
+            home is not None
+            and home.parent is parent
+            and home.root_frame is not None
+            and home.root_frame.winfo_exists()
+        ):
+            home.app = app
+            home.refresh(customer_data)
+            return home
+        home = cls(parent, customer_data, app)
+        cls._instances[id(parent)] = home
+        return home
+
     def __init__(self, parent, customer_data, app):
         self.parent = parent
-        self.customer_data = dict(customer_data or {})
         self.app = app
-        self.images = []  # Keep references to images
-        
-        # Default values
-        self.customer_id = None
-        self.customer_code = 'N/A'
-        self.username = 'Customer'
-        self.email = 'N/A'
-        self.first_name = 'Customer'
-        self.last_name = 'User'
-        self.customer_type = 'regular'
-        self.loyalty_points = 0
-        self.total_spent = 0.0
-        self.phone = ''
-        self.address = ''
-
-        self._apply_customer_updates(self.customer_data)
+        # Account totals queued by update_account, flushed on the next idle pass
+        self._pending_account = {}
+        self._account_flush_scheduled = False
+        self._reset_customer(customer_data)
         
         self.setup_ui()
 
-    def _apply_customer_updates(self, data):
-        if not data:
-            return
+    def _reset_customer(self, customer_data):
+        """Drop any previous customer's fields and load ``customer_data``"""
+        self.customer_data = {}
+        for attr, _key, default in self._FIELDS:
+            setattr(self, attr, default)
 
+        self._apply_customer_updates(customer_data)
+
+    def _apply_customer_updates(self, data):
         # Update backing dictionary (ignoring None values)
-        for key, value in data.items():
+        customer_data = self.customer_data
+        for key, value in (data or {}).items():
             if value is not None:
-                self.customer_data[key] = value
-
-        self.customer_id = self.customer_data.get('customer_id', self.customer_id)
-        self.customer_code = self.customer_data.get('customer_code', self.customer_code)
-        self.username = self.customer_data.get('username', self.username)
-        self.email = self.customer_data.get('email', self.email)
-
-        first_name = (self.customer_data.get('first_name') or '').strip()
-        last_name = (self.customer_data.get('last_name') or '').strip()
-        if first_name:
-            self.first_name = first_name
-        else:
-            self.first_name = 'Customer'
-        self.last_name = last_name or 'User'
-
-        self.customer_type = self.customer_data.get('customer_type', self.customer_type)
-        self.loyalty_points = self.customer_data.get('loyalty_points', self.loyalty_points)
-        self.total_spent = self.customer_data.get('total_spent', self.total_spent)
-        self.phone = self.customer_data.get('phone', self.phone)
-        self.address = self.customer_data.get('address', self.address)
+                customer_data[key] = value
+
+        for attr, key, _default in self._FIELDS:
+            if key in customer_data:
+                setattr(self, attr, customer_data[key])
+
+        # Names are stripped, and blank ones fall back to the defaults
+        self.first_name = (customer_data.get('first_name') or '').strip() or 'Customer'
+        self.last_name = (customer_data.get('last_name') or '').strip() or 'User'
+
+        # Display strings are formatted here, once per data change, not per draw
+        self._welcome_str = _WELCOME_FMT(self.first_name)
+        self._member_str = _MEMBER_FMT(self.customer_type.title())
+        self._account_strs = (
+            self.customer_code,
+            self.email,
+            self.customer_type.upper(),
+            format(self.loyalty_points, ","),
+            _PESO + format(self.total_spent, ".2f"),
+        )
         
     def center_parent(self, width: int = 1035, height: int = 534):
         """Center the parent window on the screen for the given size."""
@@ -193,33 +521,34 @@ class CustomerHome:
             self.parent.geometry(f"{width}x{height}")
 
     def load_image(self, path: str):
-        """Load image and keep reference to prevent garbage collection"""
+        """Load image; the class-level cache keeps the reference alive"""
         try:
-            image_path = relative_to_assets(path)
-            if not image_path.exists():
-                print(f"Image not found: {image_path}")
-                return None
-            photo_image = tk.PhotoImage(file=str(image_path))
-            self.images.append(photo_image)
-            return photo_image
+            return self._photo(self.parent, path)
         except Exception as e:
             print(f"Error loading image {path}: {e}")
             return None
     
     def setup_ui(self):
         """Setup the customer home UI"""
-        # Clear any existing widgets first
-        for widget in self.parent.winfo_children():
-            widget.destroy()
+        # Rebuilds replace only this page's own subtree; the caller clears the rest of the window
+        root_frame = getattr(self, "root_frame", None)
+        if root_frame is not None and root_frame.winfo_exists():
+            root_frame.destroy()
         
         # Configure parent window
-        self.parent.configure(bg="#FFFFFF")
-        self.parent.geometry("1035x534")
+        self.parent.configure(bg=_WHITE)
+        self.fonts = self._shared_fonts(self.parent)
+
+        # Single container so teardown is one destroy() of the whole subtree
+        self.root_frame = tk.Frame(self.parent, class_='CustomerHome', bg=_WHITE, width=1035, height=534)
+        self.root_frame.place(x=0, y=0, width=1035, height=534)
+        # Tells the main app's clear_window to leave the hidden page for reuse
+        self.root_frame.keep_alive = True
         
         # Create canvas
         self.canvas = tk.Canvas(
-            self.parent,
-            bg="#FFFFFF",
+            self.root_frame,
+            bg=_WHITE,
             height=534,
             width=1035,
             bd=0,
@@ -233,26 +562,16 @@ class CustomerHome:
         self.draw_header()
         self.draw_account_info()
         self.draw_feature_cards()
-        self.draw_buttons()
+        # Buttons are placed on the next idle pass so the canvas paints first
+        self.root_frame.after_idle(self._deferred_buttons, self.root_frame)
         # Center window after layout
         self.center_parent(1035, 534)
     
     def draw_background(self):
-        """Draw background elements"""
-        # Background image (optional - can be removed if image doesn't exist)
-        try:
-            bg_image = self.load_image("image_1.png")
-            if bg_image:
-                self.canvas.create_image(517.0, 267.0, image=bg_image)
-        except:
-            pass
-        
-        # Header background
-        self.canvas.create_rectangle(
-            0.0, 0.0, 1035.0, 58.0,
-            fill="#B96708",
-            outline=""
-        )
+        """Draw the solid panels and the logo"""
+        create_rectangle = self.canvas.create_rectangle
+        for x0, y0, x1, y1, fill in self.PANELS:
+            create_rectangle(x0, y0, x1, y1, fill=fill, outline="")
         
         # Logo
         try:
@@ -261,535 +580,158 @@ class CustomerHome:
                 self.canvas.create_image(85.0, 29.0, image=logo_image)
         except:
             pass
-        
-        # Main content background
-        self.canvas.create_rectangle(
-            0.0, 58.0, 1035.0, 534.0,
-            fill="#EFE8D8",
-            outline=""
-        )
     
     def draw_header(self):
         """Draw header elements"""
-        # Welcome text
-        self.canvas.create_text(
-            716.0, 8.0,
-            anchor="nw",
-            text=f"Welcome, {self.first_name}!",
-            fill="#FFFFFF",
-            font=("Poppins SemiBold", 16 * -1)
-        )
-        
-        # Member type
-        member_type_text = f"{self.customer_type.title()} Member"
-        self.canvas.create_text(
-            780.0, 31.0,
-            anchor="nw",
-            text=member_type_text,
-            fill="#EFE8D8",
-            font=("Poppins Regular", 13 * -1)
+        create_text = self.canvas.create_text
+        fonts = self.fonts
+        # Welcome and member type lines, kept so refresh() can retext them
+        self._welcome_item, self._member_item = (
+            create_text(x, y, anchor="nw", text=text, fill=fill, font=fonts[font])
+            for (x, y, fill, font), text in zip(self.HEADER_TEXT, (self._welcome_str, self._member_str))
         )
-        
+    
     def draw_account_info(self):
         """Draw account information sidebar"""
-        # Account info box
-        self.canvas.create_rectangle(
-            27.0, 88.0, 312.0, 512.0,
-            fill="#FFF8E7",
-            outline=""
-        )
-        
-        # Account Information title
-        self.canvas.create_text(
-            72.8, 108.1,
-            anchor="nw",
-            text="Account Information",
-            fill="#3A280F",
-            font=("Poppins ExtraBold", 16 * -1)
-        )
-        
-        # Customer code
-        self.canvas.create_text(
-            58.6, 157.9,
-            anchor="nw",
-            text="Customer Code:",
-            fill="#B96708",
-            font=("Poppins Regular", 11 * -1)
-        )
-        self.canvas.create_text(
-            58.6, 175.1,
-            anchor="nw",
-            text=self.customer_code,
-            fill="#000000",
-            font=("Poppins Regular", 13 * -1)
-        )
-        
-        # Email
-        self.canvas.create_text(
-            58.6, 216.3,
-            anchor="nw",
-            text="Email Address:",
-            fill="#B96708",
-            font=("Poppins Regular", 11 * -1)
-        )
-        self.canvas.create_text(
-            58.6, 237.3,
-            anchor="nw",
-            text=self.email,
-            fill="#000000",
-            font=("Poppins Regular", 13 * -1)
-        )
-        
-        # Member type
-        self.canvas.create_text(
-            57.5, 272.7,
-            anchor="nw",
-            text="Member Type:",
-            fill="#B96708",
-            font=("Poppins Regular", 11 * -1)
-        )
-        self.canvas.create_text(
-            57.5, 290.0,
-            anchor="nw",
-            text=self.customer_type.upper(),
-            fill="#000000",
-            font=("Poppins Regular", 13 * -1)
-        )
-        
-        # Total points
-        self.canvas.create_text(
-            57.5, 331.1,
-            anchor="nw",
-            text="Total Points:",
-            fill="#B96708",
-            font=("Poppins Regular", 11 * -1)
-        )
-        self.canvas.create_text(
-            57.5, 348.3,
-            anchor="nw",
-            text=f"{self.loyalty_points:,}",
-            fill="#000000",
-            font=("Poppins Regular", 13 * -1)
-        )
+        self._draw_text_rows(self.ACCOUNT_TEXT)
         
-        # Total spent
-        self.canvas.create_text(
-            57.5, 381.8,
-            anchor="nw",
-            text="Total Spent:",
-            fill="#B96708",
-            font=("Poppins Regular", 11 * -1)
-        )
-        self.canvas.create_text(
-            57.5, 399.1,
-            anchor="nw",
-            text=f"₱{self.total_spent:.2f}",
-            fill="#B45309",
-            font=("Inter", 13 * -1)
-        )
+        create_text = self.canvas.create_text
+        fonts = self.fonts
+        # Value items are kept so refresh() can retext them in place
+        self._account_value_items = [
+            create_text(x, y, anchor="nw", text=value, fill=fill, font=fonts[font])
+            for (x, y, fill, font), value in zip(self.ACCOUNT_VALUES, self._account_strs)
+        ]
+    
+    def _draw_text_rows(self, rows):
+        """Draw a table of static (x, y, text, fill, font key) canvas text"""
+        create_text = self.canvas.create_text
+        fonts = self.fonts
+        for x, y, text, fill, font in rows:
+            create_text(x, y, anchor="nw", text=text, fill=fill, font=fonts[font])
     
     def draw_feature_cards(self):
-        """Draw feature cards"""
-        # Main title
-        self.canvas.create_text(
-            349.0, 80.0,
-            anchor="nw",
-            text="READY TO SIP INTO YOUR FUTURE?",
-            fill="#3A280F",
-            font=("Poppins ExtraBold", 24 * -1)
-        )
-        
-        self.canvas.create_text(
-            349.0, 113.0,
-            anchor="nw",
-            text="Brew Success with Big Brew.",
-            fill="#000000",
-            font=("Poppins Regular", 13 * -1)
-        )
-        
-        # Card 1 - Online Ordering
-        self.canvas.create_rectangle(
-            349.0, 143.0, 541.0, 512.0,
-            fill="#FFF8E7",
-            outline=""
-        )
-        
-        try:
-            coffee_img = self.load_image("coffee.png")
-            if coffee_img:
-                self.canvas.create_image(445.0, 232.0, image=coffee_img)
-        except:
-            pass
-        
-        self.canvas.create_text(
-            366.0, 263.0,
-            anchor="nw",
-            text="Online Ordering",
-            fill="#000000",
-            font=("Poppins SemiBold", 20 * -1)
-        )
-        
-        self.canvas.create_text(
-            364.0, 305.0,
-            anchor="nw",
-            text="Order Your Favorite Milk ",
-            fill="#999999",
-            font=("Poppins Regular", 13 * -1)
-        )
-        
-        self.canvas.create_text(
-            364.0, 330.0,
-            anchor="nw",
-            text="Tea, Praf, Coffee, Fruit ",
-            fill="#999999",
-            font=("Poppins Regular", 13 * -1)
-        )
-        
-        self.canvas.create_text(
-            364.0, 355.0,
-            anchor="nw",
-            text="Tea or Brosty Online.",
-            fill="#999999",
-            font=("Poppins Regular", 13 * -1)
-        )
-        
-        # Card 2 - Loyalty Rewards
-        self.canvas.create_rectangle(
-            576.0, 143.0, 768.0, 512.0,
-            fill="#FFF8E7",
-            outline=""
-        )
-        
-        try:
-            gift_img = self.load_image("gift.png")
-            if gift_img:
-                self.canvas.create_image(672.0, 233.0, image=gift_img)
-        except:
-            pass
-        
-        self.canvas.create_text(
-            591.0, 264.0,
-            anchor="nw",
-            text="Loyalty Rewards",
-            fill="#000000",
-            font=("Poppins SemiBold", 20 * -1)
-        )
-        
-        self.canvas.create_text(
-            594.0, 301.0,
-            anchor="nw",
-            text="Earn points with every ",
-            fill="#999999",
-            font=("Poppins Regular", 13 * -1)
-        )
+        """Draw each feature card's icon, title and caption lines over its panel"""
+        self._draw_text_rows(self.FEATURE_TEXT)
         
-        self.canvas.create_text(
-            594.0, 325.0,
-            anchor="nw",
-            text="purchase.",
-            fill="#999999",
-            font=("Poppins Regular", 13 * -1)
-        )
-        
-        # Card 3 - Store Locator
-        self.canvas.create_rectangle(
-            796.0, 143.0, 988.0, 512.0,
-            fill="#FFF8E7",
-            outline=""
-        )
-        
-        try:
-            loc_img = self.load_image("loc.png")
-            if loc_img:
-                self.canvas.create_image(892.0, 235.0, image=loc_img)
-        except:
-            pass
-        
-        self.canvas.create_text(
-            824.0, 265.0,
-            anchor="nw",
-            text="Store Locator",
-            fill="#000000",
-            font=("Poppins SemiBold", 20 * -1)
-        )
-        
-        self.canvas.create_text(
-            810.0, 300.0,
-            anchor="nw",
-            text="Find Big Brew locations ",
-            fill="#999999",
-            font=("Poppins Regular", 13 * -1)
-        )
-        
-        self.canvas.create_text(
-            810.0, 325.0,
-            anchor="nw",
-            text="near you.",
-            fill="#999999",
-            font=("Poppins Regular", 13 * -1)
-        )
+        # Bound once for the whole loop rather than looked up per item
+        create_text = self.canvas.create_text
+        create_image = self.canvas.create_image
+        title_font = self.fonts["card_title"]
+        caption_font = self.fonts["body"]
+        # Icons not decoded yet (no prewarm) get an empty item filled in after first paint
+        deferred = []
+        for icon, icon_x, icon_y, title, title_x, title_y, captions in self.FEATURE_CARDS:
+            icon_img = self._cached_photo(self.parent, icon)
+            if icon_img:
+                create_image(icon_x, icon_y, image=icon_img)
+            else:
+                deferred.append((create_image(icon_x, icon_y), icon))
+            create_text(title_x, title_y, anchor="nw", text=title, fill=_BLACK, font=title_font)
+            for x, y, text in captions:
+                create_text(x, y, anchor="nw", text=text, fill="#999999", font=caption_font)
+        if deferred:
+            self.root_frame.after_idle(self._load_deferred_images, self.root_frame, deferred)
+    
+    def _load_deferred_images(self, root_frame, deferred):
+        """Decode images left out of the first paint and set them on their canvas items"""
+        if root_frame is not self.root_frame or not root_frame.winfo_exists():
+            return
+        itemconfigure = self.canvas.itemconfigure
+        for item, path in deferred:
+            image = self.load_image(path)
+            if image:
+                itemconfigure(item, image=image)
+    
+    def _deferred_buttons(self, root_frame):
+        """Draw the buttons unless the frame they were scheduled for has been replaced"""
+        if root_frame is not self.root_frame or not root_frame.winfo_exists():
+            return
+        self.draw_buttons()
     
     def draw_buttons(self):
-        """Draw buttons"""
-        # Order Now button
-        try:
-            order_btn_img = self.load_image("button_order_now.png")
-            if order_btn_img:
-                self.order_btn = tk.Button(
-                    image=order_btn_img,
+        """Draw buttons; shared styling comes from BUTTON_OPTIONS"""
+        self._add_button_options()
+        make_button = self._make_button
+        self.order_btn = make_button("button_order_now.png", "Order Now", self.start_online_order, 379.0, 450.0, 131.0, 40.0)
+        self.rewards_btn = make_button("button_vw_rewards.png", "View Rewards", self.view_rewards, 603.0, 450.0, 138.0, 40.0)
+        self.store_btn = make_button("button_store_loc.png", "Find Stores", self.find_stores, 830.0, 450.0, 131.0, 40.0)
+        self.edit_btn = make_button("button_edit_prof.png", "Edit Profile", self.edit_profile, 58.6, 428.7, 231.1, 30.6, font="input")
+        # Try both possible filenames
+        self.history_btn = make_button(
+            "button_order_history.png", "Order History", self.view_order_history, 58.6, 468.0, 231.1, 29.7,
+            font="input", alt_image="button_order_historypng",
+        )
+        self.logout_btn = make_button("button_logout.png", "Logout", self.logout, 909.0, 14.0, 85.0, 30.0, bg=_ORANGE, font="input")
+    
+    def _make_button(self, image_name, text, command, x, y, width, height, bg=_AMBER, font=None, alt_image=None):
+        """Place an image button, falling back to a text button when the image is unavailable"""
+        image = self.load_image(image_name)
+        if not image and alt_image:
+            image = self.load_image(alt_image)
+        button = None
+        if image:
+            try:
+                button = tk.Button(
+                    self.root_frame,
+                    image=image,
                     borderwidth=0,
                     highlightthickness=0,
-                    command=self.start_online_order,
+                    command=command,
                     relief="flat"
                 )
-                self.order_btn.place(x=379.0, y=450.0, width=131.0, height=40.0)
-            else:
-                # Fallback to text button
-                self.order_btn = tk.Button(
-                    self.parent,
-                    text="Order Now",
-                    font=("Poppins", 12),
-                    bg="#B96708",
-                    fg="#FFFFFF",
-                    relief="flat",
-                    command=self.start_online_order,
-                    cursor="hand2"
-                )
-                self.order_btn.place(x=379.0, y=450.0, width=131.0, height=40.0)
-        except:
+            except tk.TclError:
+                button = None
+        if button is None:
             # Fallback to text button
-            self.order_btn = tk.Button(
-                self.parent,
-                text="Order Now",
-                font=("Poppins", 12),
-                bg="#B96708",
-                fg="#FFFFFF",
-                relief="flat",
-                command=self.start_online_order,
-                cursor="hand2"
-            )
-            self.order_btn.place(x=379.0, y=450.0, width=131.0, height=40.0)
-        
-        # View Rewards button
-        try:
-            rewards_btn_img = self.load_image("button_vw_rewards.png")
-            if rewards_btn_img:
-                self.rewards_btn = tk.Button(
-                    image=rewards_btn_img,
-                    borderwidth=0,
-                    highlightthickness=0,
-                    command=self.view_rewards,
-                    relief="flat"
-                )
-                self.rewards_btn.place(x=603.0, y=450.0, width=138.0, height=40.0)
-            else:
-                self.rewards_btn = tk.Button(
-                    self.parent,
-                    text="View Rewards",
-                    font=("Poppins", 12),
-                    bg="#B96708",
-                    fg="#FFFFFF",
-                    relief="flat",
-                    command=self.view_rewards,
-                    cursor="hand2"
-                )
-                self.rewards_btn.place(x=603.0, y=450.0, width=138.0, height=40.0)
-        except:
-            self.rewards_btn = tk.Button(
-                self.parent,
-                text="View Rewards",
-                font=("Poppins", 12),
-                bg="#B96708",
-                fg="#FFFFFF",
-                relief="flat",
-                command=self.view_rewards,
-                cursor="hand2"
-            )
-            self.rewards_btn.place(x=603.0, y=450.0, width=138.0, height=40.0)
-        
-        # Store Locator button
-        try:
-            store_btn_img = self.load_image("button_store_loc.png")
-            if store_btn_img:
-                self.store_btn = tk.Button(
-                    image=store_btn_img,
-                    borderwidth=0,
-                    highlightthickness=0,
-                    command=self.find_stores,
-                    relief="flat"
-                )
-                self.store_btn.place(x=830.0, y=450.0, width=131.0, height=40.0)
-            else:
-                self.store_btn = tk.Button(
-                    self.parent,
-                    text="Find Stores",
-                    font=("Poppins", 12),
-                    bg="#B96708",
-                    fg="#FFFFFF",
-                    relief="flat",
-                    command=self.find_stores,
-                    cursor="hand2"
-                )
-                self.store_btn.place(x=830.0, y=450.0, width=131.0, height=40.0)
-        except:
-            self.store_btn = tk.Button(
-                self.parent,
-                text="Find Stores",
-                font=("Poppins", 12),
-                bg="#B96708",
-                fg="#FFFFFF",
-                relief="flat",
-                command=self.find_stores,
-                cursor="hand2"
-            )
-            self.store_btn.place(x=830.0, y=450.0, width=131.0, height=40.0)
-        
-        # Edit Profile button
-        try:
-            edit_btn_img = self.load_image("button_edit_prof.png")
-            if edit_btn_img:
-                self.edit_btn = tk.Button(
-                    image=edit_btn_img,
-                    borderwidth=0,
-                    highlightthickness=0,
-                    command=self.edit_profile,
-                    relief="flat"
-                )
-                self.edit_btn.place(x=58.6, y=428.7, width=231.1, height=30.6)
-            else:
-                self.edit_btn = tk.Button(
-                    self.parent,
-                    text="Edit Profile",
-                    font=("Poppins", 10),
-                    bg="#B96708",
-                    fg="#FFFFFF",
-                    relief="flat",
-                    command=self.edit_profile,
-                    cursor="hand2"
-                )
-                self.edit_btn.place(x=58.6, y=428.7, width=231.1, height=30.6)
-        except:
-            self.edit_btn = tk.Button(
-                self.parent,
-                text="Edit Profile",
-                font=("Poppins", 10),
-                bg="#B96708",
-                fg="#FFFFFF",
-                relief="flat",
-                command=self.edit_profile,
-                cursor="hand2"
-            )
-            self.edit_btn.place(x=58.6, y=428.7, width=231.1, height=30.6)
-        
-        # Order History button
-        try:
-            # Try both possible filenames
-            history_btn_img = self.load_image("button_order_history.png")
-            if not history_btn_img:
-                history_btn_img = self.load_image("button_order_historypng")
-            if history_btn_img:
-                self.history_btn = tk.Button(
-                    image=history_btn_img,
-                    borderwidth=0,
-                    highlightthickness=0,
-                    command=self.view_order_history,
-                    relief="flat"
-                )
-                self.history_btn.place(x=58.6, y=468.0, width=231.1, height=29.7)
-            else:
-                self.history_btn = tk.Button(
-                    self.parent,
-                    text="Order History",
-                    font=("Poppins", 10),
-                    bg="#B96708",
-                    fg="#FFFFFF",
-                    relief="flat",
-                    command=self.view_order_history,
-                    cursor="hand2"
-                )
-                self.history_btn.place(x=58.6, y=468.0, width=231.1, height=29.7)
-        except:
-            self.history_btn = tk.Button(
-                self.parent,
-                text="Order History",
-                font=("Poppins", 10),
-                bg="#B96708",
-                fg="#FFFFFF",
-                relief="flat",
-                command=self.view_order_history,
-                cursor="hand2"
-            )
-            self.history_btn.place(x=58.6, y=468.0, width=231.1, height=29.7)
-        
-        # Logout button
-        try:
-            logout_btn_img = self.load_image("button_logout.png")
-            if logout_btn_img:
-                self.logout_btn = tk.Button(
-                    image=logout_btn_img,
-                    borderwidth=0,
-                    highlightthickness=0,
-                    command=self.logout,
-                    relief="flat"
-                )
-                self.logout_btn.place(x=909.0, y=14.0, width=85.0, height=30.0)
-            else:
-                self.logout_btn = tk.Button(
-                    self.parent,
-                    text="Logout",
-                    font=("Poppins", 10),
-                    bg="#D2691E",
-                    fg="#FFFFFF",
-                    relief="flat",
-                    command=self.logout,
-                    cursor="hand2"
-                )
-                self.logout_btn.place(x=909.0, y=14.0, width=85.0, height=30.0)
-        except:
-            self.logout_btn = tk.Button(
-                self.parent,
-                text="Logout",
-                font=("Poppins", 10),
-                bg="#D2691E",
-                fg="#FFFFFF",
-                relief="flat",
-                command=self.logout,
-                cursor="hand2"
-            )
-            self.logout_btn.place(x=909.0, y=14.0, width=85.0, height=30.0)
+            options = {"font": self.fonts[font]} if font else {}
+            button = tk.Button(self.root_frame, text=text, bg=bg, command=command, **options)
+        button.place(x=x, y=y, width=width, height=height)
+        return button
+    
+    def _add_button_options(self):
+        """Register BUTTON_OPTIONS (and the shared button font) once per Tk interpreter"""
+        if CustomerHome._button_options_tk is self.parent.tk:
+            return
+        option_add = self.parent.option_add
+        for pattern, value in self.BUTTON_OPTIONS:
+            option_add(pattern, value, 'widgetDefault')
+        option_add('*CustomerHome.Button.font', self.fonts["button"], 'widgetDefault')
+        CustomerHome._button_options_tk = self.parent.tk
     
     def start_online_order(self):
         """Start online ordering process by launching order.py in a new process"""
         try:
+            import subprocess
             args = [sys.executable, "-m", "app.ui.order"]
             if self.customer_id:
                 args.append(f"--customer-id={self.customer_id}")
             subprocess.Popen(args, cwd=str(PROJECT_ROOT))
             self.parent.destroy()
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to open Order window.\n\n{e}")
+            _showerror("Error", f"Failed to open Order window.\n\n{e}")
     
     def view_rewards(self):
         """View loyalty rewards"""
-        messagebox.showinfo("Loyalty Rewards", f"Your Loyalty Points: {self.loyalty_points:,}\n\nPoints can be redeemed for:\n• Free coffee drinks\n• Discounts on orders\n• Special promotions\n\nKeep ordering to earn more points!")
+        _showinfo("Loyalty Rewards", f"Your Loyalty Points: {self.loyalty_points:,}" + _REWARDS_TAIL)
     
     def find_stores(self):
         """Find nearby stores"""
-        messagebox.showinfo("Store Locator", "Store locator feature coming soon!\n\nYou'll be able to find BigBrew locations near you with directions and store hours.")
+        _showinfo("Store Locator", _STORES_MSG)
     
     def edit_profile(self):
         """Open dialog to edit customer profile."""
         if not self.customer_id:
-            messagebox.showinfo("Edit Profile", "No customer information available.")
+            _showinfo("Edit Profile", _NO_CUSTOMER_MSG)
             return
 
         latest = _load_customer_from_db(self.customer_id)
         if latest:
-            self._apply_customer_updates(latest)
+            self.update_customer(**latest)
 
         dialog = tk.Toplevel(self.parent)
         dialog.title("Edit Profile")
-        dialog.configure(bg="#FFF8E7")
+        dialog.configure(bg=_CREAM)
         dialog.resizable(False, False)
 
         try:
@@ -814,30 +756,28 @@ class CustomerHome:
         header = tk.Label(
             dialog,
             text="Update Profile",
-            font=("Poppins", 16, "bold"),
-            bg="#FFF8E7",
-            fg="#3A280F",
+            font=self.fonts["title"],
+            **_DIALOG_LABEL_KW,
         )
         header.pack(pady=(20, 10))
 
-        form_frame = tk.Frame(dialog, bg="#FFF8E7")
+        form_frame = tk.Frame(dialog, bg=_CREAM)
         form_frame.pack(fill="both", expand=True, padx=30)
 
         def add_row(row, label_text, widget):
             label = tk.Label(
                 form_frame,
                 text=label_text,
-                font=("Poppins", 10, "bold"),
+                font=self.fonts["label"],
                 anchor="w",
-                bg="#FFF8E7",
-                fg="#3A280F",
+                **_DIALOG_LABEL_KW,
             )
             label.grid(row=row, column=0, sticky="w")
             widget.grid(row=row + 1, column=0, sticky="ew", pady=(0, 12))
 
         form_frame.columnconfigure(0, weight=1)
 
-        entry_style = {"font": ("Poppins", 10), "bg": "#FFFFFF", "fg": "#000000", "relief": "solid", "borderwidth": 1}
+        entry_style = {"font": self.fonts["input"], "bg": _WHITE, "fg": _BLACK, "relief": "solid", "borderwidth": 1}
 
         first_name_var = tk.StringVar(value=self.first_name)
         first_entry = tk.Entry(form_frame, textvariable=first_name_var, **entry_style)
@@ -855,7 +795,7 @@ class CustomerHome:
         phone_entry = tk.Entry(form_frame, textvariable=phone_var, **entry_style)
         add_row(6, "Phone Number", phone_entry)
 
-        address_text = tk.Text(form_frame, height=2, wrap="word", font=("Poppins", 10), bg="#FFFFFF", fg="#000000", relief="solid", borderwidth=1)
+        address_text = tk.Text(form_frame, height=2, wrap="word", font=self.fonts["input"], bg=_WHITE, fg=_BLACK, relief="solid", borderwidth=1)
         address_text.insert("1.0", self.address or "")
         add_row(8, "Address", address_text)
 
@@ -870,15 +810,15 @@ class CustomerHome:
         info_label = tk.Label(
             form_frame,
             text="Leave password fields blank to keep your current password.",
-            font=("Poppins", 9),
-            bg="#FFF8E7",
+            font=self.fonts["hint"],
+            bg=_CREAM,
             fg="#6C6C6C",
             wraplength=340,
             justify="left",
         )
         info_label.grid(row=14, column=0, sticky="w", pady=(0, 8))
 
-        button_frame = tk.Frame(dialog, bg="#FFF8E7")
+        button_frame = tk.Frame(dialog, bg=_CREAM)
         button_frame.pack(pady=(0, 20))
 
         def close_dialog():
@@ -897,30 +837,29 @@ class CustomerHome:
             confirm_password = confirm_var.get()
 
             if not first_name:
-                messagebox.showerror("Edit Profile", "First name cannot be empty.")
+                _showerror("Edit Profile", "First name cannot be empty.")
                 return
             if not email:
-                messagebox.showerror("Edit Profile", "Email address cannot be empty.")
+                _showerror("Edit Profile", "Email address cannot be empty.")
                 return
             if not re.match(r"^[^@]+@[^@]+\.[^@]+$", email):
-                messagebox.showerror("Edit Profile", "Please enter a valid email address.")
+                _showerror("Edit Profile", "Please enter a valid email address.")
                 return
 
             if new_password or confirm_password:
                 if len(new_password) < 6:
-                    messagebox.showerror("Edit Profile", "Password must be at least 6 characters long.")
+                    _showerror("Edit Profile", "Password must be at least 6 characters long.")
                     return
                 if new_password != confirm_password:
-                    messagebox.showerror("Edit Profile", "New password and confirmation do not match.")
+                    _showerror("Edit Profile", "New password and confirmation do not match.")
                     return
 
-            duplicates = db.execute_query(
-                "SELECT customer_id FROM customers WHERE email = %s AND customer_id <> %s",
+            duplicates = db.execute_one(
+                "SELECT customer_id FROM customers WHERE email = %s AND customer_id <> %s LIMIT 1",
                 (email, self.customer_id),
-                fetch=True,
             )
             if duplicates:
-                messagebox.showerror("Edit Profile", "That email address is already registered to another account.")
+                _showerror("Edit Profile", "That email address is already registered to another account.")
                 return
 
             try:
@@ -933,10 +872,10 @@ class CustomerHome:
                     address,
                 )
                 if result is None:
-                    messagebox.showerror("Edit Profile", "Failed to update profile. Please try again.")
+                    _showerror("Edit Profile", "Failed to update profile. Please try again.")
                     return
             except Exception as exc:
-                messagebox.showerror("Edit Profile", f"Failed to update profile: {exc}")
+                _showerror("Edit Profile", f"Failed to update profile: {exc}")
                 return
 
             if new_password:
@@ -944,7 +883,7 @@ class CustomerHome:
                     hash_value = bcrypt.hashpw(new_password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
                     db.update_customer_password_hash(self.customer_id, hash_value)
                 except Exception as exc:
-                    messagebox.showerror("Edit Profile", f"Profile updated, but failed to update password: {exc}")
+                    _showerror("Edit Profile", f"Profile updated, but failed to update password: {exc}")
                     # do not return; still refresh data
 
             updated_data = {
@@ -954,19 +893,18 @@ class CustomerHome:
                 "phone": phone,
                 "address": address,
             }
-            self._apply_customer_updates(updated_data)
-            messagebox.showinfo("Edit Profile", "Profile updated successfully.")
+            self.update_customer(**updated_data)
+            _showinfo("Edit Profile", "Profile updated successfully.")
             close_dialog()
-            self.setup_ui()
 
         save_btn = tk.Button(
             button_frame,
             text="Save Changes",
-            font=("Poppins", 11, "bold"),
+            font=self.fonts["heading"],
             bg="#28A745",
-            fg="white",
+            fg=_WHITE,
             activebackground="#218838",
-            activeforeground="white",
+            activeforeground=_WHITE,
             relief="flat",
             bd=0,
             padx=20,
@@ -979,11 +917,11 @@ class CustomerHome:
         cancel_btn = tk.Button(
             button_frame,
             text="Cancel",
-            font=("Poppins", 11),
+            font=self.fonts["text"],
             bg="#6C757D",
-            fg="white",
+            fg=_WHITE,
             activebackground="#5a6268",
-            activeforeground="white",
+            activeforeground=_WHITE,
             relief="flat",
             bd=0,
             padx=20,
@@ -996,18 +934,20 @@ class CustomerHome:
     def view_order_history(self):
         """View order history"""
         if not self.customer_id:
-            messagebox.showinfo("Order History", "No customer information available.")
+            _showinfo("Order History", _NO_CUSTOMER_MSG)
             return
 
         orders = db.fetch_customer_orders(self.customer_id)
         if not orders:
-            messagebox.showinfo("Order History", "You have no recorded orders yet.\nPlace an order to see it listed here.")
+            _showinfo("Order History", _NO_ORDERS_MSG)
             return
 
+        from tkinter import ttk
+
         history_win = tk.Toplevel(self.parent)
         history_win.title("Order History")
         history_win.geometry("720x420")
-        history_win.configure(bg="#FFF8E7")
+        history_win.configure(bg=_CREAM)
 
         try:
             history_win.transient(self.parent)
@@ -1049,6 +989,8 @@ class CustomerHome:
         tree.column("date", width=200, anchor="center")
         tree.column("items", width=420, anchor="w")
 
+        item_fmt = _ITEM_FMT
+        total_fmt = _TOTAL_FMT
         for order in orders:
             sale_id = order.get("sale_id")
             items_description = ""
@@ -1056,11 +998,14 @@ class CustomerHome:
                 try:
                     sale_items = db.fetch_sale_items(sale_id)
                     if sale_items:
-                        formatted = [
-                            f"{item.get('name') or 'Item'} x{item.get('quantity', 0)} @ ₱{float(item.get('price') or 0.0):.2f}"
+                        items_description = "; ".join(
+                            item_fmt(
+                                item.get("name") or "Item",
+                                item.get("quantity", 0),
+                                _coerce_float(item.get("price")),
+                            )
                             for item in sale_items
-                        ]
-                        items_description = "; ".join(formatted)
+                        )
                 except Exception:
                     items_description = ""
 
@@ -1069,7 +1014,7 @@ class CustomerHome:
                 "end",
                 values=(
                     order.get("sale_id"),
-                    f"₱{float(order.get('total_amount') or 0.0):,.2f}",
+                    total_fmt(_coerce_float(order.get("total_amount"))),
                     order.get("payment_method", "").title(),
                     order.get("status", "pending").title(),
                     str(order.get("sale_date") or ""),
@@ -1088,9 +1033,9 @@ class CustomerHome:
         close_btn = tk.Button(
             history_win,
             text="Close",
-            font=("Poppins", 11, "bold"),
-            bg="#B96708",
-            fg="white",
+            font=self.fonts["heading"],
+            bg=_AMBER,
+            fg=_WHITE,
             relief="flat",
             width=12,
             command=close_history,
@@ -1101,17 +1046,72 @@ class CustomerHome:
     
     def logout(self):
         """Logout customer"""
-        if messagebox.askyesno("Logout", "Are you sure you want to logout?"):
+        if _askyesno("Logout", "Are you sure you want to logout?"):
             self.app.logout()
     
+    def refresh(self, customer_data):
+        """Show the pooled page for ``customer_data`` by retexting the dynamic canvas items"""
+        self._reset_customer(customer_data)
+        self._retext()
+
+        self.parent.configure(bg=_WHITE)
+        self.root_frame.place(x=0, y=0, width=1035, height=534)
+        self.root_frame.lift()
+        self.center_parent(1035, 534)
+    
+    def update_customer(self, **fields):
+        """Apply changed customer fields and retext only the affected canvas items"""
+        self._apply_customer_updates(fields)
+        self._retext()
+    
+    def _retext(self):
+        itemconfigure = self.canvas.itemconfigure
+        itemconfigure(self._welcome_item, text=self._welcome_str)
+        itemconfigure(self._member_item, text=self._member_str)
+        self._retext_account()
+    
+    def _retext_account(self):
+        itemconfigure = self.canvas.itemconfigure
+        for item, value in zip(self._account_value_items, self._account_strs):
+            itemconfigure(item, text=value)
+    
+    def update_account(self, points=None, spent=None):
+        """Queue new loyalty points / total spent; rapid calls coalesce into one redraw"""
+        if points is not None:
+            self._pending_account['loyalty_points'] = points
+        if spent is not None:
+            self._pending_account['total_spent'] = spent
+        if not self._account_flush_scheduled:
+            self._account_flush_scheduled = True
+            self.root_frame.after_idle(self._flush_account_updates)
+    
+    def _flush_account_updates(self):
+        self._account_flush_scheduled = False
+        pending, self._pending_account = self._pending_account, {}
+        if not pending or self.root_frame is None or not self.root_frame.winfo_exists():
+            return
+        self._apply_customer_updates(pending)
+        self._retext_account()
+    
     def destroy(self):
-        """Clean up the customer home window"""
-        for widget in self.parent.winfo_children():
-            widget.destroy()
+        """Hide the customer home; the widgets stay alive for the next login"""
+        root_frame = getattr(self, "root_frame", None)
+        if root_frame is not None:
+            root_frame.place_forget()
+    
+    def hard_destroy(self):
+        """Really destroy the customer home and drop it from the pool"""
+        if CustomerHome._instances.get(id(self.parent)) is self:
+            del CustomerHome._instances[id(self.parent)]
+        root_frame = getattr(self, "root_frame", None)
+        if root_frame is not None:
+            root_frame.destroy()
+            self.root_frame = None
 
 # For testing purposes
-if __name__ == "__main__":
-    cli_customer_id = _parse_customer_id(sys.argv[1:])
+def main(argv=None):
+    """Run the customer home on its own, as launched by ``python -m app.ui.home``"""
+    cli_customer_id = _parse_customer_id(sys.argv[1:] if argv is None else argv)
     customer_data = None
 
     if cli_customer_id:
@@ -1121,18 +1121,18 @@ if __name__ == "__main__":
         # Fallback sample profile for manual testing
         customer_data = {
             'customer_id': cli_customer_id or 1,
-        'customer_code': 'CUST-20241201120000',
-        'username': 'john.doe',
-        'email': 'john.doe@email.com',
-        'first_name': 'John',
-        'last_name': 'Doe',
-        'customer_type': 'regular',
-        'loyalty_points': 150,
-        'total_spent': 250.75,
+            'customer_code': 'CUST-20241201120000',
+            'username': 'john.doe',
+            'email': 'john.doe@email.com',
+            'first_name': 'John',
+            'last_name': 'Doe',
+            'customer_type': 'regular',
+            'loyalty_points': 150,
+            'total_spent': 250.75,
             'account_type': 'customer',
             'phone': '+63 912-345-6789',
             'address': '123 Coffee Street, Brew City',
-    }
+        }
     
     class MockApp:
         def __init__(self, window):
@@ -1161,6 +1161,7 @@ if __name__ == "__main__":
                 pass
 
             try:
+                import subprocess
                 subprocess.Popen([sys.executable, "-m", "main"], cwd=str(PROJECT_ROOT))
             except Exception:
                 pass
@@ -1175,9 +1176,13 @@ if __name__ == "__main__":
     root = tk.Tk()
     root.title("BigBrew Customer Home")
     root.geometry("1035x534")
-    root.configure(bg="#FFFFFF")
+    root.configure(bg=_WHITE)
     
     app = MockApp(root)
     customer_home = CustomerHome(root, customer_data, app)
     
     root.mainloop()
+
+
+if __name__ == "__main__":
+    main()
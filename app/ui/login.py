@@ -14,6 +14,7 @@ except Exception:
     CRYPTO_AVAILABLE = False
 from tkinter import Canvas, Entry, Button, PhotoImage
 import hashlib
+from datetime import datetime
 import bcrypt
 from app.db.connection import db
 import sys
@@ -315,10 +316,19 @@ class LoginWindow:
             except Exception:
                 pass
             # Update last login based on account type
+            # Formatted once here so dashboards never re-run strftime
+            last_login = user.get('last_login')
+            if isinstance(last_login, datetime):
+                user['last_login_str'] = last_login.strftime("%Y-%m-%d %H:%M:%S")
+            else:
+                user['last_login_str'] = str(last_login or 'Never')
+
+            # (folds any pending bcrypt upgrade into the same UPDATE)
+            new_hash = user.pop('new_password_hash', None)
             if user.get('account_type') == 'staff':
-                db.update_last_login(user['user_id'])
+                db.update_last_login(user['user_id'], new_hash)
             elif user.get('account_type') == 'customer':
-                db.update_customer_last_login(user['customer_id'])
+                db.update_customer_last_login(user['customer_id'], new_hash)
             
             self.app.show_dashboard(user)
         else:
@@ -507,10 +517,9 @@ class LoginWindow:
                 sha256_hex = hashlib.sha256(entered_bytes).hexdigest()
 
                 if stored.lower() == sha256_hex.lower() or stored == password:
-                    # Auto-upgrade to bcrypt
+                    # Auto-upgrade to bcrypt; persisted with the last-login update
                     try:
-                        new_hash = bcrypt.hashpw(entered_bytes, bcrypt.gensalt()).decode('utf-8')
-                        db.update_password_hash(user['user_id'], new_hash)
+                        user['new_password_hash'] = bcrypt.hashpw(entered_bytes, bcrypt.gensalt()).decode('utf-8')
                     except Exception:
                         pass
                     user['account_type'] = 'staff'
@@ -522,11 +531,8 @@ class LoginWindow:
     def authenticate_customer(self, username, password):
         """Authenticate customer from customers table"""
         try:
-            # Try username first, then email
-            customer = db.get_customer_by_username(username)
-            if not customer:
-                # If not found by username, try email
-                customer = db.get_customer_by_email(username)
+            # Username match wins over email match, resolved in one query
+            customer = db.get_customer_by_login(username)
             if not customer:
                 return None
             if not customer['is_active']:
@@ -557,10 +563,9 @@ class LoginWindow:
                 sha256_hex = hashlib.sha256(entered_bytes).hexdigest()
 
                 if stored.lower() == sha256_hex.lower() or stored == password:
-                    # Auto-upgrade to bcrypt
+                    # Auto-upgrade to bcrypt; persisted with the last-login update
                     try:
-                        new_hash = bcrypt.hashpw(entered_bytes, bcrypt.gensalt()).decode('utf-8')
-                        db.update_customer_password_hash(customer['customer_id'], new_hash)
+                        customer['new_password_hash'] = bcrypt.hashpw(entered_bytes, bcrypt.gensalt()).decode('utf-8')
                     except Exception:
                         pass
                     customer['account_type'] = 'customer'
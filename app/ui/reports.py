@@ -1,20 +1,53 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
+from contextlib import closing
 from datetime import datetime, timedelta
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from app.db.connection import DatabaseConfig
-import json
+import time
+
+_MATPLOTLIB = None
+
+# Customer segmentation scans the whole customers table but changes slowly,
+# so the result is reused across refreshes for this many seconds.
+SEGMENTS_CACHE_TTL = 60.0
+
+SEGMENTS_QUERY = """
+SELECT 
+    CASE 
+        WHEN total_spent >= 500 THEN 'VIP'
+        WHEN total_spent >= 200 THEN 'Regular'
+        ELSE 'Occasional'
+    END as segment,
+    COUNT(*) as customer_count
+FROM customers
+GROUP BY segment
+"""
+
+
+def _load_matplotlib():
+    """Import matplotlib on first use so it is not paid for at app startup."""
+    global _MATPLOTLIB
+    if _MATPLOTLIB is None:
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        _MATPLOTLIB = (Figure, FigureCanvasTkAgg)
+    return _MATPLOTLIB
+
 
 class ReportsAnalytics:
+    # (fetched_at, rows) shared by every Reports window in the process
+    _segments_cache = (0.0, None)
+
     def __init__(self, parent_window):
+        # Deferred so the MySQL driver loads only when reports are opened
+        from app.db.connection import db
+
         self.parent = parent_window
         self.window = tk.Toplevel(self.parent)
         self.window.title("BigBrew - Reports & Analytics")
         self.window.geometry("1200x800")
         
-        # Database connection
-        self.db = DatabaseConfig()
+        # Database connection (the process-wide instance and its pool)
+        self.db = db
         
         # Color scheme matching the main app
         self.bg_color = "#4A3728"  # Dark brown
@@ -24,6 +57,7 @@ class ReportsAnalytics:
         self.button_color = "#D2691E"  # Coffee brown
         
         self.window.configure(bg=self.bg_color)
+        self._refresh_after_id = None
         self.setup_ui()
         
         # Center window
@@ -84,6 +118,7 @@ class ReportsAnalytics:
         
     def create_notebook(self):
         """Create tabbed interface for different reports"""
+        self.Figure, self.FigureCanvasTkAgg = _load_matplotlib()
         self.notebook = ttk.Notebook(self.window)
         self.notebook.pack(fill='both', expand=True, padx=20, pady=10)
         
@@ -142,8 +177,8 @@ class ReportsAnalytics:
         graph_frame = tk.Frame(parent, bg=self.card_bg)
         graph_frame.pack(fill='both', expand=True, padx=10, pady=10)
         
-        self.sales_figure = plt.Figure(figsize=(10, 4))
-        self.sales_canvas = FigureCanvasTkAgg(self.sales_figure, graph_frame)
+        self.sales_figure = self.Figure(figsize=(10, 4))
+        self.sales_canvas = self.FigureCanvasTkAgg(self.sales_figure, graph_frame)
         self.sales_canvas.get_tk_widget().pack(fill='both', expand=True)
         
         # Product table
@@ -203,16 +238,16 @@ class ReportsAnalytics:
         segments_frame = tk.Frame(parent, bg=self.card_bg)
         segments_frame.pack(fill='both', expand=True, padx=10, pady=10)
         
-        self.segments_figure = plt.Figure(figsize=(6, 4))
-        self.segments_canvas = FigureCanvasTkAgg(self.segments_figure, segments_frame)
+        self.segments_figure = self.Figure(figsize=(6, 4))
+        self.segments_canvas = self.FigureCanvasTkAgg(self.segments_figure, segments_frame)
         self.segments_canvas.get_tk_widget().pack(side='left', fill='both', expand=True)
         
         # Customer visit frequency graph
         frequency_frame = tk.Frame(parent, bg=self.card_bg)
         frequency_frame.pack(fill='both', expand=True, padx=10, pady=10)
         
-        self.frequency_figure = plt.Figure(figsize=(6, 4))
-        self.frequency_canvas = FigureCanvasTkAgg(self.frequency_figure, frequency_frame)
+        self.frequency_figure = self.Figure(figsize=(6, 4))
+        self.frequency_canvas = self.FigureCanvasTkAgg(self.frequency_figure, frequency_frame)
         self.frequency_canvas.get_tk_widget().pack(side='right', fill='both', expand=True)
         
     def setup_inventory_tab(self, parent):
@@ -255,8 +290,8 @@ class ReportsAnalytics:
         levels_frame = tk.Frame(parent, bg=self.card_bg)
         levels_frame.pack(fill='both', expand=True, padx=10, pady=10)
         
-        self.inventory_figure = plt.Figure(figsize=(10, 4))
-        self.inventory_canvas = FigureCanvasTkAgg(self.inventory_figure, levels_frame)
+        self.inventory_figure = self.Figure(figsize=(10, 4))
+        self.inventory_canvas = self.FigureCanvasTkAgg(self.inventory_figure, levels_frame)
         self.inventory_canvas.get_tk_widget().pack(fill='both', expand=True)
         
         # Low stock alerts table
@@ -282,10 +317,16 @@ class ReportsAnalytics:
         if period == "Custom":
             # TODO: Show date picker dialog
             pass
-        self.refresh_reports()
+        # Debounce so quickly cycling through periods triggers one refresh
+        if self._refresh_after_id:
+            self.window.after_cancel(self._refresh_after_id)
+        self._refresh_after_id = self.window.after(250, self.refresh_reports)
         
     def refresh_reports(self):
         """Refresh all reports with current date range"""
+        if self._refresh_after_id:
+            self.window.after_cancel(self._refresh_after_id)
+            self._refresh_after_id = None
         self.update_sales_reports()
         self.update_customer_analytics()
         self.update_inventory_analytics()
@@ -364,10 +405,10 @@ class ReportsAnalytics:
             ORDER BY total_revenue DESC
             """
             
-            products = self.db.execute_query(product_query, (start_date, end_date), fetch=True)
-            
             self.product_table.delete(*self.product_table.get_children())
-            if products:
+            # Rows go straight from the unbuffered cursor into the table; closing()
+            # hands the connection back even if a row fails to format
+            with closing(self.db.stream(product_query, (start_date, end_date))) as products:
                 for product in products:
                     self.product_table.insert('', 'end', values=(
                         product['product_name'],
@@ -381,19 +422,7 @@ class ReportsAnalytics:
         start_date, end_date = self.get_date_range()
         
         # Get customer segments data
-        segments_query = """
-        SELECT 
-            CASE 
-                WHEN total_spent >= 500 THEN 'VIP'
-                WHEN total_spent >= 200 THEN 'Regular'
-                ELSE 'Occasional'
-            END as segment,
-            COUNT(*) as customer_count
-        FROM customers
-        GROUP BY segment
-        """
-        
-        segments = self.db.execute_query(segments_query, None, fetch=True)
+        segments = self._get_segments()
         
         if segments:
             # Update segments pie chart
@@ -436,6 +465,18 @@ class ReportsAnalytics:
             self.frequency_figure.tight_layout()
             self.frequency_canvas.draw()
             
+    def _get_segments(self):
+        """Return customer segment counts, cached for SEGMENTS_CACHE_TTL seconds"""
+        fetched_at, rows = ReportsAnalytics._segments_cache
+        now = time.monotonic()
+        if rows is not None and now - fetched_at < SEGMENTS_CACHE_TTL:
+            return rows
+
+        rows = self.db.execute_query(SEGMENTS_QUERY, None, fetch=True)
+        if rows:
+            ReportsAnalytics._segments_cache = (now, rows)
+        return rows
+            
     def update_inventory_analytics(self):
         """Update inventory analytics with current data"""
         # Get current inventory levels
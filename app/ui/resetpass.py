@@ -3,6 +3,7 @@
 
 from pathlib import Path
 from tkinter import Tk, Canvas, Entry, Button, PhotoImage, messagebox
+from app.db.connection import db
 from app.services.utils import UtilityFunctions
 import mysql.connector
 import sys
@@ -328,17 +329,10 @@ class PasswordResetWindow:
             # Hash the new password
             hashed_password = UtilityFunctions.hash_password(new_password)
             
-            # Update the customer's password
-            cursor.execute(
-                "UPDATE customers SET password_hash = %s, updated_at = NOW() WHERE email = %s",
-                (hashed_password, self.user_email)
-            )
-            
-            if cursor.rowcount == 0:
+            # Update the customer's password through db so its cached login row is dropped
+            if not db.update_customer_password_hash(customer['customer_id'], hashed_password):
                 messagebox.showerror("Error", "Failed to reset password. Please try again.")
                 return
-                
-            db_connection.commit()
             
             # Show success message with customer details
             success_message = f"""
@@ -203,6 +203,19 @@ class BigBrewApp:
         self.current_module = LoginWindow(self.root, self)
         self.current_module.run()
 
+        # Decode customer home images while the user is typing credentials
+        self.root.after_idle(self.prewarm_customer_home)
+
+    def prewarm_customer_home(self):
+        """Load the customer home images and fonts ahead of a customer login"""
+        try:
+            from app.ui.home import CustomerHome
+            CustomerHome.prewarm_fonts(self.root)
+            CustomerHome.prewarm_images(self.root)
+        except Exception as e:
+            if APP_CONFIG['debug']:
+                print(f"Could not prewarm customer home images: {e}")
+
     def show_signup(self):
         """Show signup window (same size as login)"""
         self.clear_window()
@@ -255,7 +268,7 @@ class BigBrewApp:
         # Create customer home
         try:
             from app.ui.home import CustomerHome
-            self.current_module = CustomerHome(self.root, customer_data, self)
+            self.current_module = CustomerHome.acquire(self.root, customer_data, self)
         except ImportError as e:
             messagebox.showerror("Error", f"Customer home module not available: {str(e)}")
         except Exception as e:
@@ -279,26 +292,8 @@ class BigBrewApp:
     def show_admin_dashboard(self):
         """Show admin dashboard"""
         print("Showing admin dashboard...")  # Debug
-        self.clear_window()
-
-        # Resize window for admin dashboard
-        self.root.geometry("1270x790")
-        self.center_window(1270, 790)
-        self.root.minsize(1270, 790)
-        self.root.resizable(False, False)
-
-        # Give time for window to resize
-        self.root.update_idletasks()
-        self.root.update()
-
-        # Create admin dashboard
-        try:
-            from app.ui.admin_dashboard import AdminDashboard
-            dashboard = AdminDashboard(self.current_user, self)
-            dashboard.show()
-        except ImportError:
-            messagebox.showinfo("Info", "Admin dashboard module not available")
-            self.show_dashboard(self.current_user)
+        # Same path as the other staff roles, so a withdrawn admin dashboard is reused
+        self.show_dashboard(self.current_user)
 
     def logout(self):
         """Handle user logout properly"""
@@ -371,6 +366,9 @@ class BigBrewApp:
         """Clear all widgets from the window"""
         print("Clearing window...")  # Debug
         for widget in self.root.winfo_children():
+            # Withdrawn dashboards are kept for reuse on the next login
+            if getattr(widget, 'keep_alive', False):
+                continue
             try:
                 widget.destroy()
             except Exception as e:
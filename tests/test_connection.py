@@ -0,0 +1,157 @@
+"""
+Tests for the prepared-statement and streaming paths in ``app.db.connection``.
+"""
+
+import unittest
+from unittest import mock
+
+from mysql.connector import errors
+
+from app.db.connection import DatabaseConfig
+
+
+class _FakeCursor:
+    def __init__(self, fail):
+        self.fail = fail
+        self.column_names = ("user_id", "username")
+
+    def execute(self, query, params):
+        if self.fail:
+            raise errors.DatabaseError(msg="Unknown prepared statement handler", errno=1243)
+
+    def fetchall(self):
+        return [(1, "admin")]
+
+
+class _FakeRawConnection:
+    def __init__(self, fail_first):
+        self.fail_next = fail_first
+        self.prepared = 0
+
+    def cursor(self, prepared=False):
+        self.prepared += 1
+        fail, self.fail_next = self.fail_next, False
+        return _FakeCursor(fail)
+
+
+class _FakePooledConnection:
+    def __init__(self, raw):
+        self._cnx = raw
+        self.closed = False
+
+    def cursor(self, prepared=False):
+        return self._cnx.cursor(prepared=prepared)
+
+    def close(self):
+        self.closed = True
+
+
+class _FakePool:
+    """Hands out the same underlying connection on every checkout, like a small pool."""
+
+    def __init__(self, raw):
+        self.raw = raw
+        self.checkouts = []
+
+    def get_connection(self):
+        connection = _FakePooledConnection(self.raw)
+        self.checkouts.append(connection)
+        return connection
+
+
+class ExecutePreparedTests(unittest.TestCase):
+    def setUp(self):
+        self.db = DatabaseConfig()
+
+    def _run(self, raw):
+        pool = _FakePool(raw)
+        with mock.patch.object(DatabaseConfig, "_get_prepared_pool", return_value=pool):
+            result = self.db.execute_prepared("SELECT 1 WHERE %s", ("admin",), fetch=True)
+        return result, pool
+
+    def test_dropped_statement_is_prepared_again(self):
+        raw = _FakeRawConnection(fail_first=True)
+        result, pool = self._run(raw)
+
+        self.assertEqual(result, [{"user_id": 1, "username": "admin"}])
+        self.assertEqual(raw.prepared, 2)
+        self.assertEqual(len(pool.checkouts), 2)
+        self.assertTrue(all(connection.closed for connection in pool.checkouts))
+
+    def test_prepared_cursor_is_reused(self):
+        raw = _FakeRawConnection(fail_first=False)
+        self._run(raw)
+        self._run(raw)
+
+        self.assertEqual(raw.prepared, 1)
+
+    def test_second_failure_returns_none(self):
+        raw = _FakeRawConnection(fail_first=True)
+        with mock.patch.object(_FakeCursor, "execute", side_effect=errors.DatabaseError("gone")):
+            result, pool = self._run(raw)
+
+        self.assertIsNone(result)
+        self.assertEqual(len(pool.checkouts), 2)
+        self.assertNotIn(raw, self.db._prepared)
+
+
+class _FakeStreamCursor:
+    def __init__(self, rows):
+        self.rows = rows
+        self.closed = False
+
+    def execute(self, query, params=None):
+        pass
+
+    def __iter__(self):
+        return iter(self.rows)
+
+    def close(self):
+        self.closed = True
+
+
+class _FakeStreamConnection:
+    def __init__(self, rows):
+        self.stream_cursor = _FakeStreamCursor(rows)
+        self.consumed = False
+        self.closed = False
+
+    def cursor(self, dictionary=False, buffered=None):
+        return self.stream_cursor
+
+    def consume_results(self):
+        self.consumed = True
+
+    def close(self):
+        self.closed = True
+
+
+class StreamTests(unittest.TestCase):
+    def setUp(self):
+        self.db = DatabaseConfig()
+        self.connection = _FakeStreamConnection([{"n": 1}, {"n": 2}, {"n": 3}])
+        patcher = mock.patch.object(DatabaseConfig, "get_connection", return_value=self.connection)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_yields_every_row_and_releases_connection(self):
+        rows = list(self.db.stream("SELECT n FROM t"))
+
+        self.assertEqual(rows, [{"n": 1}, {"n": 2}, {"n": 3}])
+        self.assertTrue(self.connection.stream_cursor.closed)
+        self.assertTrue(self.connection.closed)
+
+    def test_early_close_drains_and_releases_connection(self):
+        rows = self.db.stream("SELECT n FROM t")
+        self.assertEqual(next(rows), {"n": 1})
+        self.assertFalse(self.connection.closed)
+
+        rows.close()
+
+        self.assertTrue(self.connection.consumed)
+        self.assertTrue(self.connection.stream_cursor.closed)
+        self.assertTrue(self.connection.closed)
+
+
+if __name__ == "__main__":
+    unittest.main()